@@ -0,0 +1,81 @@
+"""
+Responsiveness of the event loop while a push of large commit messages
+is linted, by calling the parser on the loop and by `lint_stream` with
+threads and with worker processes. The lag is how late a task that
+wakes up every millisecond is woken.
+
+Run with
+
+    python benchmarks/aio.py
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+
+from pycolint.aio import lint_stream
+from pycolint.parser import create_parser
+
+NUM_MESSAGES = 100
+
+
+def make_message(words: int = 2_000) -> str:
+    # the dot at the end keeps the message from taking the fast path
+    return "feat(api): add an endpoint\n\n" + "word " * words + "end."
+
+
+async def push(messages: list[str]) -> AsyncIterator[str]:
+    for m in messages:
+        yield m
+
+
+async def max_lag(work: Callable[[], Awaitable[object]]) -> tuple[float, float]:
+    """Time `work` takes and the largest lag of a 1 ms ticker meanwhile."""
+    lag = 0.0
+    done = False
+
+    async def tick() -> None:
+        nonlocal lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lag = max(lag, time.perf_counter() - start - 0.001)
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker
+    return elapsed, lag
+
+
+async def main() -> None:
+    messages = [make_message()] * NUM_MESSAGES
+    parse = create_parser()
+
+    async def on_loop() -> None:
+        for m in messages:
+            parse(m)
+
+    async def stream(executor=None) -> None:
+        async for _ in lint_stream(push(messages), executor):
+            pass
+
+    print(f"{'':<10} {'total ms':>10} {'max lag ms':>11}")
+    with ProcessPoolExecutor() as processes:
+        # start the workers
+        await stream(processes)
+        for name, work in (
+            ("on loop", on_loop),
+            ("threads", stream),
+            ("processes", lambda: stream(processes)),
+        ):
+            elapsed, lag = await max_lag(work)
+            print(f"{name:<10} {elapsed * 1e3:>10.1f} {lag * 1e3:>11.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+"""
+Parse time of squash-merge like messages with bodies of up to 20k words.
+
+Messages are parsed while they are tokenized, so the parser stops
+reading at the first problem it can not recover from, and unless a
+check reads the body it stops after the first word of the body.
+Tokenizing the complete message, what `parse` did before, and parsing
+with `check_body` are shown for comparison. The grammar only accepts
+bodies of a single paragraph, so the words of the body are one line and
+parsing with `check_body` reads all of them.
+
+Run with
+
+    python benchmarks/bodies.py
+"""
+
+import time
+from collections.abc import Callable
+
+from pycolint.parser import create_parser
+from pycolint.tokenizer import tokenize
+
+WORDS = (10, 1_000, 20_000)
+HEADERS = ("feat(api): squash merge", "feat(api): squash merge.")
+
+
+def make_message(header: str, words: int) -> str:
+    body = " ".join(f"change{i}" for i in range(words))
+    return f"{header}\n\n{body}"
+
+
+def best_time(fn: Callable[[], object], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parse_body = create_parser(check_body=True)
+    parse = create_parser()
+    print(f"{'header':<26} {'words':>6} {'tokenize':>10} {'body':>10} {'parse':>10}")
+    for header in HEADERS:
+        for words in WORDS:
+            msg = make_message(header, words)
+            times = [
+                best_time(lambda fn=fn, msg=msg: fn(msg)) * 1e3
+                for fn in (tokenize, parse_body, parse)
+            ]
+            print(
+                f"{header!r:<26} {words:>6}" + "".join(f" {t:>7.3f} ms" for t in times)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Reproducible synthetic commit messages for the benchmarks.
+
+Every generator takes a `random.Random` and the number of messages,
+so the same seed always yields the same corpus.
+"""
+
+import random
+from collections.abc import Callable
+
+TYPES = ("feat", "fix", "docs", "perf", "build", "chore", "ci", "refactor", "style")
+SCOPES = ("parser", "tokenizer", "cli", "api", "deps", "core")
+WORDS = (
+    "add",
+    "remove",
+    "handle",
+    "support",
+    "empty",
+    "scopes",
+    "large",
+    "bodies",
+    "for",
+    "the",
+    "new",
+    "parser",
+    "option",
+    "cache",
+)
+
+Generator = Callable[[random.Random, int], list[str]]
+
+
+def _words(rnd: random.Random, lo: int = 1, hi: int = 8) -> str:
+    return " ".join(rnd.choices(WORDS, k=rnd.randint(lo, hi)))
+
+
+def _header(rnd: random.Random) -> str:
+    scope = f"({rnd.choice(SCOPES)})" if rnd.random() < 0.5 else ""
+    excl = "!" if rnd.random() < 0.1 else ""
+    return f"{rnd.choice(TYPES)}{scope}{excl}: {_words(rnd)}"
+
+
+def valid_headers(rnd: random.Random, n: int) -> list[str]:
+    return [_header(rnd) for _ in range(n)]
+
+
+def valid_with_body(rnd: random.Random, n: int) -> list[str]:
+    return [f"{_header(rnd)}\n\n{_words(rnd, 5, 30)}" for _ in range(n)]
+
+
+def _problem(fn: Callable[[random.Random], str]) -> Generator:
+    def generate(rnd: random.Random, n: int) -> list[str]:
+        return [fn(rnd) for _ in range(n)]
+
+    return generate
+
+
+PROBLEMS: dict[str, Generator] = {
+    "empty_hdr": _problem(lambda rnd: ""),
+    "invalid_type": _problem(lambda rnd: f"{rnd.choice(TYPES)} : {_words(rnd)}"),
+    "whitespace_after_colon": _problem(
+        lambda rnd: f"{rnd.choice(TYPES)}:  {_words(rnd)}"
+    ),
+    "unopened_scope": _problem(
+        lambda rnd: f"{rnd.choice(TYPES)}{rnd.choice(SCOPES)}): {_words(rnd)}"
+    ),
+    "unclosed_scope": _problem(
+        lambda rnd: f"{rnd.choice(TYPES)}({rnd.choice(SCOPES)}: {_words(rnd)}"
+    ),
+    "missing_description": _problem(lambda rnd: f"{rnd.choice(TYPES)}: "),
+    "hdr_ends_in_dot": _problem(lambda rnd: f"{_header(rnd)}."),
+    "empty_body": _problem(lambda rnd: f"{_header(rnd)}\n"),
+    "error": _problem(lambda rnd: f"{_header(rnd)}\n\n{_words(rnd)}\n{_words(rnd)}"),
+}
+
+
+def huge_bodies(rnd: random.Random, n: int) -> list[str]:
+    return [f"{_header(rnd)}\n\n{_words(rnd, 2000, 4000)}" for _ in range(n)]
+
+
+def pathological_whitespace(rnd: random.Random, n: int) -> list[str]:
+    def msg() -> str:
+        gaps = [" " * rnd.randint(1, 50) + "\t" * rnd.randint(0, 5) for _ in WORDS]
+        return rnd.choice(TYPES) + ":" + "".join(g + w for g, w in zip(gaps, WORDS))
+
+    return [msg() for _ in range(n)]
+
+
+CORPORA: dict[str, tuple[Generator, int]] = {
+    "valid_headers": (valid_headers, 2000),
+    "valid_with_body": (valid_with_body, 1000),
+    **{f"problem_{name}": (gen, 300) for name, gen in PROBLEMS.items()},
+    "huge_bodies": (huge_bodies, 5),
+    "pathological_whitespace": (pathological_whitespace, 300),
+}
+
+
+def generate(name: str, seed: int = 0) -> list[str]:
+    gen, n = CORPORA[name]
+    return gen(random.Random(f"{name}-{seed}"), n)
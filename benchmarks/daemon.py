@@ -0,0 +1,70 @@
+"""
+Latency of a commit-msg hook with and without a running daemon.
+
+Each run starts a new interpreter, like git does for a hook, and
+lints a single message with `pycolint` or with `pycolint.client`
+talking to a daemon started by this script.
+
+Run with
+
+    python benchmarks/daemon.py [NUM_RUNS]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+MESSAGES = ["feat(parser): handle empty scopes", "fix: keep the daemon running"]
+
+
+def hook_latency(cmd: list[str], runs: int) -> list[float]:
+    times = []
+    for i in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [*cmd, MESSAGES[i % len(MESSAGES)]], stderr=subprocess.DEVNULL, check=True
+        )
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(name: str, times: list[float]) -> None:
+    print(
+        f"{name:<28} median {statistics.median(times) * 1e3:7.1f} ms"
+        f"  min {min(times) * 1e3:7.1f} ms"
+    )
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    python = sys.executable
+    socket_path = os.path.join(tempfile.mkdtemp(), "pycolint.sock")
+    report("startup only", hook_latency([python, "-c", "pass"], runs))
+    report("pycolint", hook_latency([python, "-m", "pycolint.main"], runs))
+    report(
+        "client, no daemon",
+        hook_latency([python, "-m", "pycolint.client", "--socket", socket_path], runs),
+    )
+    daemon = subprocess.Popen(
+        [python, "-m", "pycolint.main", "--daemon", "--socket", socket_path],
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while not os.path.exists(socket_path):
+            time.sleep(0.01)
+        report(
+            "client with daemon",
+            hook_latency(
+                [python, "-m", "pycolint.client", "--socket", socket_path], runs
+            ),
+        )
+    finally:
+        daemon.terminate()
+        daemon.wait()
+
+
+if __name__ == "__main__":
+    main()
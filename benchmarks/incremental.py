@@ -0,0 +1,57 @@
+"""
+Latency of re-linting a message after a keystroke, with a new parser
+per keystroke, with one parser for all keystrokes and with a `Session`
+that continues from the edited line.
+
+Run with
+
+    python benchmarks/incremental.py
+"""
+
+import time
+from collections.abc import Callable
+
+from pycolint.incremental import Session
+from pycolint.parser import create_parser
+
+LINES = (10, 1_000)
+
+
+def make_message(lines: int) -> str:
+    body = "".join(f"change number {i} of the body\n" for i in range(lines))
+    return f"feat(api): add an endpoint\n\n{body}"
+
+
+def mean_time(fn: Callable[[], object], repeat: int = 1_000) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parse = create_parser()
+    print(
+        f"{'edit':<8} {'lines':>6} {'new parser':>13} {'same parser':>13}"
+        f" {'session':>13}"
+    )
+    for lines in LINES:
+        msg = make_message(lines)
+        for name, offset in (("header", 3), ("body", len(msg) // 2)):
+            session = Session(msg)
+            text = msg[:offset] + "x" + msg[offset + 1 :]
+            times = [
+                mean_time(fn) * 1e6
+                for fn in (
+                    lambda text=text: create_parser()(text),
+                    lambda text=text: parse(text),
+                    lambda session=session, offset=offset: session.edit(
+                        offset, offset + 1, "x"
+                    ),
+                )
+            ]
+            print(f"{name:<8} {lines:>6}" + "".join(f" {t:>10.1f} us" for t in times))
+
+
+if __name__ == "__main__":
+    main()
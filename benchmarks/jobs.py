@@ -0,0 +1,49 @@
+"""
+Throughput of `lint_many` for 1 up to all CPUs on a synthetic corpus.
+
+Run with
+
+    python benchmarks/jobs.py [NUM_MESSAGES]
+"""
+
+import os
+import random
+import sys
+import time
+
+from pycolint.batch import lint_many
+
+HEADERS = [
+    "feat: add a new feature",
+    "fix(parser): handle empty scopes",
+    "feat(api)!: drop the old endpoints",
+    "docs: describe the options\n\nThe body explains the change",
+    "feat : msg",
+    "feat(s: descr",
+    "chore:  too much whitespace",
+    "Merge branch 'main' into feature",
+]
+
+
+def corpus(n: int) -> list[str]:
+    rnd = random.Random(0)
+    return [f"{rnd.choice(HEADERS)} {i}" for i in range(n)]
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    messages = corpus(n)
+    cpus = os.cpu_count() or 1
+    jobs = sorted({1, *range(2, cpus + 1, 2), cpus})
+    base = None
+    for j in jobs:
+        start = time.perf_counter()
+        for _ in lint_many(messages, jobs=j, chunk_size=512):
+            pass
+        rate = n / (time.perf_counter() - start)
+        base = base or rate
+        print(f"{j:>3} jobs: {rate:10.0f} msgs/s, speedup {rate / base:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Compare matching rules with matchers that are rebuilt on every match
+attempt (how `Parser.matches` used to work) against the matchers each
+`Rule` now builds once.
+
+Dispatchers created by `functools.singledispatch` reference themselves,
+so every rebuilt matcher leaves garbage for the cyclic collector. The
+number of objects the collector has to free per token is reported next
+to the time per token.
+
+Run with
+
+    python benchmarks/matchers.py
+"""
+
+import gc
+import time
+from functools import singledispatch
+
+from pycolint.parser import Expression, ExpressionType, Rule, create_grammar
+from pycolint.tokenizer import Kind as T, Token, tokenize
+
+CORPUS = [
+    "feat: add a new feature",
+    "fix(parser): handle empty scopes",
+    "feat(api)!: drop support for python 3.9",
+    "docs: describe the new options\n\nThe body explains the change",
+    "feat : msg",
+    "feat(s: descr",
+    "chore:  too much whitespace",
+] * 5
+
+
+def legacy_create_matcher(left):
+    if left is None:
+        return lambda right: True
+
+    @singledispatch
+    def m(right):
+        pass
+
+    if isinstance(left, ExpressionType):
+
+        @m.register
+        def _(right: Expression):
+            return left == right.type
+
+        @m.register
+        def _(right: ExpressionType):
+            return left == right
+
+    elif isinstance(left, T):
+
+        @m.register
+        def _(right: Token):
+            return left == right.kind
+
+        @m.register
+        def _(right: T):
+            return left == right
+
+    @m.register
+    def _(right: object):
+        return False
+
+    return m
+
+
+def legacy_matches(rule: Rule, top, current) -> bool:
+    match_top_of_stack = legacy_create_matcher(rule.top_of_stack)
+    match_current_token = legacy_create_matcher(rule.current_token)
+    return match_top_of_stack(top) and match_current_token(current)
+
+
+def prebuilt_matches(rule: Rule, top, current) -> bool:
+    return rule.match_top_of_stack(top) and rule.match_current_token(current)
+
+
+def measure(matches, rules: list[Rule], tokens: list[Token]) -> tuple[float, int]:
+    top = Expression(ExpressionType.TYPE, [])
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for t in tokens:
+            for r in rules:
+                matches(r, top, t)
+        duration = time.perf_counter() - start
+        garbage = gc.collect()
+    finally:
+        gc.enable()
+    return duration, garbage
+
+
+def main() -> None:
+    rules = list(create_grammar().rules)
+    tokens = [t for msg in CORPUS for t in tokenize(msg)]
+    print(f"{len(rules)} rules, {len(tokens)} tokens, every rule tried per token")
+    for name, matches in (("legacy", legacy_matches), ("prebuilt", prebuilt_matches)):
+        duration, garbage = measure(matches, rules, tokens)
+        print(
+            f"{name:>9}: {duration / len(tokens) * 1e6:9.2f} us/token,"
+            f" {garbage / len(tokens):9.1f} garbage objects/token"
+        )
+
+
+if __name__ == "__main__":
+    main()
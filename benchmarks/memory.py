@@ -0,0 +1,84 @@
+"""
+Memory held per token and per problem, including the lists holding
+them, on the synthetic corpora of `corpus.py`. Compares dataclasses
+with an instance `__dict__`, as `Token` and `Problem` were before, to
+the current slotted ones, with and without interning.
+
+Run with
+
+    python benchmarks/memory.py
+"""
+
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from corpus import CORPORA, generate
+
+from pycolint.parser import create_parser
+from pycolint.problem_types import ProblemType
+from pycolint.tokenizer import Kind, Token, Tokenizer
+
+
+@dataclass(frozen=True, eq=True)
+class DictToken:
+    kind: Kind
+    value: str
+    column: int
+    line: int
+
+
+@dataclass(frozen=True)
+class DictProblem:
+    type: ProblemType
+    token: DictToken
+
+
+def corpus() -> list[str]:
+    return [m for name in CORPORA if name != "huge_bodies" for m in generate(name)]
+
+
+def retained(build: Callable[[], list]) -> tuple[int, int]:
+    """Bytes held by the result of `build` and its number of items."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, sum(len(r) for r in result)
+
+
+def main() -> None:
+    messages = corpus()
+    plain = Tokenizer()
+    interned = Tokenizer(intern=True)
+
+    def dict_token(t: Token) -> DictToken:
+        return DictToken(t.kind, t.value, t.column, t.line)
+
+    def dict_tokens() -> list:
+        return [[dict_token(t) for t in plain.iter_tokens(m)] for m in messages]
+
+    parse = create_parser()
+    parse_interned = create_parser(intern=True)
+
+    def dict_problems() -> list:
+        return [
+            [DictProblem(p.type, dict_token(p.token)) for p in parse(m)]
+            for m in messages
+        ]
+
+    print(f"{len(messages)} messages")
+    for name, build in (
+        ("tokens, dict", dict_tokens),
+        ("tokens, slots", lambda: [plain(m) for m in messages]),
+        ("tokens, slots + intern", lambda: [interned(m) for m in messages]),
+        ("problems, dict", dict_problems),
+        ("problems, slots", lambda: [parse(m) for m in messages]),
+        ("problems, slots + intern", lambda: [parse_interned(m) for m in messages]),
+    ):
+        size, count = retained(build)
+        print(f"{name:<26} {count:>8} items {size / count:8.1f} bytes/item")
+
+
+if __name__ == "__main__":
+    main()
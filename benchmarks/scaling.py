@@ -0,0 +1,49 @@
+"""
+Measure how parse time grows with the size of the commit message.
+
+Messages consist of a valid header followed by a single line body of
+words, so the parser has to walk every token. For linear behaviour the
+time per kilobyte has to stay (roughly) constant from 1 kB up to 1 MB.
+
+Run with
+
+    python benchmarks/scaling.py
+"""
+
+import time
+
+from pycolint.parser import create_parser
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def make_message(size: int) -> str:
+    header = "feat(parser): parse huge bodies\n\n"
+    word = "lorem "
+    return header + word * ((size - len(header)) // len(word))
+
+
+def time_parse(msg: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        parse = create_parser()
+        start = time.perf_counter()
+        parse(msg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    per_kb = []
+    for size in SIZES:
+        msg = make_message(size)
+        duration = time_parse(msg, repeat=max(1, 1_000_000 // size // 10))
+        per_kb.append(duration / len(msg) * 1000)
+        print(
+            f"{len(msg):>9} B: {duration * 1000:10.2f} ms, {per_kb[-1] * 1e6:8.2f} us/kB"
+        )
+    print(f"cost per kB grew by a factor of {per_kb[-1] / per_kb[0]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark tokenizer, parser and renderer (full and summary) on the
+synthetic corpora of `corpus.py` and compare the results against a
+saved baseline.
+
+    python benchmarks/suite.py run [--output results.json]
+    python benchmarks/suite.py compare baseline.json [--threshold 0.1]
+
+`compare` runs the suite again and exits with 1 if any measurement got
+slower than the baseline by more than the threshold.
+"""
+
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from corpus import CORPORA, generate
+
+from pycolint.error_msgs import DEFAULT_PROBLEM_MAP, print_msgs
+from pycolint.parser import create_parser
+from pycolint.tokenizer import tokenize
+
+
+def best_time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(messages: list[str], repeat: int) -> dict[str, dict[str, float]]:
+    parse = create_parser()
+    num_tokens = sum(len(tokenize(m)) + 1 for m in messages)
+    problems = [parse(m) for m in messages]
+
+    def tokenize_all() -> None:
+        for m in messages:
+            tokenize(m)
+
+    def parse_all() -> None:
+        for m in messages:
+            parse(m)
+
+    def render_all() -> None:
+        for m, p in zip(messages, problems):
+            print_msgs(DEFAULT_PROBLEM_MAP, m, p, file=sink)
+
+    def summarize_all() -> None:
+        for m, p in zip(messages, problems):
+            print_msgs(DEFAULT_PROBLEM_MAP, m, p, file=sink, summary=True)
+
+    sink = io.StringIO()
+    results = {}
+    for stage, fn in (
+        ("tokenize", tokenize_all),
+        ("parse", parse_all),
+        ("render", render_all),
+        ("summary", summarize_all),
+    ):
+        sink.seek(0)
+        sink.truncate()
+        duration = best_time(fn, repeat)
+        results[stage] = {
+            "msgs_per_sec": len(messages) / duration,
+            "ns_per_token": duration / num_tokens * 1e9,
+        }
+    return results
+
+
+def run_suite(repeat: int) -> dict:
+    results = {}
+    for name in CORPORA:
+        for stage, values in measure(generate(name), repeat).items():
+            results[f"{stage}/{name}"] = values
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    regressions = []
+    for key, old in baseline["results"].items():
+        new = current["results"].get(key)
+        if new is None:
+            continue
+        change = new["msgs_per_sec"] / old["msgs_per_sec"] - 1
+        marker = ""
+        if change < -threshold:
+            marker = "  REGRESSION"
+            regressions.append(key)
+        print(
+            f"{key:<45} {old['msgs_per_sec']:12.0f} -> {new['msgs_per_sec']:12.0f}"
+            f" msgs/s {change:+7.1%}{marker}"
+        )
+    return regressions
+
+
+def print_results(data: dict) -> None:
+    for key, values in data["results"].items():
+        print(
+            f"{key:<45} {values['msgs_per_sec']:12.0f} msgs/s"
+            f" {values['ns_per_token']:10.0f} ns/token"
+        )
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    p.add_argument("--repeat", type=int, default=5)
+    commands = p.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run the suite")
+    run.add_argument("--output", type=Path, help="save results as json")
+    cmp = commands.add_parser("compare", help="compare against a baseline")
+    cmp.add_argument("baseline", type=Path)
+    cmp.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed relative slowdown, default 0.1",
+    )
+    args = p.parse_args()
+
+    current = run_suite(args.repeat)
+    if args.command == "run":
+        print_results(current)
+        if args.output is not None:
+            args.output.write_text(json.dumps(current, indent=2))
+        return
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regressions", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+# generated by `python -m pycolint.table --generate`, do not edit
+# (top, lhs mask, token kind, rule id, ((op, arg), ...))
+TRANSITIONS = (
+    ("BDY_MSG_SEP", 2, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 2, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 2, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 2, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 2, "EOF", 31, ((3, "EMPTY_BODY"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 2, "EOL", 20, ((1, None),)),
+    ("BDY_MSG_SEP", 2, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 2, "NL", 25, ((2, "MSG"), (1, None))),
+    ("BDY_MSG_SEP", 2, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 2, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 2, "WORD", 32, ((4, "BODY"),)),
+    ("BDY_MSG_SEP", 34, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 34, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 34, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 34, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 34, "EOF", 31, ((3, "EMPTY_BODY"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 34, "EOL", 20, ((1, None),)),
+    ("BDY_MSG_SEP", 34, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 34, "NL", 25, ((2, "MSG"), (1, None))),
+    ("BDY_MSG_SEP", 34, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 34, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("BDY_MSG_SEP", 34, "WORD", 32, ((4, "BODY"),)),
+    ("BDY_MSG_SEP", 258, "WORD", 5, ((0, None), (1, None))),
+    ("BDY_MSG_SEP", 290, "WORD", 5, ((0, None), (1, None))),
+    ("BODY", 2, "EOF", 50, ((2, "MSG"),)),
+    ("BODY", 34, "EOF", 50, ((2, "MSG"),)),
+    ("DESCR", 6, "EOL", 26, ((2, "HDR"), (1, None))),
+    ("DESCR", 6, "NL", 46, ((2, "HDR"),)),
+    ("DESCR", 38, "EOL", 26, ((2, "HDR"), (1, None))),
+    ("DESCR", 38, "NL", 46, ((2, "HDR"),)),
+    ("DOT", 70, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 70, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 70, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 70, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 70, "EOL", 40, ((3, "HDR_ENDS_IN_DOT"), (2, "DESCR"))),
+    ("DOT", 70, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 70, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 70, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 70, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 70, "WORD", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 102, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 102, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 102, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 102, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 102, "EOL", 40, ((3, "HDR_ENDS_IN_DOT"), (2, "DESCR"))),
+    ("DOT", 102, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 102, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 102, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 102, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("DOT", 102, "WORD", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EOL", 22, "EOF", 52, ((2, "MSG"),)),
+    ("EXCL", 6, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 6, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 6, "DIVIDER", 38, ((4, "DESCR"), (1, None))),
+    ("EXCL", 6, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 6, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 6, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 6, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 6, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 6, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 6, "WORD", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 38, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 38, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 38, "DIVIDER", 38, ((4, "DESCR"), (1, None))),
+    ("EXCL", 38, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 38, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 38, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 38, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 38, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 38, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 38, "WORD", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 70, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 70, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 70, "DIVIDER", 38, ((4, "DESCR"), (1, None))),
+    ("EXCL", 70, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 70, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 70, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 70, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 70, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 70, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 70, "WORD", 7, ((0, None), (1, None))),
+    ("EXCL", 102, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 102, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 102, "DIVIDER", 38, ((4, "DESCR"), (1, None))),
+    ("EXCL", 102, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 102, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 102, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 102, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 102, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 102, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("EXCL", 102, "WORD", 7, ((0, None), (1, None))),
+    ("HDR", 2, "EOF", 49, ((2, "MSG"),)),
+    ("HDR", 2, "NL", 19, ((4, "BDY_MSG_SEP"),)),
+    ("HDR", 34, "EOF", 49, ((2, "MSG"),)),
+    ("HDR", 34, "NL", 19, ((4, "BDY_MSG_SEP"),)),
+    ("HDR", 130, "NL", 6, ((0, None), (1, None))),
+    ("HDR", 162, "NL", 6, ((0, None), (1, None))),
+    ("NL", 130, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 130, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 130, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 130, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 130, "EOL", 30, ((2, "BDY_MSG_SEP"), (1, None))),
+    ("NL", 130, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 130, "NL", 28, ((2, "BDY_MSG_SEP"), (1, None))),
+    ("NL", 130, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 130, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 130, "WORD", 56, ((2, "BDY_MSG_SEP"),)),
+    ("NL", 162, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 162, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 162, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 162, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 162, "EOL", 30, ((2, "BDY_MSG_SEP"), (1, None))),
+    ("NL", 162, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 162, "NL", 28, ((2, "BDY_MSG_SEP"), (1, None))),
+    ("NL", 162, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 162, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("NL", 162, "WORD", 56, ((2, "BDY_MSG_SEP"),)),
+    ("SCOPE", 6, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 6, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 6, "DIVIDER", 39, ((4, "DESCR"), (1, None))),
+    ("SCOPE", 6, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 6, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 6, "EXCL", 8, ((0, None), (1, None))),
+    ("SCOPE", 6, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 6, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 6, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 6, "WORD", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 70, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 70, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 70, "DIVIDER", 39, ((4, "DESCR"), (1, None))),
+    ("SCOPE", 70, "DOT", 11, ((0, None), (1, None))),
+    ("SCOPE", 70, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 70, "EXCL", 8, ((0, None), (1, None))),
+    ("SCOPE", 70, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 70, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 70, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 70, "WORD", 10, ((0, None), (1, None))),
+    ("SCOPE", 258, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 258, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 258, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 258, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 258, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 258, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 258, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 258, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 258, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SCOPE", 258, "WORD", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 38, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 38, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 38, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 38, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 38, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 38, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 38, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 38, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 38, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 38, "WORD", 15, ((0, None), (1, None))),
+    ("SKIP", 70, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 70, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 70, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 70, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 70, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 70, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 70, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 70, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 70, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 70, "WORD", 15, ((0, None), (1, None))),
+    ("SKIP", 102, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 102, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 102, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 102, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 102, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 102, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 102, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 102, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 102, "SKIP", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("SKIP", 102, "WORD", 15, ((0, None), (1, None))),
+    ("START", 22, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("START", 22, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("START", 22, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("START", 22, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("START", 22, "EOL", 42, ((3, "EMPTY_HDR"), (0, None), (1, None))),
+    ("START", 22, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("START", 22, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("START", 22, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("START", 22, "SKIP", 2, ((3, "INVALID_TYPE"), (1, None))),
+    ("START", 22, "WORD", 18, ((0, None), (1, None))),
+    ("TYPE", 6, "EXCL", 9, ((0, None), (1, None))),
+    ("TYPE", 6, "OPAR", 35, ((4, "SCOPE"),)),
+    ("TYPE", 38, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("TYPE", 38, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    (
+        "TYPE",
+        38,
+        "DIVIDER",
+        44,
+        ((3, "INVALID_TYPE"), (2, "SCOPE"), (4, "DESCR"), (1, None)),
+    ),
+    ("TYPE", 38, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("TYPE", 38, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("TYPE", 38, "EXCL", 9, ((0, None), (1, None))),
+    ("TYPE", 38, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("TYPE", 38, "OPAR", 22, ((1, None),)),
+    ("TYPE", 38, "SKIP", 33, ((3, "TOO_MUCH_WHITESPACE_AFTER_COLON"), (1, None))),
+    ("TYPE", 38, "WORD", 17, ((0, None), (1, None))),
+    ("TYPE", 70, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("TYPE", 70, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("TYPE", 70, "DIVIDER", 21, ((1, None),)),
+    ("TYPE", 70, "DOT", 13, ((0, None), (1, None))),
+    ("TYPE", 70, "EOL", 36, ((3, "MISSING_DESCRIPTION"), (2, "DESCR"))),
+    ("TYPE", 70, "EXCL", 9, ((0, None), (1, None))),
+    ("TYPE", 70, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("TYPE", 70, "OPAR", 35, ((4, "SCOPE"),)),
+    ("TYPE", 70, "SKIP", 33, ((3, "TOO_MUCH_WHITESPACE_AFTER_COLON"), (1, None))),
+    ("TYPE", 70, "WORD", 14, ((0, None), (1, None))),
+    ("TYPE", 102, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("TYPE", 102, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("TYPE", 102, "DIVIDER", 21, ((1, None),)),
+    ("TYPE", 102, "DOT", 13, ((0, None), (1, None))),
+    ("TYPE", 102, "EOL", 36, ((3, "MISSING_DESCRIPTION"), (2, "DESCR"))),
+    ("TYPE", 102, "EXCL", 9, ((0, None), (1, None))),
+    ("TYPE", 102, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("TYPE", 102, "OPAR", 22, ((1, None),)),
+    ("TYPE", 102, "SKIP", 33, ((3, "TOO_MUCH_WHITESPACE_AFTER_COLON"), (1, None))),
+    ("TYPE", 102, "WORD", 14, ((0, None), (1, None))),
+    ("WORD", 22, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    (
+        "WORD",
+        22,
+        "CPAR",
+        34,
+        ((3, "UNOPENED_SCOPE"), (2, "TYPE"), (4, "DESCR"), (1, None)),
+    ),
+    ("WORD", 22, "DIVIDER", 3, ((2, "TYPE"), (4, "DESCR"))),
+    ("WORD", 22, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 22, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 22, "EXCL", 57, ((2, "TYPE"),)),
+    ("WORD", 22, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 22, "OPAR", 55, ((2, "TYPE"),)),
+    ("WORD", 22, "SKIP", 1, ((3, "INVALID_TYPE"), (1, None))),
+    ("WORD", 22, "WORD", 0, ((3, "INVALID_TYPE"), (1, None))),
+    ("WORD", 38, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 38, "CPAR", 27, ((2, "SCOPE"), (1, None))),
+    ("WORD", 38, "DIVIDER", 37, ((3, "UNCLOSED_SCOPE"), (2, "SCOPE"))),
+    ("WORD", 38, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 38, "EOL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 38, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 38, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 38, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 38, "SKIP", 16, ((0, None), (1, None))),
+    ("WORD", 38, "WORD", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 70, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 70, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 70, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 70, "DOT", 12, ((0, None), (1, None))),
+    ("WORD", 70, "EOL", 47, ((2, "DESCR"),)),
+    ("WORD", 70, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 70, "NL", 48, ((2, "DESCR"),)),
+    ("WORD", 70, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 70, "SKIP", 16, ((0, None), (1, None))),
+    ("WORD", 70, "WORD", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 102, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 102, "CPAR", 27, ((2, "SCOPE"), (1, None))),
+    ("WORD", 102, "DIVIDER", 37, ((3, "UNCLOSED_SCOPE"), (2, "SCOPE"))),
+    ("WORD", 102, "DOT", 12, ((0, None), (1, None))),
+    ("WORD", 102, "EOL", 47, ((2, "DESCR"),)),
+    ("WORD", 102, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 102, "NL", 48, ((2, "DESCR"),)),
+    ("WORD", 102, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 102, "SKIP", 16, ((0, None), (1, None))),
+    ("WORD", 102, "WORD", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 258, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 258, "CPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 258, "DIVIDER", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 258, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 258, "EOF", 51, ((2, "BODY"),)),
+    ("WORD", 258, "EOL", 23, ((1, None),)),
+    ("WORD", 258, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 258, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 258, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 258, "SKIP", 24, ((1, None),)),
+    ("WORD", 258, "WORD", 4, ((0, None), (1, None))),
+    ("WORD", 290, "BREAKING_CHANGE", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 290, "CPAR", 27, ((2, "SCOPE"), (1, None))),
+    ("WORD", 290, "DIVIDER", 37, ((3, "UNCLOSED_SCOPE"), (2, "SCOPE"))),
+    ("WORD", 290, "DOT", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 290, "EOF", 51, ((2, "BODY"),)),
+    ("WORD", 290, "EOL", 23, ((1, None),)),
+    ("WORD", 290, "EXCL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 290, "NL", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 290, "OPAR", 58, ((3, "ERROR"), (2, "MSG"))),
+    ("WORD", 290, "SKIP", 24, ((1, None),)),
+    ("WORD", 290, "WORD", 4, ((0, None), (1, None))),
+)
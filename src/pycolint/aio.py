@@ -0,0 +1,124 @@
+"""
+Lint from asyncio code without blocking the event loop, e.g., in a
+service that lints the commits of incoming push events.
+
+Parsing runs in an `executor`, by default the thread pool of the event
+loop. Threads keep the loop responsive, but share one CPU through the
+GIL, pass a `ProcessPoolExecutor` to lint on several CPUs.
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+
+from .batch import ProblemRecord
+from .parser import Problem, create_parser
+
+if TYPE_CHECKING:
+    from .config import Config
+
+
+class LintResult(NamedTuple):
+    """The problems of the message at `position` of a stream."""
+
+    position: int
+    msg: str
+    problems: list[ProblemRecord]
+
+
+@lru_cache(maxsize=8)
+def _parser(config: "Config | None") -> Callable[[str], list[Problem]]:
+    return create_parser(config=config)
+
+
+def _lint(msg: str, config: "Config | None") -> list[ProblemRecord]:
+    # runs in the executor, each worker process builds its own parser
+    return [ProblemRecord.from_problem(p) for p in _parser(config)(msg)]
+
+
+async def lint_async(
+    msg: str,
+    executor: Executor | None = None,
+    config: "Config | None" = None,
+    limit: asyncio.Semaphore | None = None,
+) -> list[ProblemRecord]:
+    """
+    The problems of `msg`, linted in `executor`. Calls sharing a
+    `limit` wait for it, which bounds the messages in flight.
+    """
+    loop = asyncio.get_running_loop()
+    if limit is None:
+        return await loop.run_in_executor(executor, _lint, msg, config)
+    async with limit:
+        return await loop.run_in_executor(executor, _lint, msg, config)
+
+
+async def lint_stream(
+    messages: AsyncIterable[str],
+    executor: Executor | None = None,
+    config: "Config | None" = None,
+    concurrency: int = 8,
+    ordered: bool = True,
+) -> AsyncIterator[LintResult]:
+    """
+    Lint `messages` in `executor` and yield their results as soon as
+    they are available.
+
+    At most `concurrency` messages are linted or wait to be yielded at
+    a time, the next message is only read from `messages` once one of
+    them is done. Results are yielded in the order of `messages`, or in
+    the order they complete if not `ordered`.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency has to be at least 1, not {concurrency}")
+    loop = asyncio.get_running_loop()
+    source = aiter(messages)
+    reading: asyncio.Future | None = None
+    exhausted = False
+    in_flight: dict[asyncio.Future, tuple[int, str]] = {}
+    # results of ordered streams waiting for an earlier message
+    done_early: dict[int, LintResult] = {}
+    next_position = 0
+    num_read = 0
+    try:
+        while not exhausted or in_flight:
+            if (
+                not exhausted
+                and reading is None
+                and len(in_flight) + len(done_early) < concurrency
+            ):
+                reading = asyncio.ensure_future(anext(source))
+            waiting = set(in_flight)
+            if reading is not None:
+                waiting.add(reading)
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if reading is not None and reading in done:
+                try:
+                    msg = reading.result()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    f = loop.run_in_executor(executor, _lint, msg, config)
+                    in_flight[f] = (num_read, msg)
+                    num_read += 1
+                reading = None
+            results = []
+            for f in done:
+                if f in in_flight:
+                    position, msg = in_flight.pop(f)
+                    results.append(LintResult(position, msg, f.result()))
+            if not ordered:
+                for result in sorted(results):
+                    yield result
+                continue
+            done_early.update((r.position, r) for r in results)
+            while next_position in done_early:
+                yield done_early.pop(next_position)
+                next_position += 1
+    finally:
+        if reading is not None:
+            reading.cancel()
+        for f in in_flight:
+            f.cancel()
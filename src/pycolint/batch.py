@@ -0,0 +1,202 @@
+import os
+import subprocess
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import islice
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+
+from .memo import MemoizedParse
+from .parser import Problem, create_parser
+from .problem_types import ProblemType
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from .cache import ResultCache
+    from .config import Config
+    from .stats import ParseStats
+
+_T = TypeVar("_T")
+_C = TypeVar("_C")
+
+
+class ProblemRecord(NamedTuple):
+    """
+    Compact form of a `Problem`, that is cheap to send between processes.
+    """
+
+    type: ProblemType
+    line: int
+    column: int
+
+    @classmethod
+    def from_problem(cls, p: Problem) -> "ProblemRecord":
+        return cls(p.type, p.token.line, p.token.column)
+
+
+class CommitResult(NamedTuple):
+    sha: str
+    msg: str
+    problems: list[ProblemRecord]
+
+
+def _split_records(chunks: Iterator[bytes], separator: bytes) -> Iterator[bytes]:
+    rest = b""
+    for chunk in chunks:
+        records = (rest + chunk).split(separator)
+        rest = records.pop()
+        yield from records
+    if rest:
+        yield rest
+
+
+def iter_git_messages(
+    revisions: Sequence[str] = (),
+    cwd: str | None = None,
+    chunk_size: int = 1 << 16,
+) -> Iterator[tuple[str, str]]:
+    """
+    Yield (sha, message) for every commit `git log` lists for `revisions`.
+
+    Messages are read from a single `git log` process as they arrive,
+    so memory use does not depend on the size of the history.
+    """
+    cmd = ["git", "log", "-z", "--format=%H%n%B", *revisions]
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, cwd=cwd) as proc:
+        assert proc.stdout is not None
+        chunks = iter(lambda: proc.stdout.read(chunk_size), b"")  # type: ignore[union-attr]
+        for record in _split_records(chunks, b"\0"):
+            sha, _, msg = record.decode("utf-8", errors="replace").partition("\n")
+            yield sha, msg.rstrip("\n")
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+_worker_parse: Callable[[str], list[Problem]] | None = None
+
+
+def _init_worker(config: "Config | None") -> None:
+    global _worker_parse
+    _worker_parse = MemoizedParse(create_parser(intern=True, config=config))
+
+
+def _lint_chunk(messages: list[str]) -> list[list[tuple[int, int, int]]]:
+    assert _worker_parse is not None
+    return [
+        [(p.type.value, p.token.line, p.token.column) for p in _worker_parse(m)]
+        for m in messages
+    ]
+
+
+def _chunks(items: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _lint_chunks(
+    chunks: Iterable[tuple[_C, list[str]]],
+    jobs: int,
+    stats: "ParseStats | None" = None,
+    config: "Config | None" = None,
+) -> Iterator[tuple[_C, list[list[ProblemRecord]]]]:
+    """
+    Lint the messages of each (context, messages) chunk, yielding
+    (context, problems per message) in input order.
+
+    Rule statistics are collected in this process, so `stats`
+    implies `jobs` = 1. They count every message, repeated messages
+    are only parsed once without them.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs == 1 or stats is not None:
+        parse = create_parser(stats=stats, intern=True, config=config)
+        if stats is None:
+            parse = MemoizedParse(parse)
+        for context, messages in chunks:
+            yield (
+                context,
+                [[ProblemRecord.from_problem(p) for p in parse(m)] for m in messages],
+            )
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    def unpack(f: "Future") -> list[list[ProblemRecord]]:
+        return [
+            [ProblemRecord(ProblemType(t), *pos) for t, *pos in problems]
+            for problems in f.result()
+        ]
+
+    with ProcessPoolExecutor(
+        jobs, initializer=_init_worker, initargs=(config,)
+    ) as pool:
+        in_flight: deque[tuple[_C, "Future"]] = deque()
+        for context, messages in chunks:
+            in_flight.append((context, pool.submit(_lint_chunk, messages)))
+            if len(in_flight) >= 2 * jobs:
+                context, f = in_flight.popleft()
+                yield context, unpack(f)
+        while in_flight:
+            context, f = in_flight.popleft()
+            yield context, unpack(f)
+
+
+def lint_many(
+    messages: Iterable[str],
+    jobs: int = 1,
+    chunk_size: int = 256,
+    stats: "ParseStats | None" = None,
+    config: "Config | None" = None,
+) -> Iterator[list[ProblemRecord]]:
+    """
+    Yield the problems of each message in `messages`, in input order.
+
+    With `jobs` > 1 messages are sent in chunks of `chunk_size` to a pool
+    of worker processes, each building its parser once. `jobs` = 0 uses
+    one worker per CPU. At most two chunks per worker are in flight, so
+    `messages` may be an arbitrarily long stream. Rule statistics
+    of the parsed messages are added to `stats`. Types and scopes are
+    checked against `config`, see `create_parser`.
+    """
+    chunks = ((None, c) for c in _chunks(messages, chunk_size))
+    for _, problems in _lint_chunks(chunks, jobs, stats, config):
+        yield from problems
+
+
+def lint_history(
+    revisions: Sequence[str] = (),
+    cwd: str | None = None,
+    jobs: int = 1,
+    chunk_size: int = 256,
+    cache: "ResultCache | None" = None,
+    stats: "ParseStats | None" = None,
+    config: "Config | None" = None,
+) -> Iterator[CommitResult]:
+    """
+    Lint the commits `git log` lists for `revisions`.
+
+    Commits found in `cache` are not parsed again, the results of
+    all other commits are added to it. Rule statistics of the parsed
+    commits are added to `stats`. The `cache` has to be opened for
+    the same `config`, see `Config.digest`.
+    """
+    Cached = list[ProblemRecord] | None
+
+    def chunks() -> Iterator[tuple[list[tuple[str, str, Cached]], list[str]]]:
+        for commits in _chunks(iter_git_messages(revisions, cwd), chunk_size):
+            looked_up = [
+                (sha, msg, cache.get(sha) if cache is not None else None)
+                for sha, msg in commits
+            ]
+            yield looked_up, [msg for _, msg, cached in looked_up if cached is None]
+
+    for commits, results in _lint_chunks(chunks(), jobs, stats, config):
+        fresh = iter(results)
+        for sha, msg, problems in commits:
+            if problems is None:
+                problems = next(fresh)
+                if cache is not None:
+                    cache.put(sha, problems)
+            yield CommitResult(sha, msg, problems)
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from .batch import ProblemRecord
+from .problem_types import ProblemType
+
+
+def pycolint_version() -> str:
+    # importlib.metadata takes long to import
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("pycolint")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def default_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pycolint" / "results.sqlite"
+
+
+def message_key(msg: str) -> str:
+    """Cache key for messages that do not belong to a commit."""
+    return hashlib.sha256(msg.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+class ResultCache:
+    """
+    Lint results stored in an SQLite database.
+
+    Results are keyed by commit SHA (or `message_key`), the version of
+    pycolint and a hash of the configuration, so results of other
+    versions or configurations are never returned. Entries older than
+    `max_age` seconds are dropped and only the `max_entries` newest
+    entries are kept, both when the cache is opened.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike = ":memory:",
+        config_hash: str = "",
+        linter_version: str | None = None,
+        max_entries: int = 1_000_000,
+        max_age: float = 90 * 24 * 3600,
+        commit_every: int = 1000,
+    ) -> None:
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._version = pycolint_version() if linter_version is None else linter_version
+        self._config = config_hash
+        self._commit_every = commit_every
+        self._uncommitted = 0
+        self.hits = 0
+        self.misses = 0
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS results (
+                key TEXT NOT NULL,
+                version TEXT NOT NULL,
+                config TEXT NOT NULL,
+                problems TEXT NOT NULL,
+                created REAL NOT NULL,
+                PRIMARY KEY (key, version, config)
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS created ON results (created)")
+        self.evict(max_entries, max_age)
+
+    def evict(self, max_entries: int, max_age: float) -> None:
+        self._db.execute(
+            "DELETE FROM results WHERE created < ?", (time.time() - max_age,)
+        )
+        (count,) = self._db.execute("SELECT count(*) FROM results").fetchone()
+        if count > max_entries:
+            self._db.execute(
+                """DELETE FROM results WHERE rowid IN (
+                    SELECT rowid FROM results ORDER BY created LIMIT ?
+                )""",
+                (count - max_entries,),
+            )
+        self._db.commit()
+
+    def get(self, key: str) -> list[ProblemRecord] | None:
+        row = self._db.execute(
+            "SELECT problems FROM results WHERE key = ? AND version = ? AND config = ?",
+            (key, self._version, self._config),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return [
+            ProblemRecord(ProblemType(t), line, column)
+            for t, line, column in json.loads(row[0])
+        ]
+
+    def put(self, key: str, problems: list[ProblemRecord]) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+            (
+                key,
+                self._version,
+                self._config,
+                json.dumps([(p.type.value, p.line, p.column) for p in problems]),
+                time.time(),
+            ),
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= self._commit_every:
+            self._db.commit()
+            self._uncommitted = 0
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT count(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.commit()
+        self._db.close()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,255 @@
+"""
+Checks that run while the parser reads a message.
+
+A `Check` subscribes to token kinds and to expression types. The parser
+calls it with every token of these kinds it consumes and every
+expression of these types it reduces, so all checks share the single
+traversal of the message, see `pycolint.table.run`. Checks only look at
+the token or expression they are called with, which also lets
+`pycolint.incremental` resume them from any line. Problems that span
+tokens the parser never reads, like an empty scope the parser stops at,
+are found by `text` checks, which are called once with the message
+before it is parsed.
+
+The builtin checks are opt-in, they are enabled by name in `[tool.pycolint]`
+
+    [tool.pycolint]
+    enable-checks = ["empty-scope", "header-length", "past-tense"]
+    max-header-length = 50
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
+
+from .parser import Expression, ExpressionType, Problem
+from .problem_types import ProblemType as P
+from .tokenizer import Kind as T, Token, iter_tokens
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .stats import ParseStats
+
+_E = ExpressionType
+
+MAX_HEADER_LENGTH = 50
+
+# the parser only reads the body for checks of these
+_BODY = frozenset({_E.BODY, _E.TRAIL, _E.FOOTER})
+
+CHECK_NAMES = (
+    "body-separator",
+    "empty-scope",
+    "header-length",
+    "past-tense",
+    "single-word-scope",
+)
+
+# very common verbs in the past tense, descriptions should use the imperative
+_PAST_TENSE = frozenset(
+    {
+        "added",
+        "adjusted",
+        "allowed",
+        "built",
+        "bumped",
+        "changed",
+        "cleaned",
+        "converted",
+        "corrected",
+        "created",
+        "deleted",
+        "did",
+        "disabled",
+        "dropped",
+        "enabled",
+        "extracted",
+        "fixed",
+        "implemented",
+        "improved",
+        "introduced",
+        "made",
+        "merged",
+        "moved",
+        "refactored",
+        "removed",
+        "renamed",
+        "replaced",
+        "reverted",
+        "simplified",
+        "updated",
+        "upgraded",
+        "used",
+        "wrote",
+    }
+)
+
+
+@dataclass(frozen=True)
+class Check:
+    """
+    `fn` is called with each token of a kind and each expression of a
+    type in `on` and returns the problems it finds in them.
+
+    Checks that are not `enabled` by default have to be enabled in the
+    configuration. Checks that never find a problem in a message that
+    `is_valid_message` accepts are `valid_messages_pass`, the parser may
+    skip such messages as long as all enabled checks are. Checks of the
+    `text` are called with the whole message instead, before parsing.
+
+    The parser only reads the body of a message if a check `reads_body`,
+    i.e., subscribes to the body or its trailers.
+    """
+
+    name: str
+    fn: Callable[[Any], Iterable[Problem]]
+    on: frozenset[T | ExpressionType]
+    enabled: bool = True
+    valid_messages_pass: bool = True
+    text: bool = False
+
+    @property
+    def reads_body(self) -> bool:
+        return not self.on.isdisjoint(_BODY)
+
+
+def check(
+    *on: T | ExpressionType,
+    name: str,
+    enabled: bool = True,
+    valid_messages_pass: bool = True,
+    text: bool = False,
+) -> Callable[[Callable[[Any], Iterable[Problem]]], Check]:
+    def _c(fn: Callable[[Any], Iterable[Problem]]) -> Check:
+        return Check(name, fn, frozenset(on), enabled, valid_messages_pass, text)
+
+    return _c
+
+
+def _first_token(e: Expression) -> Token | None:
+    for s in e.sub:
+        t = _first_token(s) if isinstance(s, Expression) else s
+        if t is not None:
+            return t
+    return None
+
+
+@check(_E.SCOPE, name="single-word-scope", enabled=False)
+def single_word_scope(scope: Expression) -> Iterable[Problem]:
+    words = [t for t in scope.sub if isinstance(t, Token) and t.kind == T.WORD]
+    if len(words) > 1:
+        return (Problem(P.USE_SINGLE_WORD_FOR_SCOPE, words[1]),)
+    return ()
+
+
+@check(name="empty-scope", enabled=False, text=True)
+def empty_scope(text: str) -> Iterable[Problem]:
+    """Reports the `)` of a header starting with `type()`."""
+    first = list(islice(iter_tokens(text), 3))
+    if [t.kind for t in first] == [T.WORD, T.OPAR, T.CPAR]:
+        return (Problem(P.EMPTY_SCOPE, first[2]),)
+    return ()
+
+
+@check(_E.BODY, name="body-separator", enabled=False)
+def body_separator(body: Expression) -> Iterable[Problem]:
+    first = _first_token(body)
+    if first is not None and first.line == 2:
+        return (Problem(P.MISSING_BDY_SEP, first),)
+    return ()
+
+
+@check(_E.DESCR, name="past-tense", enabled=False, valid_messages_pass=False)
+def past_tense(descr: Expression) -> Iterable[Problem]:
+    first = _first_token(descr)
+    if first is not None and first.value.lower() in _PAST_TENSE:
+        return (Problem(P.PAST_TENSE, first),)
+    return ()
+
+
+def header_length(limit: int = MAX_HEADER_LENGTH) -> Check:
+    """Reports the token of the header containing character `limit + 1`."""
+    column = limit + 1
+
+    def fn(t: Token) -> Iterable[Problem]:
+        if t.line == 1 and t.column <= column < t.column + len(t.value):
+            return (Problem(P.TOO_LONG_HDR, t),)
+        return ()
+
+    kinds = set(T) - {T.NL, T.EOL, T.EOF, T.START, T.EMPTY_LINE}
+    return check(
+        *kinds, name="header-length", enabled=False, valid_messages_pass=False
+    )(fn)
+
+
+@lru_cache(maxsize=8)
+def builtin_checks(max_header_length: int = MAX_HEADER_LENGTH) -> tuple[Check, ...]:
+    return (
+        body_separator,
+        empty_scope,
+        header_length(max_header_length),
+        past_tense,
+        single_word_scope,
+    )
+
+
+def enabled_checks(config: "Config | None" = None) -> tuple[Check, ...]:
+    """The builtin checks enabled by default or by `config`."""
+    if config is None:
+        return tuple(c for c in builtin_checks() if c.enabled)
+    return tuple(
+        c
+        for c in builtin_checks(config.max_header_length)
+        if (c.enabled or c.name in config.enable_checks)
+        and c.name not in config.disable_checks
+    )
+
+
+class CheckSet:
+    """
+    The `checks` subscribed to each token kind and expression type.
+    With `stats` the calls, problems and time of each check are
+    recorded.
+    """
+
+    def __init__(
+        self, checks: Iterable[Check], stats: "ParseStats | None" = None
+    ) -> None:
+        self.checks = tuple(checks)
+        self.texts = tuple(c for c in self.checks if c.text)
+        self.tokens: dict[T, tuple[Check, ...]] = {}
+        self.expressions: dict[ExpressionType, tuple[Check, ...]] = {}
+        for c in self.checks:
+            for kind in c.on:
+                if isinstance(kind, T):
+                    self.tokens[kind] = self.tokens.get(kind, ()) + (c,)
+                else:
+                    self.expressions[kind] = self.expressions.get(kind, ()) + (c,)
+        self._stats = stats
+
+    @property
+    def valid_messages_pass(self) -> bool:
+        return all(c.valid_messages_pass for c in self.checks)
+
+    @property
+    def reads_body(self) -> bool:
+        return any(c.reads_body for c in self.checks)
+
+    def apply(
+        self,
+        item: Token | Expression | str,
+        checks: tuple[Check, ...],
+        problems: list[Problem],
+    ) -> None:
+        stats = self._stats
+        for c in checks:
+            if stats is None:
+                problems.extend(c.fn(item))
+                continue
+            start = perf_counter_ns()
+            found = list(c.fn(item))
+            stats.record_check(c.name, perf_counter_ns() - start, len(found))
+            problems.extend(found)
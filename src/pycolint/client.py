@@ -0,0 +1,119 @@
+"""
+Lint a commit message with a running `pycolint --daemon`.
+
+Only the standard library is imported unless no daemon is running,
+in which case the message is linted in process like `pycolint` does.
+Meant for commit-msg hooks, that start a new interpreter per commit.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+
+def default_socket_path() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, f"pycolint-{os.getuid()}.sock")
+    # not tempfile.gettempdir(), importing tempfile takes longer than linting
+    base = os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(base, f"pycolint-{os.getuid()}", "daemon.sock")
+
+
+def is_private_directory(path: str) -> bool:
+    """
+    True if the directory `path` belongs to the current user and no
+    one else may access it, so no one else can have created a socket
+    in it.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return st.st_uid == os.getuid() and st.st_mode & 0o077 == 0
+
+
+def request(
+    msg: str,
+    summary: bool = False,
+    path: str | None = None,
+    timeout: float = 5.0,
+    config: str | None = None,
+) -> dict | None:
+    """
+    Send `msg` to the daemon listening on `path`. Returns the response
+    or None if no daemon answered. Sockets in directories other users
+    can access are not connected to. The daemon checks `msg` against
+    the `pyproject.toml` at `config`, by default the one it finds from
+    the current directory.
+    """
+    if path is None:
+        path = default_socket_path()
+    if not is_private_directory(os.path.dirname(os.path.abspath(path))):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(timeout)
+            s.connect(path)
+            request = {"msg": msg, "summary": summary, "cwd": os.getcwd()}
+            if config is not None:
+                request["config"] = os.path.abspath(config)
+            s.sendall(json.dumps(request).encode())
+            s.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := s.recv(1 << 16):
+                chunks.append(chunk)
+    except OSError:
+        return None
+    try:
+        response = json.loads(b"".join(chunks))
+    except ValueError:
+        return None
+    if "error" in response:
+        return None
+    return response
+
+
+def main(argv: list[str] | None = None):
+    p = argparse.ArgumentParser(
+        prog="pycolint-client",
+        description="Lint a conventional commit message with a running pycolint daemon.",
+    )
+    p.add_argument(
+        "msg",
+        nargs=argparse.REMAINDER,
+        help="the commit message, options have to precede it",
+    )
+    p.add_argument(
+        "--summary",
+        action="store_true",
+        help="print one line per problem instead of the annotated message",
+    )
+    p.add_argument("--socket", metavar="PATH", help="socket of the daemon")
+    p.add_argument(
+        "--config",
+        metavar="PATH",
+        help="pyproject.toml with the [tool.pycolint] configuration",
+    )
+    args = p.parse_args(argv)
+    if args.msg[:1] == ["--"]:
+        args.msg = args.msg[1:]
+    msg = " ".join(args.msg)
+    response = request(msg, args.summary, args.socket, config=args.config)
+    if response is None:
+        from .main import main as lint
+
+        options = ["--summary"] if args.summary else []
+        if args.config is not None:
+            options += ["--config", args.config]
+        lint([*options, "--", *args.msg])
+        return
+    sys.stderr.write(response["text"])
+    if len(response["problems"]) > 0:
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+Configuration in the `[tool.pycolint]` table of `pyproject.toml`
+
+    [tool.pycolint]
+    types = ["feat", "fix", "docs"]
+    scopes = ["parser", "cli"]
+    scope-patterns = ["pkg-[a-z]+"]
+    enable-checks = ["header-length"]
+    disable-checks = ["past-tense"]
+    max-header-length = 50
+
+Without `types` any type is allowed, without `scopes` and
+`scope-patterns` any scope is. The checks are the ones of
+`pycolint.checks`.
+
+Loaded configurations are cached in the process and on disk, keyed by
+path, modification time and size of the file, so `pyproject.toml` is
+only parsed again after it changed or the format of the cache did. Files without a `[tool.pycolint]`
+table header are neither parsed nor cached.
+"""
+
+import marshal
+import os
+import re
+import sys
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from .checks import CHECK_NAMES, MAX_HEADER_LENGTH
+from .parser import Problem
+from .problem_types import ProblemType as P
+from .tokenizer import Kind as T, iter_tokens
+
+KEYS = (
+    "types",
+    "scopes",
+    "scope-patterns",
+    "enable-checks",
+    "disable-checks",
+    "max-header-length",
+)
+
+
+class ConfigError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Config:
+    """
+    Allowed types and scopes. Scopes are allowed if they are listed
+    in `scopes` or fully match one of the `scope_patterns`, which are
+    combined into a single regular expression. Checks are enabled and
+    disabled by name.
+    """
+
+    types: frozenset[str] | None = None
+    scopes: frozenset[str] | None = None
+    scope_patterns: tuple[str, ...] = ()
+    enable_checks: frozenset[str] = frozenset()
+    disable_checks: frozenset[str] = frozenset()
+    max_header_length: int = MAX_HEADER_LENGTH
+    _scope_regex: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        regex = None
+        if self.scope_patterns:
+            try:
+                regex = re.compile("|".join(f"(?:{p})" for p in self.scope_patterns))
+            except re.error as e:
+                raise ConfigError(f"invalid scope pattern: {e}") from e
+        object.__setattr__(self, "_scope_regex", regex)
+
+    @classmethod
+    def from_table(cls, table: dict) -> "Config":
+        """Validate and compile the `[tool.pycolint]` table."""
+        unknown = sorted(set(table) - set(KEYS))
+        if unknown:
+            raise ConfigError(f"unknown keys in [tool.pycolint]: {', '.join(unknown)}")
+
+        def strings(key: str) -> list[str] | None:
+            value = table.get(key)
+            if value is None:
+                return None
+            if not isinstance(value, list) or not all(
+                isinstance(v, str) for v in value
+            ):
+                raise ConfigError(f"tool.pycolint.{key} has to be a list of strings")
+            return value
+
+        def checks(key: str) -> frozenset[str]:
+            names = frozenset(strings(key) or ())
+            unknown = sorted(names - set(CHECK_NAMES))
+            if unknown:
+                raise ConfigError(
+                    f"unknown checks in tool.pycolint.{key}: {', '.join(unknown)}"
+                )
+            return names
+
+        max_header_length = table.get("max-header-length", MAX_HEADER_LENGTH)
+        if (
+            not isinstance(max_header_length, int)
+            or isinstance(max_header_length, bool)
+            or max_header_length < 1
+        ):
+            raise ConfigError(
+                "tool.pycolint.max-header-length has to be a positive integer"
+            )
+        types = strings("types")
+        scopes = strings("scopes")
+        return cls(
+            frozenset(types) if types is not None else None,
+            frozenset(scopes) if scopes is not None else None,
+            tuple(strings("scope-patterns") or ()),
+            checks("enable-checks"),
+            checks("disable-checks"),
+            max_header_length,
+        )
+
+    @property
+    def checks_header(self) -> bool:
+        return (
+            self.types is not None
+            or self.scopes is not None
+            or len(self.scope_patterns) > 0
+        )
+
+    def allows_type(self, name: str) -> bool:
+        return self.types is None or name in self.types
+
+    def allows_scope(self, name: str) -> bool:
+        if self.scopes is None and self._scope_regex is None:
+            return True
+        if self.scopes is not None and name in self.scopes:
+            return True
+        regex = self._scope_regex
+        return regex is not None and regex.fullmatch(name) is not None
+
+    def digest(self) -> str:
+        """
+        Identifies the configuration, e.g., for `ResultCache`. Empty
+        for the default configuration.
+        """
+        if self == Config():
+            return ""
+        import hashlib
+
+        key = repr(
+            (
+                sorted(self.types) if self.types is not None else None,
+                sorted(self.scopes) if self.scopes is not None else None,
+                self.scope_patterns,
+                sorted(self.enable_checks),
+                sorted(self.disable_checks),
+                self.max_header_length,
+            )
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+
+
+def check_header(config: Config, text: str) -> list[Problem]:
+    """
+    Problems with the type and scope in the header of `text`. Only
+    the first tokens are read. Headers, that do not start with a type
+    followed by a scope, `!` or `: `, are left to the parser.
+    """
+    it = iter_tokens(text)
+    first = next(it, None)
+    after = next(it, None)
+    if first is None or first.kind != T.WORD or after is None:
+        return []
+    if after.kind not in (T.OPAR, T.EXCL, T.DIVIDER):
+        return []
+    problems = []
+    if not config.allows_type(first.value):
+        problems.append(Problem(P.UNKNOWN_TYPE, first))
+    if after.kind == T.OPAR:
+        scope, close = next(it, None), next(it, None)
+        if (
+            scope is not None
+            and scope.kind == T.WORD
+            and close is not None
+            and close.kind == T.CPAR
+            and not config.allows_scope(scope.value)
+        ):
+            problems.append(Problem(P.UNKNOWN_SCOPE, scope))
+    return problems
+
+
+def find_pyproject(start: str | os.PathLike | None = None) -> str | None:
+    """The `pyproject.toml` in `start` or the closest parent directory."""
+    directory = os.path.abspath(os.getcwd() if start is None else start)
+    while True:
+        candidate = os.path.join(directory, "pyproject.toml")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def default_cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "pycolint", "config")
+
+
+def load_config(
+    path: str | os.PathLike | None = None, cache_dir: str | None = None
+) -> Config:
+    """
+    The configuration in the `pyproject.toml` at `path`, by default the
+    one `find_pyproject` finds. The default `Config` if there is none or
+    it has no `[tool.pycolint]` table. Raises `ConfigError` for invalid
+    configurations.
+    """
+    if path is None:
+        path = find_pyproject()
+        if path is None:
+            return Config()
+    path = os.path.abspath(path)
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        raise ConfigError(f"can not read {path}: {e.strerror}") from e
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    return _load(path, st.st_mtime_ns, st.st_size, cache_dir)
+
+
+# header of the [tool.pycolint] table or one of its subtables
+_TOOL_TABLE = re.compile(rb"^[ \t]*\[[ \t]*tool[ \t]*\.[ \t]*pycolint\b", re.MULTILINE)
+
+# (version, path, mtime, size, *fields of Config)
+_Cached = tuple
+_CACHED_LENGTH = 10
+# bump when the fields of Config or their meaning change, so caches
+# written by other versions of pycolint are not used
+_CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=32)
+def _load(path: str, mtime_ns: int, size: int, cache_dir: str) -> Config:
+    # most projects do not configure pycolint, skip parsing their toml
+    if not _has_tool_table(path):
+        return Config()
+    cache_file = os.path.join(
+        cache_dir, f"{zlib.crc32(path.encode()):08x}-{sys.implementation.cache_tag}"
+    )
+    cached = _read_cache(cache_file)
+    if cached is not None and cached[:4] == (_CACHE_VERSION, path, mtime_ns, size):
+        return Config(*cached[4:])
+    config = Config.from_table(_read_table(path))
+    _write_cache(
+        cache_file,
+        (
+            _CACHE_VERSION,
+            path,
+            mtime_ns,
+            size,
+            config.types,
+            config.scopes,
+            config.scope_patterns,
+            config.enable_checks,
+            config.disable_checks,
+            config.max_header_length,
+        ),
+    )
+    return config
+
+
+def _has_tool_table(path: str) -> bool:
+    try:
+        with open(path, "rb") as f:
+            return _TOOL_TABLE.search(f.read()) is not None
+    except OSError as e:
+        raise ConfigError(f"can not read {path}: {e.strerror}") from e
+
+
+def _read_table(path: str) -> dict:
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib  # type: ignore[import-not-found]
+        except ImportError:
+            raise ConfigError("reading pyproject.toml needs tomli before Python 3.11")
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except OSError as e:
+        raise ConfigError(f"can not read {path}: {e.strerror}") from e
+    except tomllib.TOMLDecodeError as e:
+        raise ConfigError(f"invalid {path}: {e}") from e
+    table = data.get("tool", {}).get("pycolint", {})
+    if not isinstance(table, dict):
+        raise ConfigError(f"tool.pycolint in {path} has to be a table")
+    return table
+
+
+def _read_cache(cache_file: str) -> _Cached | None:
+    try:
+        with open(cache_file, "rb") as f:
+            cached = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if isinstance(cached, tuple) and len(cached) == _CACHED_LENGTH:
+        return cached
+    return None
+
+
+def _write_cache(cache_file: str, cached: _Cached) -> None:
+    # the cache only saves time, failing to write it is not an error
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp = f"{cache_file}.{os.getpid()}"
+        with open(tmp, "wb") as f:
+            marshal.dump(cached, f)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
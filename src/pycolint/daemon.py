@@ -0,0 +1,144 @@
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+from collections.abc import Callable
+
+from .client import default_socket_path, is_private_directory
+from .config import Config, ConfigError, find_pyproject, load_config
+from .error_msgs import problem_map, render_msgs, render_summary
+from .parser import Problem, create_parser
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "LintServer"
+    # seconds a client may take to send its request, the server
+    # handles one connection at a time
+    timeout = 5.0
+
+    def handle(self) -> None:
+        try:
+            data = self.rfile.read()
+        except OSError:
+            return
+        if not data:
+            # connected without a request, e.g., to check for a daemon
+            return
+        try:
+            request = json.loads(data)
+            response = self.server.lint(
+                request["msg"],
+                bool(request.get("summary")),
+                request.get("cwd"),
+                request.get("config"),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            response = {"error": f"invalid request: {e}"}
+        except ConfigError as e:
+            response = {"error": str(e)}
+        try:
+            self.wfile.write(json.dumps(response).encode())
+        except OSError:
+            # the client gave up waiting
+            pass
+
+
+class LintServer(socketserver.UnixStreamServer):
+    """
+    Lints messages sent to a Unix socket with a parser that is
+    created once.
+
+    A request is a JSON object `{"msg": ..., "summary": ..., "cwd": ...}`
+    sent before shutting down the writing side of the connection. The
+    response holds the problems as `[name, line, column]` and the
+    rendered `text`, see `pycolint.client`. Messages are checked
+    against the configuration in the request's `config` file or the
+    one found from `cwd`, unless a `parse` function is given.
+
+    The socket is created in a directory only the current user can
+    access, see `is_private_directory`.
+    """
+
+    def __init__(
+        self, path: str, parse: Callable[[str], list[Problem]] | None = None
+    ) -> None:
+        self.parse = parse
+        self._parsers: dict[Config, Callable[[str], list[Problem]]] = {}
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not is_private_directory(directory):
+            raise RuntimeError(f"{directory} is accessible by other users")
+        _remove_stale_socket(path)
+        umask = os.umask(0o177)
+        try:
+            super().__init__(path, _Handler)
+        finally:
+            os.umask(umask)
+
+    def config_for(self, cwd: str | None, path: str | None = None) -> Config:
+        if self.parse is not None:
+            return Config()
+        if path is not None:
+            return load_config(path)
+        path = find_pyproject(cwd) if cwd is not None else None
+        return load_config(path) if path is not None else Config()
+
+    def parser_for(self, config: Config) -> Callable[[str], list[Problem]]:
+        if self.parse is not None:
+            return self.parse
+        parse = self._parsers.get(config)
+        if parse is None:
+            parse = self._parsers[config] = create_parser(config=config)
+        return parse
+
+    def lint(
+        self,
+        msg: str,
+        summary: bool,
+        cwd: str | None = None,
+        config_path: str | None = None,
+    ) -> dict:
+        config = self.config_for(cwd, config_path)
+        problems = self.parser_for(config)(msg)
+        if summary:
+            text = render_summary(problem_map(config), msg, problems)
+        else:
+            text = render_msgs(problem_map(config), msg, problems)
+        return {
+            "problems": [[p.type.name, p.token.line, p.token.column] for p in problems],
+            "text": text,
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.server_address)  # type: ignore[arg-type]
+        except FileNotFoundError:
+            pass
+
+
+def _remove_stale_socket(path: str) -> None:
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+    raise RuntimeError(f"a daemon is already listening on {path}")
+
+
+def serve(path: str | None = None) -> None:
+    """Serve lint requests on `path` until interrupted or terminated."""
+    if path is None:
+        path = default_socket_path()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    with LintServer(path) as server:
+        print(f"pycolint daemon listening on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -1,7 +1,23 @@
+from .checks import MAX_HEADER_LENGTH
 from .problem_types import ProblemType as _P
 from .parser import Problem
+from .tokenizer import Token, end_position
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, TextIO
 import sys
 
+if TYPE_CHECKING:
+    from .config import Config
+
+_TOO_LONG_HDR = """Your header exceeded the maximum length of {} characters.
+If you have more to say, add an in-depth description of you changes in the msg body:
+
+<header>
+<empty-line>
+<body>
+"""
+
 
 DEFAULT_PROBLEM_MAP = {
     _P.EMPTY_BODY: """If you have a new line after the header you also need to add a msg body.""",
@@ -13,61 +29,148 @@ The type will have influence on automatic versioning.
 the minor version.
     """,
     _P.HDR_ENDS_IN_DOT: """The commit msg header may not end with a dot""",
-    _P.TOO_LONG_HDR: """Your header exceeded the maximum length of 50 characters.
-If you have more to say, add an in-depth description of you changes in the msg body:
-
-<header>
-<empty-line>
-<body>
-""",
+    _P.TOO_LONG_HDR: _TOO_LONG_HDR.format(MAX_HEADER_LENGTH),
     _P.MISSING_BDY_SEP: """You need to add an empty line between header and body
 <header>
 <empty-line>
 <body>""",
     _P.USE_SINGLE_WORD_FOR_SCOPE: """Scope should be specified with a single word""",
+    _P.EMPTY_SCOPE: """The scope may not be empty, leave out the parentheses instead""",
     _P.TOO_MUCH_WHITESPACE_AFTER_COLON: """The colon after the scope or type needs to\n be followed by exactly *one* space character.""",
     _P.ERROR: """Failed to parse msg""",
     _P.INVALID_TYPE: """Invalid type. Specify type like this '<type>: <summary>'""",
+    _P.UNKNOWN_TYPE: """Unknown type, the allowed types are listed in [tool.pycolint] of pyproject.toml""",
+    _P.UNKNOWN_SCOPE: """Unknown scope, the allowed scopes are listed in [tool.pycolint] of pyproject.toml""",
+    _P.PAST_TENSE: """Use the imperative in the description, e.g., 'add' instead of 'added'""",
 }
 
 
-def print_msgs(mapping: dict[_P, str], commit_msg: str, problems: list[Problem]):
+@lru_cache(maxsize=8)
+def problem_map(config: "Config | None" = None) -> dict[_P, str]:
+    """The explanations of `DEFAULT_PROBLEM_MAP` with the limits of `config`."""
+    if config is None:
+        return DEFAULT_PROBLEM_MAP
+    return {
+        **DEFAULT_PROBLEM_MAP,
+        _P.TOO_LONG_HDR: _TOO_LONG_HDR.format(config.max_header_length),
+    }
+
+
+@lru_cache(maxsize=256)
+def _layout(p_msg: str) -> tuple[str, ...]:
+    return tuple(p_msg.splitlines())
+
+
+def _explanation(mapping: dict[_P, str], p: Problem) -> str:
+    return mapping.get(p.type, p.type.name)
+
+
+def first_line(mapping: dict[_P, str], p: _P) -> str:
+    """First line of the explanation of `p`, its name if there is none."""
+    text = mapping.get(p, p.name).strip()
+    return text.splitlines()[0] if text else p.name
+
+
+def _at_end(commit_msg: str, problems: Sequence[Problem]) -> Sequence[Problem]:
+    """
+    `problems` with those found at the end of the input, e.g.,
+    EMPTY_BODY, moved to the end of the last line of `commit_msg`.
+    """
+    if all(p.token.line > 0 for p in problems):
+        return problems
+    line, column = end_position(commit_msg)
+    return [
+        p
+        if p.token.line > 0
+        else Problem(p.type, Token(p.token.kind, p.token.value, column, line))
+        for p in problems
+    ]
+
+
+def _problems_by_line(problems: Sequence[Problem]) -> dict[int, list[Problem]]:
+    by_line: dict[int, list[Problem]] = {}
+    for p in problems:
+        by_line.setdefault(p.token.line, []).append(p)
+    return by_line
+
+
+def _render_line(
+    out: list[str], mapping: dict[_P, str], line: str, problems: list[Problem]
+) -> None:
+    # problems at the end of a line after the first are one column
+    # further right, the newline counts as its first column
+    width = max(len(line) + 3, max(p.token.column for p in problems) + 2)
+    arrow_line = [" "] * width
+    cols: list[tuple[int, int, tuple[str, ...]]] = []
+    target_row = 0
+    for p in problems:
+        arrow_line[p.token.column] = "^"
+        layout = _layout(_explanation(mapping, p))
+        target_row += max(len(layout), 1) + (1 if cols else 0)
+        cols.append((p.token.column, target_row, layout))
+    out.append("".join(arrow_line))
+
+    path_lines = [[" "] * width for _ in range(target_row)]
+    for col, last_row, layout in cols:
+        for row in range(last_row):
+            path_lines[row][col] = "|"
+        bottom = path_lines[last_row - 1]
+        for c in range(col, width):
+            bottom[c] = "+" if bottom[c] == "|" else "-"
+        first_row = last_row - len(layout)
+        for row, text in enumerate(layout, first_row):
+            path_lines[row].append(text)
+    out.extend("".join(parts) for parts in path_lines)
+
+
+def render_msgs(
+    mapping: dict[_P, str], commit_msg: str, problems: Sequence[Problem]
+) -> str:
+    """
+    The lines of `commit_msg`, each followed by the explanations of
+    its problems, connected to the columns they refer to. Problems at
+    the end of a message ending in a newline follow an empty line.
+    """
+    by_line = _problems_by_line(_at_end(commit_msg, problems))
     lines = commit_msg.splitlines()
-    for nr, line in enumerate(lines):
-        print(line, file=sys.stderr)
-        local_problems = []
-        for p in problems:
-            if p.token.line - 1 == nr:
-                local_problems.append(p)
-        path_lines = []
-        cols: list[tuple[int, int, str]] = []
-
-        arrow_line = [" " for _ in range(len(line) + 3)]
-        for p_nr, (p, p_msg) in enumerate((p, mapping[p.type]) for p in local_problems):
-            arrow_line[p.token.column] = "^"
-            num_rows = len(p_msg.splitlines())
-            if len(cols) == 0:
-                target_row = 1
-            else:
-                target_row = cols[-1][1] + num_rows + 1
-            cols.append((p.token.column, target_row, p_msg))
-
-        last_row = cols[-1][1]
-        for _ in range(last_row):
-            path_lines.append([" " for _ in range(len(arrow_line))])
-        for col, last_row, msg in cols:
-            for row in range(last_row):
-                path_lines[row][col] = "|"
-            for c in range(col, len(arrow_line)):
-                if path_lines[last_row - 1][c] == "|":
-                    path_lines[last_row - 1][c] = "+"
-                else:
-                    path_lines[last_row - 1][c] = "-"
-            lines = msg.splitlines()
-            msg_height = len(lines)
-            for msg_line, line_id in enumerate(range(last_row - msg_height, last_row)):
-                path_lines[line_id].append(lines[msg_line])
-        print("".join(arrow_line), file=sys.stderr)
-
-        for msg_parts in path_lines:
-            print("".join(msg_parts), file=sys.stderr)
+    last = max(by_line, default=0)
+    lines += [""] * (last - len(lines))
+    out: list[str] = []
+    for nr, line in enumerate(lines, 1):
+        out.append(line)
+        line_problems = by_line.get(nr)
+        if line_problems:
+            _render_line(out, mapping, line, line_problems)
+    out.append("")
+    return "\n".join(out)
+
+
+def render_summary(
+    mapping: dict[_P, str], commit_msg: str, problems: Sequence[Problem]
+) -> str:
+    """One `line:column: NAME: explanation` line per problem of `commit_msg`."""
+    out = []
+    for p in _at_end(commit_msg, problems):
+        layout = _layout(_explanation(mapping, p))
+        first = layout[0] if layout else ""
+        out.append(f"{p.token.line}:{p.token.column}: {p.type.name}: {first}\n")
+    return "".join(out)
+
+
+def print_msgs(
+    mapping: dict[_P, str],
+    commit_msg: str,
+    problems: Sequence[Problem],
+    file: TextIO | None = None,
+    summary: bool = False,
+) -> None:
+    """
+    Write the problems of `commit_msg` to `file` (stderr by default)
+    in a single write. With `summary` only one line per problem is
+    written instead of the annotated message.
+    """
+    if summary:
+        text = render_summary(mapping, commit_msg, problems)
+    else:
+        text = render_msgs(mapping, commit_msg, problems)
+    (sys.stderr if file is None else file).write(text)
@@ -0,0 +1,126 @@
+import json
+from collections.abc import Sequence
+from typing import TextIO
+
+from .batch import ProblemRecord
+from .error_msgs import DEFAULT_PROBLEM_MAP, first_line
+from .problem_types import ProblemType
+from .tokenizer import end_position
+
+_SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+_SARIF_END = "]}]}"
+
+
+class JsonlWriter:
+    """
+    Writes one JSON object per linted message as soon as it is
+    written, so memory use does not depend on the number of messages.
+    Problems at the end of a message are reported at the end of its
+    last line.
+    """
+
+    def __init__(self, file: TextIO) -> None:
+        self._file = file
+
+    def write(
+        self, commit: str | None, msg: str, problems: Sequence[ProblemRecord]
+    ) -> None:
+        end = None
+        entries = []
+        for p in problems:
+            line, column = p.line, p.column
+            if line < 1:
+                if end is None:
+                    end = end_position(msg)
+                line, column = end
+            entries.append({"type": p.type.name, "line": line, "column": column})
+        record = {"commit": commit, "problems": entries}
+        self._file.write(json.dumps(record) + "\n")
+
+    def close(self) -> None:
+        self._file.flush()
+
+
+class SarifWriter:
+    """
+    Writes a SARIF 2.1.0 log with one result per problem.
+
+    Results are written as they arrive and the log is completed by
+    `close`, so only the result being written is held in memory.
+    Problems of commits carry the commit id in their `properties`.
+    """
+
+    def __init__(self, file: TextIO, uri: str = "COMMIT_EDITMSG") -> None:
+        from .cache import pycolint_version
+
+        self._file = file
+        self._uri = uri
+        self._num_results = 0
+        rules = [
+            {
+                "id": p.name,
+                "shortDescription": {"text": first_line(DEFAULT_PROBLEM_MAP, p)},
+                **(
+                    {"fullDescription": {"text": DEFAULT_PROBLEM_MAP[p].strip()}}
+                    if p in DEFAULT_PROBLEM_MAP
+                    else {}
+                ),
+            }
+            for p in ProblemType
+        ]
+        self._rule_index = {p: i for i, p in enumerate(ProblemType)}
+        driver = {
+            "name": "pycolint",
+            "version": pycolint_version(),
+            "informationUri": "https://github.com/glencoe/pycolint",
+            "rules": rules,
+        }
+        log = json.dumps(
+            {
+                "$schema": _SARIF_SCHEMA,
+                "version": "2.1.0",
+                "runs": [{"tool": {"driver": driver}, "results": []}],
+            }
+        )
+        # write everything up to the opening bracket of the results,
+        # `write` adds the results and `close` the closing brackets
+        self._file.write(log[: -len(_SARIF_END)])
+
+    def _result(self, commit: str | None, p: ProblemRecord) -> dict:
+        location: dict = {"artifactLocation": {"uri": self._uri}}
+        if p.line > 0 and p.column > 0:
+            location["region"] = {"startLine": p.line, "startColumn": p.column}
+        result = {
+            "ruleId": p.type.name,
+            "ruleIndex": self._rule_index[p.type],
+            "level": "error",
+            "message": {"text": first_line(DEFAULT_PROBLEM_MAP, p.type)},
+            "locations": [{"physicalLocation": location}],
+        }
+        if commit is not None:
+            result["properties"] = {"commit": commit}
+        return result
+
+    def write(
+        self, commit: str | None, msg: str, problems: Sequence[ProblemRecord]
+    ) -> None:
+        for p in problems:
+            if self._num_results > 0:
+                self._file.write(",")
+            self._file.write(json.dumps(self._result(commit, p)))
+            self._num_results += 1
+
+    def close(self) -> None:
+        self._file.write(_SARIF_END + "\n")
+        self._file.flush()
+
+
+Writer = JsonlWriter | SarifWriter
+
+
+def create_writer(fmt: str, file: TextIO) -> Writer:
+    if fmt == "jsonl":
+        return JsonlWriter(file)
+    if fmt == "sarif":
+        return SarifWriter(file)
+    raise ValueError(f"no writer for format {fmt!r}")
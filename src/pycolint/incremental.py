@@ -0,0 +1,172 @@
+"""
+Re-lint a message after edits without parsing it from the start.
+
+The table driver reports its state whenever it reaches the first token
+of a line. A `Session` keeps a copy of these states and after an edit
+continues parsing from the last line that begins before the edited
+range, tokenizing the text from there on only as far as the parser
+reads. Editing the body thus never runs the rules of the header again.
+"""
+
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from typing import NamedTuple
+
+from .checks import Check, CheckSet, enabled_checks
+from .config import Config, check_header
+from .parser import Expression, ExpressionType, Grammar, Problem
+from .table import (
+    RunState,
+    Table,
+    compile_table,
+    default_table,
+    initial_state,
+    run,
+)
+from .tokenizer import Kind as T, Token, Tokenizer
+
+_EOF = Token(T.EOF, value="", column=-1, line=-1)
+
+
+class Snapshot(NamedTuple):
+    offset: int
+    line: int
+    stack: tuple[Expression | Token, ...]
+    lhs_start: dict[ExpressionType, int]
+    num_problems: int
+
+
+class Session:
+    """
+    A message that is edited and linted after every edit, e.g., by
+    an editor while the user types.
+
+    `edit` replaces a range of the text and returns the problems of
+    the new text, which are the same `create_parser(check_body=True)`
+    finds, editors show the problems of the body as well. Offsets
+    are indices into `text`. A `grammar` other than the default one
+    has to be compilable, see `TransitionTable`. Types and scopes are
+    checked against `config`, if given, and `checks` default to the
+    ones `config` enables, like for `create_parser`.
+
+    `apply` edits without linting, the text is linted once the
+    `problems` are asked for, so a burst of edits is linted only once.
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        grammar: Grammar | None = None,
+        config: Config | None = None,
+        checks: Iterable[Check] | None = None,
+    ) -> None:
+        self._table: Table = (
+            default_table() if grammar is None else compile_table(grammar)
+        )
+        self._tokenizer = Tokenizer()
+        check_set = CheckSet(enabled_checks(config) if checks is None else checks)
+        self._checks = check_set if len(check_set.checks) > 0 else None
+        self._text_checks = check_set if len(check_set.texts) > 0 else None
+        self._config = config if config is not None and config.checks_header else None
+        self._text = ""
+        self._problems: list[Problem] = []
+        self._snapshots: list[Snapshot] = []
+        # offset where the line of the last token handed to the parser begins
+        self._line_offset = 0
+        self._last = _EOF
+        # the parser did not read the text from here on, if not None
+        self._unread_from: int | None = None
+        # snapshot to continue parsing from before returning problems
+        self._resume_from: int | None = None
+        self.replace(text)
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def problems(self) -> list[Problem]:
+        if self._resume_from is not None:
+            self._resume(self._resume_from)
+            self._resume_from = None
+        problems = []
+        if self._config is not None:
+            problems = check_header(self._config, self._text)
+        if self._text_checks is not None:
+            checks = self._text_checks
+            checks.apply(self._text, checks.texts, problems)
+        return problems + self._problems
+
+    def replace(self, text: str) -> list[Problem]:
+        """Lint `text` from scratch."""
+        self._text = text
+        self._snapshots = [Snapshot(0, 1, *_freeze(initial_state()))]
+        self._resume_from = 0
+        return self.problems
+
+    def edit(self, start: int, end: int, new_text: str) -> list[Problem]:
+        """
+        Replace `text[start:end]` by `new_text` and lint the result.
+        """
+        self.apply(start, end, new_text)
+        return self.problems
+
+    def apply(self, start: int, end: int, new_text: str) -> None:
+        """Replace `text[start:end]` by `new_text`."""
+        if not 0 <= start <= end <= len(self._text):
+            raise ValueError(
+                f"range {start}:{end} outside of text of length {len(self._text)}"
+            )
+        self._text = self._text[:start] + new_text + self._text[end:]
+        if (
+            self._resume_from is None
+            and self._unread_from is not None
+            and start >= self._unread_from
+        ):
+            return
+        # a snapshot stays valid as long as the text before it is unchanged
+        i = len(self._snapshots) - 1
+        while self._snapshots[i].offset > start:
+            i -= 1
+        del self._snapshots[i + 1 :]
+        self._resume_from = i
+
+    def _resume(self, i: int) -> None:
+        snapshot = self._snapshots[i]
+        state = RunState(
+            list(snapshot.stack),
+            dict(snapshot.lhs_start),
+            self._problems[: snapshot.num_problems],
+        )
+        self._problems = state.problems
+        tokens = chain(self._tokens(snapshot.offset, snapshot.line), (_EOF,))
+        run(self._table, tokens, state, self._on_line, self._checks)
+        # tokens up to a newline do not depend on the text after it
+        last = self._last
+        self._unread_from = self._end_of(last) if last.kind == T.NL else None
+
+    def _tokens(self, offset: int, line: int) -> Iterator[Token]:
+        self._line_offset = offset
+        for t in self._tokenizer.iter_tokens(self._text, offset, line):
+            self._last = t
+            yield t
+            if t.kind == T.NL:
+                self._line_offset = self._end_of(t)
+
+    def _end_of(self, newline: Token) -> int:
+        """Offset after `newline`, a token of the current line."""
+        # columns of lines after the first count from the newline
+        start = self._line_offset + newline.column - (2 if newline.line > 1 else 1)
+        return start + 1
+
+    def _on_line(self, state: RunState, current: Token) -> None:
+        if current.kind != T.EOF:
+            self._snapshots.append(
+                Snapshot(self._line_offset, current.line, *_freeze(state))
+            )
+
+
+def _freeze(
+    state: RunState,
+) -> tuple[tuple[Expression | Token, ...], dict[ExpressionType, int], int]:
+    return tuple(state.stack), dict(state.lhs_start), len(state.problems)
@@ -0,0 +1,343 @@
+"""
+Language server for commit messages, started by `pycolint --lsp`.
+
+Speaks the Language Server Protocol over stdin and stdout and publishes
+the problems of the open documents as diagnostics. Each document is
+linted by an incremental `Session`. Changes are applied as they arrive
+and diagnostics are published once no further change arrived for
+`debounce` seconds, so a burst of keystrokes is linted only once.
+"""
+
+import json
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from typing import BinaryIO
+from urllib.parse import unquote, urlparse
+
+from .config import Config, ConfigError, find_pyproject, load_config
+from .error_msgs import DEFAULT_PROBLEM_MAP, first_line, problem_map
+from .incremental import Session
+from .parser import Problem
+from .problem_types import ProblemType
+
+DEBOUNCE = 0.05
+
+# error codes of JSON-RPC
+_PARSE_ERROR = -32700
+_INVALID_REQUEST = -32600
+_METHOD_NOT_FOUND = -32601
+_INVALID_PARAMS = -32602
+
+# text document sync kind sending only the changed ranges
+_INCREMENTAL = 2
+_SEVERITY_ERROR = 1
+
+_NEWLINE = re.compile(r"\r\n|\r|\n")
+
+
+def read_message(stream: BinaryIO) -> dict | None:
+    """
+    Read a message framed by a `Content-Length` header, None at the
+    end of the input.
+    """
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    if length is None:
+        raise ValueError("message without Content-Length")
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    return json.loads(body)
+
+
+def write_message(stream: BinaryIO, message: dict) -> None:
+    body = json.dumps(message).encode()
+    stream.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    stream.flush()
+
+
+def config_for(uri: str) -> Config:
+    """
+    The configuration of the project containing the document at `uri`.
+    The default `Config` for documents that are not files or that are
+    configured invalidly.
+    """
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return Config()
+    path = find_pyproject(os.path.dirname(unquote(parsed.path)))
+    if path is None:
+        return Config()
+    try:
+        return load_config(path)
+    except ConfigError:
+        return Config()
+
+
+def _line_bounds(text: str, line: int) -> tuple[int, int]:
+    """Start and end offset of the zero based `line`, clamped to `text`."""
+    start = 0
+    if line > 0:
+        start = len(text)
+        for i, mo in enumerate(_NEWLINE.finditer(text), 1):
+            if i == line:
+                start = mo.end()
+                break
+    end = _NEWLINE.search(text, start)
+    return start, end.start() if end is not None else len(text)
+
+
+def _units(s: str, utf16: bool) -> int:
+    if not utf16:
+        return len(s)
+    return len(s) + sum(1 for c in s if ord(c) > 0xFFFF)
+
+
+def offset(text: str, position: dict, utf16: bool = True) -> int:
+    """Offset in `text` of an LSP `position`."""
+    start, end = _line_bounds(text, position["line"])
+    character = position["character"]
+    if not utf16:
+        return min(start + character, end)
+    units = 0
+    for i in range(start, end):
+        if units >= character:
+            return i
+        units += 2 if ord(text[i]) > 0xFFFF else 1
+    return end
+
+
+def diagnostics(
+    text: str,
+    problems: list[Problem],
+    utf16: bool = True,
+    mapping: dict[ProblemType, str] = DEFAULT_PROBLEM_MAP,
+) -> list[dict]:
+    """The `problems` of `text` as LSP diagnostics explained by `mapping`."""
+    result = []
+    for p in problems:
+        t = p.token
+        if t.line < 1:
+            # end of file
+            line = len(_NEWLINE.findall(text))
+            index = None
+        else:
+            line = t.line - 1
+            # columns of lines after the first count from the newline
+            index = t.column - (1 if t.line == 1 else 2)
+        start, end = _line_bounds(text, line)
+        line_text = text[start:end]
+        if index is None:
+            index = len(line_text)
+        index = min(index, len(line_text))
+        stop = min(index + len(t.value), len(line_text))
+        result.append(
+            {
+                "range": {
+                    "start": {
+                        "line": line,
+                        "character": _units(line_text[:index], utf16),
+                    },
+                    "end": {"line": line, "character": _units(line_text[:stop], utf16)},
+                },
+                "severity": _SEVERITY_ERROR,
+                "code": p.type.name,
+                "source": "pycolint",
+                "message": first_line(mapping, p.type),
+            }
+        )
+    return result
+
+
+class LanguageServer:
+    """
+    Handles the messages of one client and writes responses and
+    notifications to `out`. All documents share the prebuilt parse
+    table of the default grammar.
+    """
+
+    def __init__(self, out: BinaryIO, debounce: float = DEBOUNCE) -> None:
+        self._out = out
+        self._debounce = debounce
+        self._documents: dict[str, Session] = {}
+        self._versions: dict[str, int | None] = {}
+        self._configs: dict[str, Config] = {}
+        # time at which to publish the diagnostics of changed documents
+        self._due: dict[str, float] = {}
+        self._utf16 = True
+        self._shutdown = False
+        self.exit_code: int | None = None
+
+    def next_deadline(self) -> float | None:
+        return min(self._due.values(), default=None)
+
+    def publish_due(self, now: float) -> None:
+        for uri, due in list(self._due.items()):
+            if due <= now:
+                del self._due[uri]
+                self._publish(uri)
+
+    def handle(self, message: dict) -> None:
+        if not isinstance(message, dict):
+            self.error(None, _INVALID_REQUEST, "message is not an object")
+            return
+        try:
+            self._handle(message)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            # notifications can not be answered, invalid ones are dropped
+            if "id" in message:
+                self.error(message["id"], _INVALID_PARAMS, f"invalid params: {e}")
+
+    def _handle(self, message: dict) -> None:
+        method = message.get("method")
+        params = message.get("params") or {}
+        if "id" in message and method is not None:
+            self._handle_request(message["id"], method, params)
+            return
+        if method == "exit":
+            self.exit_code = 0 if self._shutdown else 1
+        elif method == "textDocument/didOpen":
+            doc = params["textDocument"]
+            config = self._configs[doc["uri"]] = config_for(doc["uri"])
+            self._documents[doc["uri"]] = Session(doc["text"], config=config)
+            self._versions[doc["uri"]] = doc.get("version")
+            self._due.pop(doc["uri"], None)
+            self._publish(doc["uri"])
+        elif method == "textDocument/didChange":
+            self._change(params)
+        elif method == "textDocument/didClose":
+            uri = params["textDocument"]["uri"]
+            self._documents.pop(uri, None)
+            self._versions.pop(uri, None)
+            self._configs.pop(uri, None)
+            self._due.pop(uri, None)
+            self._notify(
+                "textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []}
+            )
+
+    def error(self, id: int | str | None, code: int, text: str) -> None:
+        write_message(
+            self._out,
+            {"jsonrpc": "2.0", "id": id, "error": {"code": code, "message": text}},
+        )
+
+    def _handle_request(self, id: int | str, method: str, params: dict) -> None:
+        if method == "initialize":
+            result = self._initialize(params)
+        elif method == "shutdown":
+            self._shutdown = True
+            result = None
+        else:
+            self.error(id, _METHOD_NOT_FOUND, f"method not found: {method}")
+            return
+        write_message(self._out, {"jsonrpc": "2.0", "id": id, "result": result})
+
+    def _initialize(self, params: dict) -> dict:
+        from .cache import pycolint_version
+
+        general = (params.get("capabilities") or {}).get("general") or {}
+        encodings = general.get("positionEncodings") or []
+        self._utf16 = "utf-32" not in encodings
+        return {
+            "capabilities": {
+                "positionEncoding": "utf-16" if self._utf16 else "utf-32",
+                "textDocumentSync": {"openClose": True, "change": _INCREMENTAL},
+            },
+            "serverInfo": {"name": "pycolint", "version": pycolint_version()},
+        }
+
+    def _change(self, params: dict) -> None:
+        doc = params["textDocument"]
+        session = self._documents.get(doc["uri"])
+        if session is None:
+            return
+        for change in params["contentChanges"]:
+            text = session.text
+            if "range" in change:
+                start = offset(text, change["range"]["start"], self._utf16)
+                end = offset(text, change["range"]["end"], self._utf16)
+            else:
+                start, end = 0, len(text)
+            session.apply(start, end, change["text"])
+        self._versions[doc["uri"]] = doc.get("version")
+        self._due[doc["uri"]] = time.monotonic() + self._debounce
+
+    def _publish(self, uri: str) -> None:
+        session = self._documents[uri]
+        params: dict = {
+            "uri": uri,
+            "diagnostics": diagnostics(
+                session.text,
+                session.problems,
+                self._utf16,
+                problem_map(self._configs.get(uri)),
+            ),
+        }
+        if self._versions.get(uri) is not None:
+            params["version"] = self._versions[uri]
+        self._notify("textDocument/publishDiagnostics", params)
+
+    def _notify(self, method: str, params: dict) -> None:
+        write_message(self._out, {"jsonrpc": "2.0", "method": method, "params": params})
+
+
+def _read_all(stream: BinaryIO, incoming: queue.Queue) -> None:
+    while True:
+        try:
+            message = read_message(stream)
+        except ValueError as e:
+            incoming.put(e)
+            continue
+        incoming.put(message)
+        if message is None:
+            return
+
+
+def serve(
+    stdin: BinaryIO | None = None,
+    stdout: BinaryIO | None = None,
+    debounce: float = DEBOUNCE,
+) -> int:
+    """
+    Serve one client on `stdin` and `stdout` until it exits. Returns
+    the exit code the protocol asks for.
+    """
+    if stdin is None:
+        # not sys.stdin, the interpreter waits for its lock when exiting
+        # while the reading thread blocks on it
+        stdin = open(sys.stdin.fileno(), "rb", closefd=False)
+    stdout = sys.stdout.buffer if stdout is None else stdout
+    # messages are read by a thread, so waiting for the next message
+    # can time out when diagnostics are due
+    incoming: queue.Queue = queue.Queue()
+    threading.Thread(target=_read_all, args=(stdin, incoming), daemon=True).start()
+    server = LanguageServer(stdout, debounce)
+    while server.exit_code is None:
+        deadline = server.next_deadline()
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+        try:
+            message = incoming.get(timeout=timeout)
+        except queue.Empty:
+            pass
+        else:
+            if message is None:
+                message = {"method": "exit"}
+            if isinstance(message, ValueError):
+                server.error(None, _PARSE_ERROR, str(message))
+            else:
+                server.handle(message)
+        server.publish_due(time.monotonic())
+    return server.exit_code
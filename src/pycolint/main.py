@@ -1,13 +1,261 @@
-from .parser import create_parser
-from .error_msgs import print_msgs, DEFAULT_PROBLEM_MAP
+"""
+Command line interface.
+
+Only the modules needed for the selected mode are imported, linting
+a single message in a commit-msg hook should not pay for the history,
+cache, output format or daemon support.
+"""
+
+import argparse
 import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cache import ResultCache
+    from .config import Config
+    from .formats import Writer
+    from .stats import ParseStats
+
+FORMATS = ("text", "jsonl", "sarif")
+
+
+def _at_least(minimum: int):
+    """argparse type for integers of at least `minimum`."""
+
+    def parse(value: str) -> int:
+        try:
+            n = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+        if n < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}: {n}")
+        return n
+
+    return parse
+
+
+def _create_arg_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="pycolint", description="Lint a conventional commit message."
+    )
+    # the message starts at the first positional argument, its words are
+    # never options, e.g., in `pycolint fix: drop the --all flag`
+    p.add_argument(
+        "msg",
+        nargs=argparse.REMAINDER,
+        help="the commit message, options have to precede it",
+    )
+    p.add_argument(
+        "--trace",
+        action="store_true",
+        help="print the rules applied by the parser to stderr",
+    )
+    p.add_argument(
+        "--stats",
+        nargs="?",
+        const="table",
+        choices=["table", "json"],
+        help="print how often each rule of the parser is tried and fired"
+        " and the time spent in the rules to stderr, as table (default) or json",
+    )
+    p.add_argument(
+        "--summary",
+        action="store_true",
+        help="print one line per problem instead of the annotated message",
+    )
+    p.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="text",
+        help="output format, jsonl and sarif are written to stdout (default: text)",
+    )
+    p.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep a parser running and lint the messages sent by pycolint-client",
+    )
+    p.add_argument(
+        "--lsp",
+        action="store_true",
+        help="run a language server on stdin and stdout publishing the problems"
+        " of open commit messages as diagnostics",
+    )
+    p.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="socket of the daemon (default: $XDG_RUNTIME_DIR/pycolint-<uid>.sock"
+        " or /tmp/pycolint-<uid>/daemon.sock)",
+    )
+    p.add_argument(
+        "--config",
+        metavar="PATH",
+        help="pyproject.toml with the [tool.pycolint] configuration"
+        " (default: the closest one in the current directory or its parents)",
+    )
+    history = p.add_mutually_exclusive_group()
+    history.add_argument(
+        "--range",
+        metavar="REV_RANGE",
+        help="lint the messages of all commits in a git revision range, e.g., main..HEAD",
+    )
+    history.add_argument(
+        "--all",
+        action="store_true",
+        help="lint the messages of all commits reachable from any git ref",
+    )
+    p.add_argument(
+        "--jobs",
+        "-j",
+        type=_at_least(0),
+        default=1,
+        metavar="N",
+        help="number of processes linting commits for --range and --all, 0 uses all CPUs",
+    )
+    p.add_argument(
+        "--chunk-size",
+        type=_at_least(1),
+        default=256,
+        metavar="N",
+        help="number of messages sent to a process at once",
+    )
+    p.add_argument(
+        "--cache",
+        nargs="?",
+        const=True,
+        metavar="PATH",
+        help="reuse results of commits linted before from an sqlite database"
+        " (default: $XDG_CACHE_HOME/pycolint/results.sqlite)",
+    )
+    return p
+
+
+def _print_stats(stats: "ParseStats", fmt: str) -> None:
+    from .parser import default_grammar
+
+    if fmt == "json":
+        print(stats.dump_json(default_grammar()), file=sys.stderr)
+    else:
+        print(stats.dump(default_grammar()), file=sys.stderr)
+
 
+def _lint_history(
+    revisions: list[str],
+    jobs: int,
+    chunk_size: int,
+    cache: "ResultCache | None",
+    stats: "ParseStats | None" = None,
+    writer: "Writer | None" = None,
+    config: "Config | None" = None,
+) -> int:
+    import subprocess
 
-def main():
-    msg = " ".join(sys.argv[1:])
-    parse = create_parser()
+    from .batch import lint_history
+
+    num_failed = 0
+    num_commits = 0
+    try:
+        for result in lint_history(
+            revisions,
+            jobs=jobs,
+            chunk_size=chunk_size,
+            cache=cache,
+            stats=stats,
+            config=config,
+        ):
+            num_commits += 1
+            if len(result.problems) > 0:
+                num_failed += 1
+            if writer is not None:
+                writer.write(result.sha, result.msg, result.problems)
+                continue
+            for p in result.problems:
+                print(f"{result.sha}:{p.line}:{p.column}: {p.type.name}")
+    except subprocess.CalledProcessError as e:
+        print(f"pycolint: {' '.join(e.cmd)} failed", file=sys.stderr)
+        return 2
+    finally:
+        if writer is not None:
+            writer.close()
+    print(f"{num_failed} of {num_commits} commits have problems", file=sys.stderr)
+    if cache is not None:
+        print(f"cache: {cache.hits} hits, {cache.misses} misses", file=sys.stderr)
+    return 1 if num_failed > 0 else 0
+
+
+def main(argv: list[str] | None = None):
+    args = _create_arg_parser().parse_args(argv)
+    if args.daemon:
+        from .daemon import serve
+
+        try:
+            serve(args.socket)
+        except RuntimeError as e:
+            print(f"pycolint: {e}", file=sys.stderr)
+            exit(2)
+        return
+    if args.lsp:
+        from .lsp import serve as serve_lsp
+
+        exit(serve_lsp())
+    from .config import ConfigError, load_config
+
+    try:
+        config = load_config(args.config)
+    except ConfigError as e:
+        print(f"pycolint: {e}", file=sys.stderr)
+        exit(2)
+    stats = None
+    if args.stats is not None:
+        from .stats import ParseStats
+
+        stats = ParseStats()
+    writer = None
+    if args.format != "text":
+        from .formats import create_writer
+
+        writer = create_writer(args.format, sys.stdout)
+    if args.range is not None or args.all:
+        revisions = [args.range] if args.range is not None else ["--all"]
+        if args.cache is None:
+            code = _lint_history(
+                revisions, args.jobs, args.chunk_size, None, stats, writer, config
+            )
+        else:
+            from .cache import ResultCache, default_cache_path
+
+            path = default_cache_path() if args.cache is True else args.cache
+            with ResultCache(path, config_hash=config.digest()) as cache:
+                code = _lint_history(
+                    revisions, args.jobs, args.chunk_size, cache, stats, writer, config
+                )
+        if stats is not None:
+            _print_stats(stats, args.stats)
+        exit(code)
+    from .parser import create_parser
+
+    if args.msg[:1] == ["--"]:
+        args.msg = args.msg[1:]
+    msg = " ".join(args.msg)
+    trace = None
+    if args.trace:
+        from .trace import TraceRecorder
+
+        trace = TraceRecorder()
+    parse = create_parser(trace=trace, stats=stats, config=config)
     problems = parse(msg)
-    print_msgs(DEFAULT_PROBLEM_MAP, msg, problems)
+    if trace is not None:
+        print(trace.dump(), file=sys.stderr)
+    if stats is not None:
+        _print_stats(stats, args.stats)
+    if writer is not None:
+        from .batch import ProblemRecord
+
+        writer.write(None, msg, [ProblemRecord.from_problem(p) for p in problems])
+        writer.close()
+    else:
+        from .error_msgs import print_msgs, problem_map
+
+        print_msgs(problem_map(config), msg, problems, summary=args.summary)
     if len(problems) > 0:
         exit(1)
 
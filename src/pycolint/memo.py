@@ -0,0 +1,88 @@
+import sys
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple
+
+from .parser import Problem
+from .problem_types import ProblemType as P
+from .tokenizer import Kind as T, Token
+
+
+class MemoStats(NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+def _problem_size() -> int:
+    token = Token(T.WORD, "", 0, 0)
+    return sys.getsizeof(Problem(P.ERROR, token)) + sys.getsizeof(token)
+
+
+# estimate, the values of tokens are not counted
+_PROBLEM_SIZE = _problem_size()
+
+
+class MemoizedParse:
+    """
+    Remembers the problems of recently parsed messages.
+
+    Identical messages, e.g., merge commits or bot generated
+    messages, are only parsed once. The least recently used results
+    are dropped as soon as more than `max_entries` messages are stored
+    or the stored messages and problems take more than `max_size`
+    bytes. Problems are immutable, so the cached ones are shared
+    between all callers, only the returned list is new.
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[str], list[Problem]],
+        max_entries: int = 4096,
+        max_size: int = 16 * 2**20,
+    ) -> None:
+        self._parse = parse
+        self._max_entries = max_entries
+        self._max_size = max_size
+        self._results: OrderedDict[str, tuple[Problem, ...]] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _entry_size(msg: str, problems: tuple[Problem, ...]) -> int:
+        return sys.getsizeof(msg) + _PROBLEM_SIZE * len(problems)
+
+    def __call__(self, msg: str) -> list[Problem]:
+        results = self._results
+        try:
+            problems = results[msg]
+        except KeyError:
+            pass
+        else:
+            self._hits += 1
+            results.move_to_end(msg)
+            return list(problems)
+        self._misses += 1
+        problems = tuple(self._parse(msg))
+        size = self._entry_size(msg, problems)
+        if size <= self._max_size:
+            results[msg] = problems
+            self._size += size
+            while len(results) > self._max_entries or self._size > self._max_size:
+                old_msg, old_problems = results.popitem(last=False)
+                self._size -= self._entry_size(old_msg, old_problems)
+        return list(problems)
+
+    def stats(self) -> MemoStats:
+        return MemoStats(self._hits, self._misses, len(self._results), self._size)
+
+    def clear(self) -> None:
+        self._results.clear()
+        self._size = 0
@@ -1,10 +1,23 @@
-from functools import partial, singledispatch, singledispatchmethod
+from functools import cache, partial, singledispatch
+from itertools import chain
+import re
+from time import perf_counter_ns
 from enum import Enum, auto
-from typing import NamedTuple, Union, Callable
-from dataclasses import dataclass
-from .tokenizer import Token, Kind as T, tokenize
+from typing import TYPE_CHECKING, NamedTuple, Union, Callable
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from .tokenizer import Token, Tokenizer, Kind as T, iter_tokens
 import logging
 from .problem_types import ProblemType as P
+from .trace import TraceEntry, TraceRecorder
+from .validator import is_valid_message
+
+if TYPE_CHECKING:
+    from .checks import Check, CheckSet
+    from .config import Config
+    from .stats import ParseStats
+
+_log = logging.getLogger(__name__)
 
 
 class ExpressionType(Enum):
@@ -24,7 +37,7 @@ class ExpressionType(Enum):
 _E = ExpressionType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Problem:
     type: P
     token: Token
@@ -38,20 +51,26 @@ class Expression(NamedTuple):
 class Stack:
     def __init__(self) -> None:
         self.data: list[Expression | Token] = []
+        self._expression_positions: list[int] = []
 
     def push(self, x: Expression | Token) -> None:
+        if isinstance(x, Expression):
+            self._expression_positions.append(len(self.data))
         self.data.append(x)
 
     def pop(self) -> Expression | Token:
-        return self.data.pop(-1)
+        x = self.data.pop(-1)
+        positions = self._expression_positions
+        if positions and positions[-1] == len(self.data):
+            positions.pop()
+        return x
 
     def get_expressions(self) -> tuple[Expression, ...]:
-        return tuple(e for e in self.data if isinstance(e, Expression))
+        return tuple(self.data[i] for i in self._expression_positions)  # type: ignore[misc]
 
     def last_expression(self) -> Expression | None:
-        exprs = self.get_expressions()
-        if len(exprs) > 0:
-            return exprs[-1]
+        if len(self._expression_positions) > 0:
+            return self.data[self._expression_positions[-1]]  # type: ignore[return-value]
         return None
 
     def reduce(
@@ -60,28 +79,46 @@ class Stack:
         remove: int,
         select: tuple[int, ...],
     ) -> None:
-        removed = list(reversed([self.pop() for _ in range(remove)]))
-        selected = []
-        for s in select:
-            selected.append(removed[s])
-        self.push(Expression(exp, selected))
+        if remove > len(self.data):
+            raise IndexError("reduce more symbols than on stack")
+        cut = len(self.data) - max(remove, 0)
+        removed = self.data[cut:]
+        del self.data[cut:]
+        positions = self._expression_positions
+        while positions and positions[-1] >= cut:
+            positions.pop()
+        self.push(Expression(exp, [removed[s] for s in select]))
 
     def top(self) -> Expression | Token:
         return self.data[-1]
 
+    def __len__(self) -> int:
+        return len(self.data)
+
 
 class TokenQueue:
-    def __init__(self, data: list[Token]):
-        self._data = data
+    """
+    Read only view of the tokens with a cursor pointing to
+    the current token.
+
+    Tokens are pulled from `data` one at a time when advancing,
+    so `data` may be a lazy iterator.
+    """
+
+    def __init__(self, data: Iterable[Token]):
+        self._data = iter(data)
+        self._current: Token | None = next(self._data, None)
 
     def current(self) -> Token:
-        return self._data[0]
+        if self._current is None:
+            raise IndexError("no tokens left")
+        return self._current
 
     def advance(self) -> None:
-        self._data.pop(0)
+        self._current = next(self._data, None)
 
     def before_eof(self) -> bool:
-        return self._data[0].kind == T.EOF
+        return self.current().kind == T.EOF
 
 
 class ProblemList:
@@ -89,20 +126,85 @@ class ProblemList:
         self._q = q
         self._data = data
 
+    @property
+    def data(self) -> list[Problem]:
+        return self._data
+
     def add_problem(self, p: P) -> None:
         self._data.append(Problem(p, self._q.current()))
 
 
+Matcher = Callable[[Expression | ExpressionType | Token | T], bool]
+
+
+@singledispatch
+def create_matcher(left) -> Matcher:
+    raise TypeError(f"can not match against {left!r}")
+
+
+@create_matcher.register
+def _(left: Expression) -> Matcher:
+    def m(right) -> bool:
+        return isinstance(right, Expression) and left == right
+
+    return m
+
+
+@create_matcher.register
+def _(left: ExpressionType) -> Matcher:
+    def m(right) -> bool:
+        if isinstance(right, Expression):
+            return left == right.type
+        return left == right
+
+    return m
+
+
+@create_matcher.register
+def _(left: T) -> Matcher:
+    def m(right) -> bool:
+        if isinstance(right, Token):
+            return left == right.kind
+        return left == right
+
+    return m
+
+
+@create_matcher.register
+def _(left: Token) -> Matcher:
+    def m(right) -> bool:
+        return isinstance(right, Token) and left == right
+
+    return m
+
+
+@create_matcher.register
+def _(left: None) -> Matcher:
+    def m(right) -> bool:
+        return True
+
+    return m
+
+
 @dataclass
 class Rule:
     """
     Empty set matches nothing, None matches everything
+
+    The matchers for top of stack and current token are created
+    once, when the rule is constructed.
     """
 
     top_of_stack: Expression | ExpressionType | None | Token | T
     current_token: Token | T | None
     applicable_lhs: ExpressionType
-    fn: Callable[[], None]
+    fn: Callable[["Parser"], None]
+    match_top_of_stack: Matcher = field(init=False, repr=False, compare=False)
+    match_current_token: Matcher = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.match_top_of_stack = create_matcher(self.top_of_stack)
+        self.match_current_token = create_matcher(self.current_token)
 
     def __str__(self) -> str:
         def get_simplified_str(item) -> str:
@@ -124,29 +226,163 @@ class Rule:
         return f"Rule:\n\ttop: {top}\n\tcurrent_token: {ct}\n\tapplicable lhs: {applicable_lhs}"
 
 
-class Parser:
+def _pattern_key(pattern) -> ExpressionType | T | None:
+    if isinstance(pattern, Expression):
+        return pattern.type
+    if isinstance(pattern, Token):
+        return pattern.kind
+    return pattern
+
+
+def _is_value_pattern(pattern) -> bool:
+    return isinstance(pattern, (Expression, Token))
+
+
+class RuleIndex:
+    """
+    Rules bucketed by (top of stack kind, current token kind).
+
+    A bucket holds every rule that can match the pair, including
+    the `None` wildcards, in registration order. Looking up a rule
+    thus only scans the handful of rules relevant for the current
+    step, while the first registered rule still wins.
+    """
+
     def __init__(self) -> None:
-        self._log = logging.getLogger(__name__)
+        self._rules: list[Rule] = []
+        self._buckets: dict[tuple[ExpressionType | T, T], tuple[Rule, ...]] = {}
+
+    def add(self, rule: Rule) -> None:
+        self._rules.append(rule)
+        self._buckets.clear()
+
+    def _bucket(self, top: ExpressionType | T, current: T) -> tuple[Rule, ...]:
+        return tuple(
+            r
+            for r in self._rules
+            if _pattern_key(r.top_of_stack) in (top, None)
+            and _pattern_key(r.current_token) in (current, None)
+        )
+
+    def find(
+        self,
+        top: Expression | Token,
+        current: Token,
+        active_lhs: dict[ExpressionType, int],
+    ) -> tuple[tuple[Rule, ...], int]:
+        """
+        The bucket of candidate rules and the position of the first
+        matching one in it, -1 if none matches.
+        """
+        key = (top.type if isinstance(top, Expression) else top.kind, current.kind)
+        try:
+            bucket = self._buckets[key]
+        except KeyError:
+            bucket = self._bucket(*key)
+            self._buckets[key] = bucket
+        for i, r in enumerate(bucket):
+            if r.applicable_lhs is not None and r.applicable_lhs not in active_lhs:
+                continue
+            if _is_value_pattern(r.top_of_stack) and not r.match_top_of_stack(top):
+                continue
+            if _is_value_pattern(r.current_token) and not r.match_current_token(
+                current
+            ):
+                continue
+            return bucket, i
+        return bucket, -1
+
+    def lookup(
+        self,
+        top: Expression | Token,
+        current: Token,
+        active_lhs: dict[ExpressionType, int],
+    ) -> Rule | None:
+        bucket, i = self.find(top, current, active_lhs)
+        return bucket[i] if i >= 0 else None
+
+
+class Grammar:
+    """
+    The rules of the conventional commit grammar.
+
+    A grammar does not hold any state of a running parse, so
+    it is built once and shared by all parsers.
+    """
+
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        self._rules = tuple(rules)
+        self._ids = {id(r): i for i, r in enumerate(self._rules)}
+        self._index = RuleIndex()
+        for r in self._rules:
+            self._index.add(r)
+
+    @property
+    def rules(self) -> tuple[Rule, ...]:
+        return self._rules
+
+    def rule_id(self, rule: Rule) -> int:
+        """Position of `rule` in `rules`, -1 for rules not in this grammar."""
+        return self._ids.get(id(rule), -1)
+
+    def lookup(
+        self,
+        top: Expression | Token,
+        current: Token,
+        active_lhs: dict[ExpressionType, int],
+    ) -> Rule | None:
+        return self._index.lookup(top, current, active_lhs)
+
+    def find(
+        self,
+        top: Expression | Token,
+        current: Token,
+        active_lhs: dict[ExpressionType, int],
+    ) -> tuple[tuple[Rule, ...], int]:
+        return self._index.find(top, current, active_lhs)
+
+
+def _noop(p: "Parser") -> None:
+    pass
+
+
+_INITIAL_RULE = Rule(None, None, _E.MSG, _noop)
+
+
+class Parser:
+    """
+    State of parsing a single message with a `Grammar`.
+    """
+
+    def __init__(
+        self,
+        grammar: Grammar,
+        trace: TraceRecorder | None = None,
+        stats: "ParseStats | None" = None,
+        checks: "CheckSet | None" = None,
+    ) -> None:
+        self._grammar = grammar
+        self._trace = trace
+        self._stats = stats
+        self._checks = checks
+        self._log = _log
         self._tokens = TokenQueue([])
         self._stack = Stack()
         self._stack.push(Expression(_E.START, []))
-        self._currently_parsing_lhs: dict[ExpressionType, int] = {
-            _E.MSG: 0,
-            _E.HDR: 0,
-            _E.TYPE: 0,
+        # stack height at which we started parsing each active lhs,
+        # the symbols parsed for an lhs are the ones above that height
+        self._lhs_start: dict[ExpressionType, int] = {
+            _E.MSG: 1,
+            _E.HDR: 1,
+            _E.TYPE: 1,
         }
         self._p = ProblemList(self._tokens, [])
-        self._rules: list[Rule] = []
-
-        def noop():
-            pass
-
-        self._current_rule: Rule = Rule(None, None, _E.MSG, noop)
+        self._current_rule: Rule = _INITIAL_RULE
 
     def pretty_print_state(self) -> str:
         token = self._tokens.current()
         stack = "\n".join([str(d) for d in self._stack.data])
-        lhs = {k.name: v for k, v in self._currently_parsing_lhs.items()}
+        lhs = {k.name: v for k, v in self.active_lhs().items()}
         return f"""
 current token
 -------------
@@ -162,25 +398,34 @@ active lhs
 {lhs}
         """
 
+    def active_lhs(self) -> dict[ExpressionType, int]:
+        """Number of symbols parsed so far for each active lhs."""
+        height = len(self._stack)
+        return {k: height - v for k, v in self._lhs_start.items()}
+
     def advance(self) -> None:
+        checks = self._checks
+        if checks is not None:
+            current = self._tokens.current()
+            if current.kind in checks.tokens:
+                checks.apply(current, checks.tokens[current.kind], self._p.data)
         self._tokens.advance()
 
     def reduce(self) -> None:
         new_type = self._current_rule.applicable_lhs
-        num_symbols = self._currently_parsing_lhs[new_type]
+        num_symbols = len(self._stack) - self._lhs_start.pop(new_type)
         self._stack.reduce(new_type, num_symbols, tuple(range(num_symbols)))
-        for k in self._currently_parsing_lhs:
-            self._currently_parsing_lhs[k] -= num_symbols - 1
-        self._currently_parsing_lhs.pop(new_type)
+        checks = self._checks
+        if checks is not None and new_type in checks.expressions:
+            expression = self._stack.top()
+            checks.apply(expression, checks.expressions[new_type], self._p.data)
 
     def update_currently_parsing_lhs(self, lhs: ExpressionType) -> None:
-        self._currently_parsing_lhs[lhs] = self._currently_parsing_lhs.get(lhs, 0)
+        if lhs not in self._lhs_start:
+            self._lhs_start[lhs] = len(self._stack)
 
     def push_token(self) -> None:
-        c = self._tokens.current()
-        for k in self._currently_parsing_lhs:
-            self._currently_parsing_lhs[k] += 1
-        self._stack.push(c)
+        self._stack.push(self._tokens.current())
 
     def add_problem(self, p: P):
         self._p.add_problem(p)
@@ -189,121 +434,71 @@ active lhs
         t = self._stack.top()
         return isinstance(t, Expression) and t.type == _E.MSG
 
-    def register_rule(self, handler: Rule) -> None:
-        if handler not in self._rules:
-            self._rules.append(handler)
-
     def parse(self, tokens: TokenQueue, problems: ProblemList):
         self._tokens = tokens
         self._p = problems
+        if self._stats is not None:
+            self._parse_with_stats(self._stats)
+            return
+        trace = self._trace
+        debug = self._log.isEnabledFor(logging.DEBUG)
+        step = 0
         while not self.done():
-            for h in self._rules:
-                if self.matches(h):
+            h = self._grammar.lookup(
+                self._stack.top(), self._tokens.current(), self._lhs_start
+            )
+            if h is not None:
+                if trace is not None:
+                    trace.record(
+                        TraceEntry(
+                            step,
+                            self._grammar.rule_id(h),
+                            self._stack.top(),
+                            self._tokens.current(),
+                            self.active_lhs(),
+                        )
+                    )
+                if debug:
                     self._log.debug(self.pretty_print_state())
                     self._log.debug(f"\napplying {str(h)}\n\n")
-                    self._current_rule = h
-                    self._current_rule.fn()
-                    break
-
-    def matches(self, h: Rule) -> bool:
-        match_top_of_stack = self._create_matcher(h.top_of_stack)
-        match_current_token = self._create_matcher(h.current_token)
-
-        def match_lhs(currently_parsing_lhs):
-            if h.applicable_lhs is not None:
-                return h.applicable_lhs in currently_parsing_lhs.keys()
-            return True
-
-        return (
-            match_top_of_stack(self._stack.top())
-            and match_current_token(self._tokens.current())
-            and match_lhs(self._currently_parsing_lhs)
-        )
-
-    @singledispatchmethod
-    def _create_matcher(self, left): ...
-
-    @_create_matcher.register
-    def _(self, left: Expression):
-        @singledispatch
-        def m(right):
-            pass
-
-        @m.register
-        def _(right: Expression) -> bool:
-            return left == right
-
-        @m.register
-        def _(right: object) -> bool:
-            return False
-
-        return m
-
-    @_create_matcher.register
-    def _(self, left: ExpressionType):
-        @singledispatch
-        def m(right):
-            pass
-
-        @m.register
-        def _(right: Expression):
-            return left == right.type
-
-        @m.register
-        def _(right: ExpressionType):
-            return left == right
-
-        @m.register
-        def _(right: object):
-            return False
-
-        return m
-
-    @_create_matcher.register
-    def _(self, left: T):
-        @singledispatch
-        def m(right):
-            pass
-
-        @m.register
-        def _(right: Token):
-            return left == right.kind
-
-        @m.register
-        def _(right: T):
-            return left == right
-
-        @m.register
-        def _(right: object):
-            return False
-
-        return m
-
-    @_create_matcher.register
-    def _(self, left: Token):
-        @singledispatch
-        def m(right):
-            pass
-
-        @m.register
-        def _(right: Token):
-            return left == right
-
-        @m.register
-        def _(right: object):
-            return False
-
-        return m
-
-    @_create_matcher.register
-    def _(self, left: None):
-        def m(x):
-            return True
-
-        return m
-
-
-def create_parser():
+                self._current_rule = h
+                self._current_rule.fn(self)
+            step += 1
+
+    def _parse_with_stats(self, stats: "ParseStats") -> None:
+        grammar = self._grammar
+        trace = self._trace
+        step = 0
+        while not self.done():
+            start = perf_counter_ns()
+            bucket, i = grammar.find(
+                self._stack.top(), self._tokens.current(), self._lhs_start
+            )
+            tried = bucket[: i + 1] if i >= 0 else bucket
+            stats.record_dispatch(
+                [grammar.rule_id(r) for r in tried], i >= 0, perf_counter_ns() - start
+            )
+            if i >= 0:
+                h = bucket[i]
+                rule_id = grammar.rule_id(h)
+                if trace is not None:
+                    trace.record(
+                        TraceEntry(
+                            step,
+                            rule_id,
+                            self._stack.top(),
+                            self._tokens.current(),
+                            self.active_lhs(),
+                        )
+                    )
+                self._current_rule = h
+                start = perf_counter_ns()
+                h.fn(self)
+                stats.record_fire(rule_id, perf_counter_ns() - start)
+            step += 1
+
+
+def create_grammar() -> Grammar:
     """
     last reduce expression uniquely determines what right hand rule we're building
     at each moment, because
@@ -320,15 +515,17 @@ def create_parser():
     Tokens written in lowercase
     """
     E = _E
-    p = Parser()
+    rules: list[Rule] = []
 
     def register_handler(
         top_of_stack: ExpressionType | None | Token | T,
         current_token: Token | T | None,
         valid_lhs: ExpressionType,
-    ) -> Callable[[Callable[[], None]], Callable[[], None]]:
-        def _r(fn: Callable[[], None]):
-            p.register_rule(Rule(top_of_stack, current_token, valid_lhs, fn))
+    ) -> Callable[[Callable[[Parser], None]], Callable[[Parser], None]]:
+        def _r(fn: Callable[[Parser], None]):
+            rule = Rule(top_of_stack, current_token, valid_lhs, fn)
+            if rule not in rules:
+                rules.append(rule)
             return fn
 
         return _r
@@ -338,12 +535,12 @@ def create_parser():
     @rh(E.START, T.SKIP, E.TYPE)
     @rh(T.WORD, T.SKIP, E.TYPE)
     @rh(T.WORD, T.WORD, E.TYPE)
-    def _():
+    def _(p: Parser) -> None:
         p.add_problem(P.INVALID_TYPE)
         p.advance()
 
     @rh(T.WORD, T.DIVIDER, E.TYPE)
-    def _():
+    def _(p: Parser) -> None:
         p.reduce()
         p.update_currently_parsing_lhs(E.DESCR)
 
@@ -362,12 +559,12 @@ def create_parser():
     @rh(E.HDR, T.NL, E.BDY_MSG_SEP)
     @rh(E.BDY_MSG_SEP, T.WORD, E.BODY)
     @rh(T.WORD, T.WORD, E.BODY)
-    def _():
+    def _(p: Parser) -> None:
         p.push_token()
         p.advance()
 
     @rh(E.HDR, T.NL, E.MSG)
-    def _():
+    def _(p: Parser) -> None:
         p.update_currently_parsing_lhs(E.BDY_MSG_SEP)
 
     @rh(T.WORD, T.SKIP, E.BODY)
@@ -375,7 +572,7 @@ def create_parser():
     @rh(E.TYPE, T.OPAR, E.SCOPE)
     @rh(E.TYPE, T.DIVIDER, E.DESCR)
     @rh(E.BDY_MSG_SEP, T.EOL, E.MSG)
-    def _():
+    def _(p: Parser) -> None:
         p.advance()
 
     @rh(T.NL, T.EOL, E.BDY_MSG_SEP)
@@ -384,73 +581,73 @@ def create_parser():
     @rh(T.WORD, T.CPAR, E.SCOPE)
     @rh(E.DESCR, T.EOL, E.HDR)
     @rh(E.BDY_MSG_SEP, T.NL, E.MSG)
-    def _():
+    def _(p: Parser) -> None:
         p.reduce()
         p.advance()
 
     @rh(E.BDY_MSG_SEP, T.EOF, E.MSG)
-    def _():
+    def _(p: Parser) -> None:
         p.add_problem(P.EMPTY_BODY)
         p.reduce()
 
     @rh(E.BDY_MSG_SEP, T.WORD, E.MSG)
-    def _():
+    def _(p: Parser) -> None:
         p.update_currently_parsing_lhs(E.BODY)
 
     @rh(E.TYPE, T.SKIP, E.HDR)
-    def _():
+    def _(p: Parser) -> None:
         p.add_problem(P.TOO_MUCH_WHITESPACE_AFTER_COLON)
         p.advance()
 
     @rh(T.WORD, T.CPAR, E.TYPE)
-    def _():
+    def _(p: Parser) -> None:
         p.add_problem(P.UNOPENED_SCOPE)
         p.reduce()
         p.update_currently_parsing_lhs(E.DESCR)
         p.advance()
 
     @rh(E.TYPE, T.OPAR, E.HDR)
-    def _():
+    def _(p: Parser) -> None:
         p.update_currently_parsing_lhs(E.SCOPE)
 
     @rh(E.TYPE, T.EOL, E.DESCR)
-    def _():
+    def _(p: Parser) -> None:
         p.add_problem(P.MISSING_DESCRIPTION)
         p.reduce()
 
     @rh(T.WORD, T.DIVIDER, E.SCOPE)
-    def _():
+    def _(p: Parser) -> None:
         p.add_problem(P.UNCLOSED_SCOPE)
         p.reduce()
 
     @rh(E.SCOPE, T.DIVIDER, E.HDR)
     @rh(T.EXCL, T.DIVIDER, E.HDR)
-    def _():
+    def _(p: Parser) -> None:
         p.update_currently_parsing_lhs(E.DESCR)
         p.advance()
 
     @rh(T.DOT, T.EOL, E.DESCR)
-    def _():
+    def _(p: Parser) -> None:
         p.add_problem(P.HDR_ENDS_IN_DOT)
         p.reduce()
 
     @rh(E.START, T.EOL, E.MSG)
     @rh(E.START, T.EOL, E.HDR)
     @rh(E.START, T.EOL, E.DESCR)
-    def _():
+    def _(p: Parser) -> None:
         p.add_problem(P.EMPTY_HDR)
         p.push_token()
         p.advance()
 
     @rh(E.TYPE, T.DIVIDER, E.SCOPE)
-    def _():
+    def _(p: Parser) -> None:
         p.add_problem(P.INVALID_TYPE)
         p.reduce()
         p.update_currently_parsing_lhs(E.DESCR)
         p.advance()
 
     @rh(E.TYPE, T.DIVIDER, E.HDR)
-    def _():
+    def _(p: Parser) -> None:
         p.update_currently_parsing_lhs(E.DESCR)
         p.advance()
 
@@ -466,23 +663,158 @@ def create_parser():
     @rh(T.WORD, T.NL, E.DESCR)
     @rh(T.WORD, T.EOL, E.DESCR)
     @rh(E.DESCR, T.NL, E.HDR)
-    def _():
+    def _(p: Parser) -> None:
         p.reduce()
 
     rh = partial(register_handler, valid_lhs=E.MSG)
 
     @rh(None, None)
-    def default():
+    def default(p: Parser) -> None:
         p.add_problem(P.ERROR)
         p.reduce()
 
-    def parse(text: str) -> list[Problem]:
-        token_list = tokenize(text)
-        token_list.append(Token(T.EOF, value="", column=-1, line=-1))
-        tokens = TokenQueue(token_list)
+    return Grammar(rules)
+
+
+@cache
+def default_grammar() -> Grammar:
+    return create_grammar()
+
 
+_EOF = Token(T.EOF, value="", column=-1, line=-1)
+
+
+def _until_body(tokens: Iterable[Token]) -> Iterator[Token]:
+    """
+    The tokens up to the first word of the body, i.e., the first word
+    after an empty line, followed by an end of line.
+    """
+    before, last = None, None
+    for t in tokens:
+        yield t
+        if t.kind == T.WORD and before == last == T.NL:
+            yield Token(T.EOL, "", t.column + len(t.value), t.line)
+            return
+        before, last = last, t.kind
+
+
+# the empty line and first word of the body where `_until_body` stops,
+# newlines after whitespace are part of a SKIP token
+_BODY_START = re.compile(r"(?:^|(?<=\S))\n\n+(?!BREAKING[- ]CHANGE)[^\s().:!]+")
+
+
+def _without_body(text: str) -> str:
+    """`text` up to the token where `_until_body` stops."""
+    mo = _BODY_START.search(text)
+    return text if mo is None else text[: mo.end()]
+
+
+def create_parser(
+    grammar: Grammar | None = None,
+    trace: TraceRecorder | None = None,
+    fast_path: bool = True,
+    stats: "ParseStats | None" = None,
+    intern: bool = False,
+    check_body: bool | None = None,
+    config: "Config | None" = None,
+    checks: "Iterable[Check] | None" = None,
+) -> Callable[[str], list[Problem]]:
+    """
+    Create a function that parses a commit message and returns the
+    problems found. The function can be called for any number of
+    messages, every call parses with fresh state.
+
+    If a `trace` recorder is given, every rule the parser applies
+    is recorded. Likewise `stats` collects how often each rule is
+    tried and fired and the time spent in dispatch and in the rules.
+
+    Grammars are compiled into a `TransitionTable` for parsing,
+    traced parses and grammars that can not be compiled run the
+    `Parser` instead. Without a `grammar` the prebuilt table of the
+    default grammar is used, so the grammar is only built when needed.
+
+    With `fast_path` enabled well formed messages are recognized by
+    `is_valid_message` and skip the parser. Only the default grammar
+    agrees with `is_valid_message`, so other grammars and traced
+    or instrumented parses always run the parser.
+
+    With `intern` types and scopes of the returned problems' tokens
+    are interned, see `Tokenizer`, which pays off when many problems
+    are kept.
+
+    Messages are tokenized while parsing, so the parser stops reading
+    at the first problem it can not recover from. Without `check_body`
+    the body is not checked at all: the message is parsed as if it
+    ended after the first word of the body, which bounds the work by
+    the length of header and separator. By default the body is only
+    checked if one of the `checks` reads it.
+
+    With a `config` that restricts types or scopes, the type and scope
+    of each header are checked against it as well.
+
+    The `checks` run while parsing, by default the ones enabled by
+    `config`, see `pycolint.checks`. Messages accepted by
+    `is_valid_message` only skip the parser if none of the checks can
+    find a problem in them. With `stats` the cost of each check is
+    recorded as well.
+    """
+    # table imports this module
+    from .checks import CheckSet, enabled_checks
+    from .table import GrammarError, Table, compile_table, default_table, run
+
+    check_set = CheckSet(enabled_checks(config) if checks is None else checks, stats)
+    if not check_set.valid_messages_pass:
+        fast_path = False
+    if check_body is None:
+        check_body = check_set.reads_body
+
+    instrumented = trace is not None or stats is not None
+    table: Table | None = None
+    if grammar is None and not instrumented:
+        table = default_table()
+    else:
+        if grammar is None:
+            grammar = default_grammar()
+        if grammar is not default_grammar() or instrumented:
+            fast_path = False
+        if not instrumented:
+            try:
+                table = compile_table(grammar)
+            except GrammarError:
+                pass
+
+    tokens_of = Tokenizer(intern=True).iter_tokens if intern else iter_tokens
+    active_checks = check_set if len(check_set.checks) > 0 else None
+    text_checks = check_set.texts
+
+    def parse_grammar(text: str) -> list[Problem]:
+        if fast_path and is_valid_message(text if check_body else _without_body(text)):
+            return []
         problems: list[Problem] = []
-        p.parse(tokens, ProblemList(tokens, problems))
+        if text_checks:
+            check_set.apply(text, text_checks, problems)
+        token_stream = tokens_of(text)
+        if not check_body:
+            token_stream = _until_body(token_stream)
+        token_stream = chain(token_stream, (_EOF,))
+        if table is not None:
+            found = run(table, token_stream, checks=active_checks)
+            return problems + found if problems else found
+        tokens = TokenQueue(token_stream)
+
+        assert grammar is not None
+        Parser(grammar, trace, stats, active_checks).parse(
+            tokens, ProblemList(tokens, problems)
+        )
         return problems
 
+    if config is None or not config.checks_header:
+        return parse_grammar
+    from .config import check_header
+
+    header_config = config
+
+    def parse(text: str) -> list[Problem]:
+        return check_header(header_config, text) + parse_grammar(text)
+
     return parse
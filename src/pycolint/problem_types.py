@@ -18,3 +18,6 @@ class ProblemType(Enum):
     ERROR = auto()
     UNCLOSED_SCOPE = auto()
     UNOPENED_SCOPE = auto()
+    UNKNOWN_TYPE = auto()
+    UNKNOWN_SCOPE = auto()
+    PAST_TENSE = auto()
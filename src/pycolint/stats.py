@@ -0,0 +1,167 @@
+import json
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from .parser import Grammar
+
+
+class RuleStat(NamedTuple):
+    rule_id: int
+    tried: int
+    fired: int
+    time_ns: int
+
+
+class CheckStat(NamedTuple):
+    name: str
+    calls: int
+    problems: int
+    time_ns: int
+
+
+class ParseStats:
+    """
+    Counts how often the parser tries and fires each rule and how
+    long the rules take.
+
+    A rule is tried whenever the parser checks whether it matches
+    the current state, the first matching rule is fired. Time spent
+    looking up rules (dispatch) and time spent in the fired rules
+    (actions) are recorded separately. Pass an instance to
+    `create_parser` to collect the statistics of every parsed message.
+
+    The checks run while parsing are accounted for separately, by
+    number of calls, problems found and time spent in them.
+    """
+
+    def __init__(self) -> None:
+        self._tried: dict[int, int] = {}
+        self._fired: dict[int, int] = {}
+        self._time_ns: dict[int, int] = {}
+        self.steps = 0
+        self.dispatch_ns = 0
+        # number of rules tried before a rule matched, by number of rules
+        self.tries_before_match: dict[int, int] = {}
+        self._checks: dict[str, CheckStat] = {}
+
+    def record_dispatch(self, tried: list[int], matched: bool, time_ns: int) -> None:
+        self.steps += 1
+        self.dispatch_ns += time_ns
+        for rule_id in tried:
+            self._tried[rule_id] = self._tried.get(rule_id, 0) + 1
+        if matched:
+            before = len(tried) - 1
+            self.tries_before_match[before] = self.tries_before_match.get(before, 0) + 1
+
+    def record_fire(self, rule_id: int, time_ns: int) -> None:
+        self._fired[rule_id] = self._fired.get(rule_id, 0) + 1
+        self._time_ns[rule_id] = self._time_ns.get(rule_id, 0) + time_ns
+
+    def record_check(self, name: str, time_ns: int, problems: int) -> None:
+        s = self._checks.get(name)
+        if s is None:
+            s = CheckStat(name, 0, 0, 0)
+        self._checks[name] = CheckStat(
+            name, s.calls + 1, s.problems + problems, s.time_ns + time_ns
+        )
+
+    def checks(self) -> list[CheckStat]:
+        """Statistics per check, most expensive first."""
+        return sorted(self._checks.values(), key=lambda c: (-c.time_ns, c.name))
+
+    @property
+    def action_ns(self) -> int:
+        return sum(self._time_ns.values())
+
+    def rules(self, grammar: "Grammar | None" = None) -> list[RuleStat]:
+        """
+        Statistics per rule, ordered by rule id. With a `grammar` rules
+        that were never tried are included as well.
+        """
+        ids = set(self._tried) | set(self._fired)
+        if grammar is not None:
+            ids.update(range(len(grammar.rules)))
+        return [
+            RuleStat(
+                i,
+                self._tried.get(i, 0),
+                self._fired.get(i, 0),
+                self._time_ns.get(i, 0),
+            )
+            for i in sorted(ids)
+        ]
+
+    def clear(self) -> None:
+        self._tried.clear()
+        self._fired.clear()
+        self._time_ns.clear()
+        self.steps = 0
+        self.dispatch_ns = 0
+        self.tries_before_match.clear()
+        self._checks.clear()
+
+    def to_dict(self, grammar: "Grammar | None" = None) -> dict:
+        return {
+            "steps": self.steps,
+            "dispatch_ns": self.dispatch_ns,
+            "action_ns": self.action_ns,
+            "tries_before_match": {
+                str(k): v for k, v in sorted(self.tries_before_match.items())
+            },
+            "rules": [
+                {**r._asdict(), "rule": _describe(grammar, r.rule_id)}
+                for r in self.rules(grammar)
+            ],
+            "checks": [c._asdict() for c in self.checks()],
+        }
+
+    def dump_json(self, grammar: "Grammar | None" = None) -> str:
+        return json.dumps(self.to_dict(grammar), indent=2)
+
+    def dump(self, grammar: "Grammar | None" = None) -> str:
+        """Table of the rules, most often fired first."""
+        rows = sorted(
+            self.rules(grammar), key=lambda r: (-r.fired, -r.tried, r.rule_id)
+        )
+        lines = [
+            f"{'rule':>5} {'tried':>9} {'fired':>9} {'time ms':>9}  definition",
+            *(
+                f"{r.rule_id:>5} {r.tried:>9} {r.fired:>9}"
+                f" {r.time_ns / 1e6:>9.3f}  {_describe(grammar, r.rule_id)}"
+                for r in rows
+            ),
+            "",
+            f"steps {self.steps}, dispatch {self.dispatch_ns / 1e6:.3f} ms,"
+            f" actions {self.action_ns / 1e6:.3f} ms",
+        ]
+        if self._checks:
+            lines += [
+                "",
+                f"{'calls':>9} {'problems':>9} {'time ms':>9}  check",
+                *(
+                    f"{c.calls:>9} {c.problems:>9} {c.time_ns / 1e6:>9.3f}  {c.name}"
+                    for c in self.checks()
+                ),
+            ]
+        return "\n".join(lines)
+
+
+def _describe(grammar: "Grammar | None", rule_id: int) -> str:
+    if grammar is None or not 0 <= rule_id < len(grammar.rules):
+        return ""
+    rule = grammar.rules[rule_id]
+
+    def name(item) -> str:
+        if item is None:
+            return "*"
+        if hasattr(item, "kind"):
+            return f"{item.kind.name}={item.value!r}"
+        if hasattr(item, "type"):
+            return item.type.name
+        return item.name
+
+    lhs = rule.applicable_lhs.name if rule.applicable_lhs is not None else "*"
+    return (
+        f"{name(rule.top_of_stack)} {name(rule.current_token)} in {lhs}"
+        f" (line {rule.fn.__code__.co_firstlineno})"
+    )
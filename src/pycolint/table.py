@@ -0,0 +1,432 @@
+"""
+Compile a `Grammar` into a flat transition table.
+
+Every parser step only depends on the kind of the top of stack, the
+set of active lhs and the kind of the current token. Starting from the
+initial parser state the compiler follows all rule actions to find the
+reachable combinations and stores the actions of the winning rule for
+each of them. The driver `run` then executes a message with one dict
+lookup per step.
+
+While compiling we also collect rules that never win in any
+reachable state and states where several rules match.
+
+    python -m pycolint.table
+
+prints this report for the default grammar. The table of the default
+grammar is also kept prebuilt in `_default_table.py`, so parsers do
+not need to build the grammar and compile it at startup. Regenerate
+it after changing the grammar with
+
+    python -m pycolint.table --generate > src/pycolint/_default_table.py
+"""
+
+from collections.abc import Callable, Iterable
+from enum import IntEnum
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple
+
+from .parser import (
+    Expression,
+    ExpressionType,
+    Grammar,
+    Problem,
+    Rule,
+    default_grammar,
+)
+from .problem_types import ProblemType as P
+from .tokenizer import Kind as T, Token, Tokenizer
+
+if TYPE_CHECKING:
+    from .checks import CheckSet
+
+_E = ExpressionType
+
+
+class Op(IntEnum):
+    SHIFT = 0
+    ADVANCE = 1
+    REDUCE = 2
+    PROBLEM = 3
+    BEGIN = 4
+
+
+Action = tuple[Op, ExpressionType | P | None]
+# type or kind of the top of the stack
+StackTop = ExpressionType | T
+StateKey = tuple[StackTop, int, T]
+
+INITIAL_LHS = (_E.MSG, _E.HDR, _E.TYPE)
+
+LHS_BITS: dict[ExpressionType, int] = {e: 1 << i for i, e in enumerate(_E)}
+
+
+def lhs_mask(lhs: Iterable[ExpressionType]) -> int:
+    mask = 0
+    for e in lhs:
+        mask |= LHS_BITS[e]
+    return mask
+
+
+def lhs_from_mask(mask: int) -> tuple[ExpressionType, ...]:
+    return tuple(e for e, bit in LHS_BITS.items() if mask & bit)
+
+
+class Transition(NamedTuple):
+    rule_id: int
+    actions: tuple[Action, ...]
+
+
+class Conflict(NamedTuple):
+    state: StateKey
+    rule_ids: tuple[int, ...]
+
+
+class GrammarError(Exception):
+    pass
+
+
+class _ActionRecorder:
+    """Stands in for the `Parser` to record what a rule does."""
+
+    def __init__(self, rule: Rule) -> None:
+        self._rule = rule
+        self.actions: list[Action] = []
+
+    def add_problem(self, p: P) -> None:
+        self.actions.append((Op.PROBLEM, p))
+
+    def advance(self) -> None:
+        self.actions.append((Op.ADVANCE, None))
+
+    def push_token(self) -> None:
+        self.actions.append((Op.SHIFT, None))
+
+    def reduce(self) -> None:
+        self.actions.append((Op.REDUCE, self._rule.applicable_lhs))
+
+    def update_currently_parsing_lhs(self, lhs: ExpressionType) -> None:
+        self.actions.append((Op.BEGIN, lhs))
+
+
+def record_actions(rule: Rule) -> tuple[Action, ...]:
+    recorder = _ActionRecorder(rule)
+    try:
+        rule.fn(recorder)  # type: ignore[arg-type]
+    except AttributeError as e:
+        raise GrammarError(f"can not compile the actions of {rule}") from e
+    return tuple(recorder.actions)
+
+
+_PRODUCED_KINDS = tuple(Tokenizer.tokens)
+
+
+def _next_kinds(kind: T) -> tuple[T, ...]:
+    if kind == T.EOL:
+        return (T.EOF,)
+    if kind == T.EOF:
+        return ()
+    return _PRODUCED_KINDS
+
+
+class TransitionTable:
+    def __init__(self, grammar: Grammar) -> None:
+        self._grammar = grammar
+        for r in grammar.rules:
+            for pattern in (r.top_of_stack, r.current_token):
+                if isinstance(pattern, (Expression, Token)):
+                    raise GrammarError(f"can not compile value pattern of {r}")
+        self._actions = tuple(record_actions(r) for r in grammar.rules)
+        self.transitions: dict[StateKey, Transition] = {}
+        self.conflicts: list[Conflict] = []
+        self.stuck: list[StateKey] = []
+        self._explore()
+        used = {t.rule_id for t in self.transitions.values()}
+        self.dead = tuple(i for i in range(len(grammar.rules)) if i not in used)
+
+    @property
+    def grammar(self) -> Grammar:
+        return self._grammar
+
+    def matching_rules(self, state: StateKey) -> tuple[int, ...]:
+        top, mask, kind = state
+        return tuple(
+            i
+            for i, r in enumerate(self._grammar.rules)
+            if r.top_of_stack in (top, None)
+            and r.current_token in (kind, None)
+            and (r.applicable_lhs is None or LHS_BITS[r.applicable_lhs] & mask)
+        )
+
+    def resolve(self, state: StateKey) -> Transition | None:
+        rules = self.matching_rules(state)
+        if len(rules) == 0:
+            return None
+        return Transition(rules[0], self._actions[rules[0]])
+
+    def _explore(self) -> None:
+        start = (_E.START, lhs_mask(INITIAL_LHS))
+        todo: list[StateKey] = [(*start, k) for k in _PRODUCED_KINDS]
+        seen = set(todo)
+        while todo:
+            state = todo.pop()
+            rules = self.matching_rules(state)
+            if len(rules) == 0:
+                self.stuck.append(state)
+                continue
+            self._check_conflict(state, rules)
+            transition = Transition(rules[0], self._actions[rules[0]])
+            self.transitions[state] = transition
+            for succ in self._successors(state, transition):
+                if succ not in seen:
+                    seen.add(succ)
+                    todo.append(succ)
+
+    def _check_conflict(self, state: StateKey, rules: tuple[int, ...]) -> None:
+        specific = tuple(
+            i
+            for i in rules
+            if not (
+                self._grammar.rules[i].top_of_stack is None
+                and self._grammar.rules[i].current_token is None
+            )
+        )
+        if len(specific) > 1:
+            self.conflicts.append(Conflict(state, specific))
+
+    def _successors(self, state: StateKey, transition: Transition) -> list[StateKey]:
+        top, mask, kind = state
+        advanced = False
+        for op, arg in transition.actions:
+            if op == Op.SHIFT:
+                if advanced:
+                    raise GrammarError(
+                        f"rule {transition.rule_id} pushes a token after advancing"
+                    )
+                top = kind
+            elif op == Op.ADVANCE:
+                advanced = True
+            elif op == Op.REDUCE:
+                assert isinstance(arg, ExpressionType)
+                mask &= ~LHS_BITS[arg]
+                top = arg
+            elif op == Op.BEGIN:
+                assert isinstance(arg, ExpressionType)
+                mask |= LHS_BITS[arg]
+        if top == _E.MSG:
+            return []
+        if advanced:
+            return [(top, mask, k) for k in _next_kinds(kind)]
+        return [(top, mask, kind)]
+
+    def report(self) -> str:
+        rules = self._grammar.rules
+
+        def describe(i: int) -> str:
+            r = rules[i]
+            return f"{i:>3}: {r.top_of_stack} {r.current_token} {r.applicable_lhs}"
+
+        def state_str(state: StateKey) -> str:
+            top, mask, kind = state
+            lhs = ", ".join(e.name for e in lhs_from_mask(mask))
+            return f"top {top.name}, lhs {{{lhs}}}, token {kind.name}"
+
+        lines = [
+            f"{len(rules)} rules, {len(self.transitions)} reachable transitions",
+            "",
+            f"{len(self.dead)} rules never fire:",
+        ]
+        lines.extend(f"  {describe(i)}" for i in self.dead)
+        lines.append("")
+        lines.append(f"{len(self.conflicts)} states match more than one rule:")
+        for c in self.conflicts:
+            lines.append(f"  {state_str(c.state)}")
+            lines.extend(f"    {describe(i)}" for i in c.rule_ids)
+        lines.append("")
+        lines.append(f"{len(self.stuck)} states without any rule:")
+        lines.extend(f"  {state_str(s)}" for s in self.stuck)
+        return "\n".join(lines)
+
+
+@cache
+def compile_table(grammar: Grammar) -> TransitionTable:
+    return TransitionTable(grammar)
+
+
+def _arg_from_name(op: Op, name: str | None) -> ExpressionType | P | None:
+    if name is None:
+        return None
+    return P.__members__[name] if op == Op.PROBLEM else _E.__members__[name]
+
+
+class PrebuiltTable:
+    """
+    The transitions of the default grammar as generated by
+    `generate_default_table`. States that are missing are resolved by
+    compiling the default grammar.
+    """
+
+    def __init__(self, rows: Iterable[tuple]) -> None:
+        self.transitions: dict[StateKey, Transition] = {}
+        for top, mask, kind, rule_id, actions in rows:
+            if top in _E.__members__:
+                key: StackTop = _E.__members__[top]
+            else:
+                key = T.__members__[top]
+            self.transitions[(key, mask, T.__members__[kind])] = Transition(
+                rule_id,
+                tuple((Op(op), _arg_from_name(Op(op), arg)) for op, arg in actions),
+            )
+
+    def resolve(self, state: StateKey) -> Transition | None:
+        return compile_table(default_grammar()).resolve(state)
+
+
+Table = TransitionTable | PrebuiltTable
+
+
+@cache
+def default_table() -> PrebuiltTable:
+    from ._default_table import TRANSITIONS
+
+    return PrebuiltTable(TRANSITIONS)
+
+
+def _quoted(name: str) -> str:
+    return f'"{name}"'
+
+
+def generate_default_table() -> str:
+    """Source of `_default_table.py` for the current default grammar."""
+    table = TransitionTable(default_grammar())
+    lines = [
+        "# generated by `python -m pycolint.table --generate`, do not edit",
+        "# (top, lhs mask, token kind, rule id, ((op, arg), ...))",
+        "TRANSITIONS = (",
+    ]
+    rows = sorted(
+        (top.name, mask, kind.name, t)
+        for (top, mask, kind), t in table.transitions.items()
+    )
+    for top, mask, kind, t in rows:
+        # quoted and with trailing commas like `ruff format` writes them
+        actions = [
+            f"({int(op)}, {None if arg is None else _quoted(arg.name)})"
+            for op, arg in t.actions
+        ]
+        ops = f"({actions[0]},)" if len(actions) == 1 else f"({', '.join(actions)})"
+        fields = [_quoted(top), str(mask), _quoted(kind), str(t.rule_id), ops]
+        line = f"    ({', '.join(fields)}),"
+        if len(line) <= 88:
+            lines.append(line)
+        else:
+            lines.append("    (")
+            lines.extend(f"        {f}," for f in fields)
+            lines.append("    ),")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+class RunState(NamedTuple):
+    """
+    What `run` knows about the message before looking at the current
+    token. `run` modifies the containers in place.
+    """
+
+    stack: list[Expression | Token]
+    lhs_start: dict[ExpressionType, int]
+    problems: list[Problem]
+
+
+def initial_state() -> RunState:
+    return RunState([Expression(_E.START, [])], {e: 1 for e in INITIAL_LHS}, [])
+
+
+def run(
+    table: Table,
+    tokens: Iterable[Token],
+    state: RunState | None = None,
+    on_line: Callable[[RunState, Token], None] | None = None,
+    checks: "CheckSet | None" = None,
+) -> list[Problem]:
+    """
+    Parse `tokens`, which have to end in an EOF token, and return the
+    problems found. Produces the same result as the `Parser` for the
+    grammar of `table`.
+
+    Tokens are only pulled from `tokens` as the parser advances, the
+    rest of a message after the parser is done is never looked at.
+
+    A parse can be continued from a copy of the `state` that `on_line`
+    received together with the first token of a line, see
+    `pycolint.incremental`. `on_line` must not modify the state.
+
+    The `checks` are applied to each token the parser consumes and each
+    expression it reduces.
+    """
+    if state is None:
+        state = initial_state()
+    stack, lhs_start, problems = state
+    transitions = table.transitions
+    token_checks = checks.tokens if checks is not None else {}
+    expression_checks = checks.expressions if checks is not None else {}
+    mask = lhs_mask(lhs_start)
+    remaining = iter(tokens)
+    current = next(remaining)
+    new_line = False
+    key: StackTop
+    while True:
+        top = stack[-1]
+        if isinstance(top, Expression):
+            if top.type == _E.MSG:
+                return problems
+            key = top.type
+        else:
+            key = top.kind
+        state_key = (key, mask, current.kind)
+        transition = transitions.get(state_key)
+        if transition is None:
+            transition = table.resolve(state_key)
+            if transition is None:
+                raise GrammarError(f"no rule for {state_key}")
+            transitions[state_key] = transition
+        for op, arg in transition.actions:
+            if op == Op.SHIFT:
+                stack.append(current)
+            elif op == Op.ADVANCE:
+                if current.kind in token_checks:
+                    checks.apply(  # type: ignore[union-attr]
+                        current, token_checks[current.kind], problems
+                    )
+                if on_line is not None:
+                    new_line = current.kind == T.NL
+                current = next(remaining)
+            elif op == Op.PROBLEM:
+                problems.append(Problem(arg, current))  # type: ignore[arg-type]
+            elif op == Op.BEGIN:
+                if arg not in lhs_start:
+                    lhs_start[arg] = len(stack)  # type: ignore[index]
+                    mask |= LHS_BITS[arg]  # type: ignore[index]
+            else:
+                cut = lhs_start.pop(arg)  # type: ignore[arg-type]
+                mask &= ~LHS_BITS[arg]  # type: ignore[index]
+                sub = stack[cut:]
+                del stack[cut:]
+                expression = Expression(arg, sub)  # type: ignore[arg-type]
+                stack.append(expression)
+                if arg in expression_checks:
+                    checks.apply(  # type: ignore[union-attr]
+                        expression, expression_checks[arg], problems
+                    )
+        if new_line:
+            new_line = False
+            on_line(state, current)  # type: ignore[misc]
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--generate" in sys.argv[1:]:
+        print(generate_default_table(), end="")
+    else:
+        print(TransitionTable(default_grammar()).report())
@@ -1,4 +1,6 @@
 import re
+import sys
+from collections.abc import Iterator
 from enum import Enum
 from dataclasses import dataclass
 
@@ -19,7 +21,7 @@ class Kind(Enum):
     NL = "NL"
 
 
-@dataclass(frozen=True, eq=True)
+@dataclass(frozen=True, eq=True, slots=True)
 class Token:
     kind: Kind
     value: str
@@ -40,32 +42,74 @@ class Tokenizer:
         Kind.WORD: r"[^\s().:!]+",
         Kind.EOL: r"$",
     }
+    _regex: re.Pattern[str]
 
-    def __call__(self, text: str) -> list[Token]:
-        regex = "|".join(
-            "(?P<{name}>{token})".format(name=name.value, token=token)
-            for name, token in self.tokens.items()
+    def __init__(self, intern: bool = False) -> None:
+        """
+        With `intern` the type and the scope word of the header are
+        interned, so tokens of many messages share them.
+        """
+        self._intern = intern
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._regex = cls._compile()
+
+    @classmethod
+    def _compile(cls) -> re.Pattern[str]:
+        return re.compile(
+            "|".join(
+                "(?P<{name}>{token})".format(name=name.value, token=token)
+                for name, token in cls.tokens.items()
+            )
         )
-        tokens: list[Token] = []
-        line_start = 0
-        line = 1
-        last_kind = Kind.NL
-        for mo in re.finditer(regex, text):
+
+    def iter_tokens(self, text: str, start: int = 0, line: int = 1) -> Iterator[Token]:
+        """
+        Tokens of `text` from `start` on, which has to be the offset
+        where `line` begins, i.e., right after a newline token.
+        """
+        line_start = start - 1 if line > 1 else 0
+        intern = self._intern
+        # the words of descriptions rarely repeat, only intern the type,
+        # i.e., the first token, and the word after an opening parenthesis
+        type_or_scope = intern and line == 1
+        for mo in self._regex.finditer(text, start):
             kind = Kind[mo.lastgroup] if mo.lastgroup is not None else None
+            if kind is None:
+                continue
+            start = mo.start()
             value = mo.group()
-            column = mo.start() - line_start + 1
-            if kind is not None:
-                if last_kind == Kind.SKIP and kind == Kind.SKIP:
-                    continue
-                else:
-                    tokens.append(Token(kind, value, column, line))
-                    if kind == Kind.NL:
-                        line_start = mo.start()
-                        line += 1
+            if type_or_scope and kind == Kind.WORD:
+                value = sys.intern(value)
+            type_or_scope = intern and line == 1 and kind == Kind.OPAR
+            yield Token(kind, value, start - line_start + 1, line)
+            if kind == Kind.NL:
+                line_start = start
+                line += 1
+
+    def __call__(self, text: str) -> list[Token]:
+        return list(self.iter_tokens(text))
 
-        return tokens
+
+Tokenizer._regex = Tokenizer._compile()
+_tokenizer = Tokenizer()
+
+
+def iter_tokens(text: str) -> Iterator[Token]:
+    """
+    Yield the tokens of `text` one at a time instead of
+    building the complete list like `tokenize`.
+    """
+    return _tokenizer.iter_tokens(text)
 
 
 def tokenize(text: str) -> list[Token]:
-    t = Tokenizer()
-    return t(text)
+    return _tokenizer(text)
+
+
+def end_position(text: str) -> tuple[int, int]:
+    """Line and column of the EOL token at the end of `text`."""
+    line = text.count("\n") + 1
+    line_start = text.rfind("\n") if line > 1 else 0
+    return line, len(text) - line_start + 1
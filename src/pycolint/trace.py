@@ -0,0 +1,57 @@
+from collections import deque
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, NamedTuple
+
+from .tokenizer import Token
+
+if TYPE_CHECKING:
+    from .parser import Expression, ExpressionType
+
+
+class TraceEntry(NamedTuple):
+    step: int
+    rule_id: int
+    top: "Expression | Token"
+    token: Token
+    lhs: "dict[ExpressionType, int]"
+
+    def __str__(self) -> str:
+        top = self.top.kind.name if isinstance(self.top, Token) else self.top.type.name
+        lhs = ", ".join(f"{k.name}: {v}" for k, v in self.lhs.items())
+        return (
+            f"{self.step:>5} rule {self.rule_id:>3}  top {top:<12}"
+            f" token {self.token.kind.name:<8} {self.token.value!r:<12}"
+            f" {self.token.line}:{self.token.column}  lhs {{{lhs}}}"
+        )
+
+
+class TraceRecorder:
+    """
+    Records the rules applied by the parser into a ring buffer
+    holding the last `maxlen` steps.
+
+    Pass a recorder to `create_parser` to trace every parsed
+    message. Without a recorder the parser does not collect anything.
+    """
+
+    def __init__(self, maxlen: int = 1000) -> None:
+        self._entries: deque[TraceEntry] = deque(maxlen=maxlen)
+
+    def record(self, entry: TraceEntry) -> None:
+        self._entries.append(entry)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def entries(self) -> tuple[TraceEntry, ...]:
+        return tuple(self._entries)
+
+    def __iter__(self) -> Iterator[TraceEntry]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def dump(self) -> str:
+        return "\n".join(str(e) for e in self._entries)
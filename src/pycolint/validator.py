@@ -0,0 +1,37 @@
+import re
+
+from .tokenizer import Kind as T, Tokenizer
+
+
+def _compile_valid_message() -> re.Pattern[str]:
+    """
+    Translate the error free subset of the grammar documented
+    in `create_grammar` into one regular expression, using the
+    token patterns of the tokenizer:
+
+    MSG := HDR ['\\n\\n' {'\\n'} BODY]
+    HDR := type ['(' scope ')'] ['!'] ': ' DESCR
+    DESCR := word {space word}
+    BODY := word {space word}
+
+    Anything that does not match exactly this needs the parser
+    to find out what is wrong with it.
+    """
+    t = Tokenizer.tokens
+    word = rf"(?!(?:{t[T.BREAKING_CHANGE]}))(?:{t[T.WORD]})"
+    space = r"[^\S\n]+"
+    words = rf"{word}(?:{space}{word})*"
+    scope = rf"(?:{t[T.OPAR]}{word}{t[T.CPAR]})?"
+    hdr = rf"{word}{scope}(?:{t[T.EXCL]})?{t[T.DIVIDER]}{words}"
+    return re.compile(rf"{hdr}(?:\n\n+{words})?")
+
+
+_valid_message = _compile_valid_message()
+
+
+def is_valid_message(text: str) -> bool:
+    """
+    True for well formed messages, that the parser would not find any
+    problem in. False does not mean the message has a problem.
+    """
+    return _valid_message.fullmatch(text) is not None
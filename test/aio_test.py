@@ -0,0 +1,183 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from pycolint.aio import LintResult, lint_async, lint_stream
+from pycolint.batch import lint_many
+from pycolint.config import Config
+from pycolint.problem_types import ProblemType as P
+import pytest
+
+MESSAGES = ["feat: a", "feat : a", "feat: a.", "", "fix(s)!: b"] * 4
+
+
+class PushSource:
+    """
+    Stands in for a webhook receiver, the commit messages of push
+    events arrive whenever the test pushes them.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self.num_read = 0
+
+    def push(self, *messages: str) -> None:
+        for m in messages:
+            self._queue.put_nowait(m)
+
+    def close(self) -> None:
+        self._queue.put_nowait(None)
+
+    def __aiter__(self) -> "PushSource":
+        return self
+
+    async def __anext__(self) -> str:
+        msg = await self._queue.get()
+        if msg is None:
+            raise StopAsyncIteration
+        self.num_read += 1
+        return msg
+
+
+class GatedExecutor(ThreadPoolExecutor):
+    """Lints only once the gate is open and counts submitted messages."""
+
+    def __init__(self) -> None:
+        super().__init__(2)
+        self.gate = threading.Event()
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(self._gated, fn, *args, **kwargs)
+
+    def _gated(self, fn, *args, **kwargs):
+        self.gate.wait(5)
+        return fn(*args, **kwargs)
+
+
+async def collect(results) -> list[LintResult]:
+    return [r async for r in results]
+
+
+async def pushed(messages: list[str]) -> PushSource:
+    source = PushSource()
+    source.push(*messages)
+    source.close()
+    return source
+
+
+class LintAsyncTest:
+    def test_problems_of_message(self):
+        problems = asyncio.run(lint_async("feat: a b."))
+        assert [(P.HDR_ENDS_IN_DOT, 1, 11)] == problems
+
+    def test_uses_executor(self):
+        async def lint(executor):
+            return await lint_async("feat : a", executor)
+
+        with GatedExecutor() as executor:
+            executor.gate.set()
+            assert [P.INVALID_TYPE] == [p.type for p in asyncio.run(lint(executor))]
+            assert 1 == executor.submitted
+
+    def test_limit_bounds_messages_in_flight(self):
+        async def lint(executor):
+            limit = asyncio.Semaphore(2)
+            tasks = [
+                asyncio.create_task(lint_async(m, executor, limit=limit))
+                for m in MESSAGES
+            ]
+            await asyncio.sleep(0.05)
+            submitted = executor.submitted
+            executor.gate.set()
+            return submitted, await asyncio.gather(*tasks)
+
+        with GatedExecutor() as executor:
+            submitted, problems = asyncio.run(lint(executor))
+        assert 2 == submitted
+        assert list(lint_many(MESSAGES)) == problems
+
+    def test_config(self):
+        config = Config(types=frozenset({"fix"}))
+        problems = asyncio.run(lint_async("feat: a", config=config))
+        assert [P.UNKNOWN_TYPE] == [p.type for p in problems]
+
+
+class LintStreamTest:
+    def test_keeps_order(self):
+        async def lint():
+            return await collect(lint_stream(await pushed(MESSAGES), concurrency=3))
+
+        results = asyncio.run(lint())
+        assert list(range(len(MESSAGES))) == [r.position for r in results]
+        assert MESSAGES == [r.msg for r in results]
+        assert list(lint_many(MESSAGES)) == [r.problems for r in results]
+
+    def test_unordered_yields_every_message(self):
+        async def lint():
+            stream = lint_stream(await pushed(MESSAGES), ordered=False)
+            return await collect(stream)
+
+        results = asyncio.run(lint())
+        expected = list(lint_many(MESSAGES))
+        assert sorted(range(len(MESSAGES))) == sorted(r.position for r in results)
+        assert all(expected[r.position] == r.problems for r in results)
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_yields_results_while_source_is_idle(self, ordered):
+        async def lint():
+            source = PushSource()
+            stream = lint_stream(source, ordered=ordered)
+            source.push("feat : a")
+            first = await asyncio.wait_for(anext(stream), 5)
+            source.push("feat: b")
+            source.close()
+            return first, await collect(stream)
+
+        first, rest = asyncio.run(lint())
+        assert LintResult(0, "feat : a", [(P.INVALID_TYPE, 1, 5)]) == first
+        assert [LintResult(1, "feat: b", [])] == rest
+
+    def test_reads_no_more_than_concurrency_messages_ahead(self):
+        async def lint(executor):
+            source = await pushed(MESSAGES)
+            task = asyncio.create_task(
+                collect(lint_stream(source, executor, concurrency=3))
+            )
+            await asyncio.sleep(0.05)
+            num_read = source.num_read
+            executor.gate.set()
+            return num_read, await task
+
+        with GatedExecutor() as executor:
+            num_read, results = asyncio.run(lint(executor))
+        assert 3 == num_read
+        assert len(MESSAGES) == len(results)
+
+    def test_lints_in_worker_processes(self):
+        async def lint(executor):
+            return await collect(lint_stream(await pushed(MESSAGES), executor))
+
+        with ProcessPoolExecutor(2) as executor:
+            results = asyncio.run(lint(executor))
+        assert list(lint_many(MESSAGES)) == [r.problems for r in results]
+
+    def test_stops_linting_when_closed_early(self):
+        async def lint(executor):
+            stream = lint_stream(await pushed(MESSAGES), executor, concurrency=2)
+            first = await anext(stream)
+            await stream.aclose()
+            return first
+
+        with GatedExecutor() as executor:
+            executor.gate.set()
+            assert 0 == asyncio.run(lint(executor)).position
+            assert executor.submitted <= 3
+
+    def test_rejects_concurrency_below_one(self):
+        async def lint():
+            return await collect(lint_stream(await pushed([]), concurrency=0))
+
+        with pytest.raises(ValueError):
+            asyncio.run(lint())
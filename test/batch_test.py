@@ -0,0 +1,119 @@
+import subprocess
+from pathlib import Path
+
+from pycolint.batch import (
+    ProblemRecord,
+    _split_records,
+    iter_git_messages,
+    lint_history,
+    lint_many,
+)
+from pycolint.config import Config
+from pycolint.main import main
+from pycolint.problem_types import ProblemType as P
+import pytest
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path) -> Path:
+    git(tmp_path, "init", "-q")
+    for msg in ("feat: first", "fix : second", "feat: third\n\nwith body"):
+        git(tmp_path, "commit", "-q", "--allow-empty", "-m", msg)
+    return tmp_path
+
+
+class SplitRecordsTest:
+    def test_records_across_chunks(self):
+        chunks = iter([b"ab\0c", b"d\0", b"ef"])
+        assert [b"ab", b"cd", b"ef"] == list(_split_records(chunks, b"\0"))
+
+
+class IterGitMessagesTest:
+    def test_yields_all_commits_newest_first(self, repo):
+        messages = [m for _, m in iter_git_messages(cwd=str(repo))]
+        assert ["feat: third\n\nwith body", "fix : second", "feat: first"] == messages
+
+    def test_yields_sha(self, repo):
+        head = git(repo, "rev-parse", "HEAD").strip()
+        sha, _ = next(iter_git_messages(cwd=str(repo)))
+        assert head == sha
+
+    def test_handles_small_chunks(self, repo):
+        assert list(iter_git_messages(cwd=str(repo))) == list(
+            iter_git_messages(cwd=str(repo), chunk_size=3)
+        )
+
+    def test_respects_revision_range(self, repo):
+        messages = [m for _, m in iter_git_messages(["HEAD~1..HEAD"], cwd=str(repo))]
+        assert ["feat: third\n\nwith body"] == messages
+
+    def test_raises_for_unknown_revision(self, repo):
+        with pytest.raises(subprocess.CalledProcessError):
+            list(iter_git_messages(["does-not-exist"], cwd=str(repo)))
+
+
+class LintHistoryTest:
+    def test_problems_per_commit(self, repo):
+        problems = [[p.type for p in r.problems] for r in lint_history(cwd=str(repo))]
+        assert [[], [P.INVALID_TYPE], []] == problems
+
+
+class LintManyTest:
+    @pytest.fixture
+    def messages(self) -> list[str]:
+        return ["feat: a", "feat : a", "feat: a.", "", "fix(s)!: b"] * 7
+
+    def test_records_problem_positions(self):
+        assert [[ProblemRecord(P.HDR_ENDS_IN_DOT, 1, 11)]] == list(
+            lint_many(["feat: a b."])
+        )
+
+    def test_workers_keep_input_order(self, messages):
+        expected = list(lint_many(messages))
+        assert expected == list(lint_many(iter(messages), jobs=2, chunk_size=3))
+
+    def test_workers_use_config(self, messages):
+        config = Config(types=frozenset({"feat"}))
+        expected = list(lint_many(messages, config=config))
+        assert [ProblemRecord(P.UNKNOWN_TYPE, 1, 1)] == expected[4]
+        assert expected == list(
+            lint_many(messages, jobs=2, chunk_size=3, config=config)
+        )
+
+    def test_history_with_workers(self, repo):
+        assert list(lint_history(cwd=str(repo))) == list(
+            lint_history(cwd=str(repo), jobs=2, chunk_size=1)
+        )
+
+
+class MainHistoryTest:
+    def test_prints_problems_keyed_by_sha(self, repo, monkeypatch, capsys):
+        monkeypatch.chdir(repo)
+        sha = git(repo, "rev-parse", "HEAD~1").strip()
+        with pytest.raises(SystemExit) as e:
+            main(["--all"])
+        assert 1 == e.value.code
+        assert f"{sha}:1:4: INVALID_TYPE\n" == capsys.readouterr().out
+
+    def test_lints_with_several_jobs(self, repo, monkeypatch, capsys):
+        monkeypatch.chdir(repo)
+        with pytest.raises(SystemExit) as e:
+            main(["--all", "--jobs", "2"])
+        assert 1 == e.value.code
+        assert "INVALID_TYPE" in capsys.readouterr().out
+
+    def test_exits_cleanly_for_valid_range(self, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+        with pytest.raises(SystemExit) as e:
+            main(["--range", "HEAD~1..HEAD"])
+        assert 0 == e.value.code
@@ -0,0 +1,87 @@
+import subprocess
+import time
+
+from pycolint.batch import ProblemRecord, lint_history
+from pycolint.cache import ResultCache, message_key
+from pycolint.main import main
+from pycolint.problem_types import ProblemType as P
+import pytest
+
+PROBLEMS = [ProblemRecord(P.INVALID_TYPE, 1, 5), ProblemRecord(P.ERROR, 2, 1)]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q")
+    for msg in ("feat: first", "fix : second", "feat: third"):
+        git("commit", "-q", "--allow-empty", "-m", msg)
+    return tmp_path
+
+
+class ResultCacheTest:
+    def test_returns_stored_problems(self):
+        with ResultCache() as c:
+            c.put("abc", PROBLEMS)
+            assert PROBLEMS == c.get("abc")
+
+    def test_counts_hits_and_misses(self):
+        with ResultCache() as c:
+            c.put("abc", [])
+            c.get("abc")
+            c.get("def")
+            assert (1, 1) == (c.hits, c.misses)
+
+    def test_separates_versions_and_configs(self, tmp_path):
+        path = tmp_path / "c.sqlite"
+        with ResultCache(path, linter_version="1") as c:
+            c.put("abc", PROBLEMS)
+        with ResultCache(path, linter_version="2") as c:
+            assert c.get("abc") is None
+        with ResultCache(path, linter_version="1", config_hash="x") as c:
+            assert c.get("abc") is None
+        with ResultCache(path, linter_version="1") as c:
+            assert PROBLEMS == c.get("abc")
+
+    def test_evicts_old_entries(self, tmp_path):
+        path = tmp_path / "c.sqlite"
+        with ResultCache(path) as c:
+            c.put("abc", [])
+        time.sleep(0.01)
+        with ResultCache(path, max_age=0.001) as c:
+            assert 0 == len(c)
+
+    def test_keeps_newest_entries(self, tmp_path):
+        path = tmp_path / "c.sqlite"
+        with ResultCache(path) as c:
+            for key in ("a", "b", "c"):
+                c.put(key, [])
+        with ResultCache(path, max_entries=2) as c:
+            assert c.get("a") is None
+            assert [] == c.get("c")
+
+    def test_message_key_depends_on_message(self):
+        assert message_key("feat: a") != message_key("feat: b")
+
+
+class CachedHistoryTest:
+    def test_second_run_hits_cache(self, repo):
+        with ResultCache() as c:
+            first = list(lint_history(cwd=str(repo), cache=c))
+            assert (0, 3) == (c.hits, c.misses)
+            assert first == list(lint_history(cwd=str(repo), cache=c, chunk_size=2))
+            assert (3, 3) == (c.hits, c.misses)
+
+    def test_cli_reports_cache_stats(self, repo, monkeypatch, capsys):
+        monkeypatch.chdir(repo)
+        for _ in range(2):
+            with pytest.raises(SystemExit):
+                main(["--all", "--cache", str(repo / "cache.sqlite")])
+        assert "cache: 3 hits, 0 misses" in capsys.readouterr().err
@@ -0,0 +1,138 @@
+from pycolint.checks import (
+    CHECK_NAMES,
+    Check,
+    builtin_checks,
+    check,
+    enabled_checks,
+    header_length,
+)
+from pycolint.config import Config
+from pycolint.parser import Expression, ExpressionType as E, Problem, create_parser
+from pycolint.problem_types import ProblemType as P
+from pycolint.tokenizer import Kind as T, Token
+import pytest
+
+
+def types(problems) -> list[P]:
+    return [p.type for p in problems]
+
+
+class BuiltinChecksTest:
+    @pytest.fixture
+    def parse(self):
+        return create_parser(checks=builtin_checks(20))
+
+    def test_valid_message(self, parse):
+        assert [] == parse("feat(cli): add x\n\nbody")
+
+    def test_scope_of_several_words(self, parse):
+        (problem,) = parse("feat(a b): x")
+        assert P.USE_SINGLE_WORD_FOR_SCOPE == problem.type
+        assert "b" == problem.token.value
+
+    def test_body_without_separator(self, parse):
+        (problem,) = parse("feat: x\nbody")
+        assert P.MISSING_BDY_SEP == problem.type
+        assert (2, 2) == (problem.token.line, problem.token.column)
+
+    def test_past_tense(self, parse):
+        assert [P.PAST_TENSE] == types(parse("fix: Added x"))
+        assert [] == types(parse("fix: add x"))
+
+    def test_header_length(self, parse):
+        assert [] == parse("feat: " + "x" * 14)
+        (problem,) = parse("feat: " + "x" * 11 + " abc")
+        assert P.TOO_LONG_HDR == problem.type
+        assert "abc" == problem.token.value
+
+    def test_header_length_does_not_count_body(self, parse):
+        assert [] == parse("feat: a\n\n" + "x" * 30)
+
+    def test_empty_scope(self, parse):
+        problems = parse("feat(): a")
+        assert [P.EMPTY_SCOPE, P.ERROR] == types(problems)
+        assert (1, 6) == (problems[0].token.line, problems[0].token.column)
+
+    @pytest.mark.parametrize("msg", ["fix: ()x", " x())", "fix(a)(): x", "feat( ): a"])
+    def test_empty_scope_only_after_type(self, parse, msg):
+        assert P.EMPTY_SCOPE not in types(parse(msg))
+
+    @pytest.mark.parametrize(
+        "msg, expected",
+        [
+            ("fix: ()x", [(P.ERROR, 1, 7)]),
+            (" x())", [(P.INVALID_TYPE, 1, 1), (P.ERROR, 1, 4)]),
+            ("feat(): a", [(P.ERROR, 1, 6)]),
+            ("feat()", [(P.ERROR, 1, 6)]),
+            ("fix: x\nbody", []),
+            ("fix(a b): x", []),
+        ],
+    )
+    def test_without_checks_problems_are_unchanged(self, msg, expected):
+        problems = create_parser(checks=())(msg)
+        assert expected == [(p.type, p.token.line, p.token.column) for p in problems]
+
+    def test_names(self):
+        assert CHECK_NAMES == tuple(sorted(c.name for c in builtin_checks()))
+
+
+class EnabledChecksTest:
+    def test_all_are_opt_in(self):
+        assert () == enabled_checks()
+        assert () == enabled_checks(Config())
+
+    def test_config_enables_and_disables(self):
+        config = Config(
+            enable_checks=frozenset({"past-tense", "single-word-scope"}),
+            disable_checks=frozenset({"single-word-scope"}),
+        )
+        assert ["past-tense"] == [c.name for c in enabled_checks(config)]
+
+    def test_default_parser_runs_no_checks(self):
+        parse = create_parser()
+        assert [] == parse("feat(a b): x")
+        assert [] == parse("fix: x\nbody")
+        assert [] == parse("feat: added " + "x" * 80)
+
+    def test_parser_uses_config(self):
+        config = Config(
+            enable_checks=frozenset({"header-length"}), max_header_length=10
+        )
+        assert [P.TOO_LONG_HDR] == types(create_parser(config=config)("feat: a b c d"))
+
+
+class PluginTest:
+    def test_subscribes_to_tokens_and_expressions(self):
+        seen: list[Token | Expression] = []
+
+        @check(T.DOT, E.HDR, name="record")
+        def record(item) -> list[Problem]:
+            seen.append(item)
+            return []
+
+        create_parser(checks=[record])("feat: a.")
+        assert [T.DOT, E.HDR] == [
+            x.kind if isinstance(x, Token) else x.type for x in seen
+        ]
+
+    def test_problems_are_reported_in_parse_order(self):
+        @check(T.EXCL, name="no-breaking")
+        def no_breaking(t: Token) -> list[Problem]:
+            return [Problem(P.ERROR, t)]
+
+        parse = create_parser(checks=[no_breaking])
+        assert [P.ERROR, P.HDR_ENDS_IN_DOT] == types(parse("feat!: a."))
+
+    def test_check_failing_valid_messages_disables_fast_path(self):
+        everything = Check(
+            "everything",
+            lambda e: [Problem(P.ERROR, e.sub[0])],
+            frozenset({E.TYPE}),
+            valid_messages_pass=False,
+        )
+        assert [P.ERROR] == types(create_parser(checks=[everything])("feat: a"))
+
+    def test_header_length_of_custom_limit(self):
+        parse = create_parser(checks=[header_length(6)])
+        assert [] == parse("fix: a")
+        assert [P.TOO_LONG_HDR] == types(parse("fix: ab"))
@@ -0,0 +1,189 @@
+import os
+
+from pycolint import config as config_module
+from pycolint.config import (
+    Config,
+    ConfigError,
+    check_header,
+    find_pyproject,
+    load_config,
+)
+from pycolint.problem_types import ProblemType as P
+import pytest
+
+PYPROJECT = """
+[project]
+name = "example"
+
+[tool.pycolint]
+types = ["feat", "fix"]
+scopes = ["parser"]
+scope-patterns = ["pkg-[a-z]+"]
+enable-checks = ["header-length"]
+max-header-length = 50
+"""
+
+
+def types(problems) -> list[P]:
+    return [p.type for p in problems]
+
+
+@pytest.fixture
+def pyproject(tmp_path):
+    path = tmp_path / "pyproject.toml"
+    path.write_text(PYPROJECT)
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+class ConfigTest:
+    def test_from_table(self):
+        config = Config.from_table({"types": ["feat"], "scope-patterns": ["a|b"]})
+        assert frozenset({"feat"}) == config.types
+        assert config.scopes is None
+        assert config.allows_scope("b")
+        assert not config.allows_scope("ab")
+
+    def test_default_allows_everything(self):
+        assert not Config().checks_header
+        assert Config().allows_type("anything")
+        assert Config().allows_scope("anything")
+        assert "" == Config().digest()
+
+    def test_scopes_and_patterns_are_combined(self):
+        config = Config(scopes=frozenset({"cli"}), scope_patterns=("pkg-[a-z]+",))
+        assert config.allows_scope("cli")
+        assert config.allows_scope("pkg-parser")
+        assert not config.allows_scope("pkg-")
+
+    def test_rejects_unknown_keys(self):
+        with pytest.raises(ConfigError, match="typs"):
+            Config.from_table({"typs": ["feat"]})
+
+    def test_rejects_values_other_than_strings(self):
+        with pytest.raises(ConfigError, match="types"):
+            Config.from_table({"types": "feat"})
+
+    def test_rejects_invalid_pattern(self):
+        with pytest.raises(ConfigError, match="pattern"):
+            Config(scope_patterns=("(",))
+
+    def test_checks(self):
+        config = Config.from_table(
+            {"enable-checks": ["past-tense"], "max-header-length": 50}
+        )
+        assert frozenset({"past-tense"}) == config.enable_checks
+        assert 50 == config.max_header_length
+        assert "" != config.digest()
+
+    def test_rejects_unknown_checks(self):
+        with pytest.raises(ConfigError, match="past-tens"):
+            Config.from_table({"disable-checks": ["past-tens"]})
+
+    @pytest.mark.parametrize("value", [0, "72", True])
+    def test_rejects_invalid_header_length(self, value):
+        with pytest.raises(ConfigError, match="max-header-length"):
+            Config.from_table({"max-header-length": value})
+
+    def test_digest_depends_on_content(self):
+        a = Config(types=frozenset({"feat", "fix"}))
+        assert a.digest() == Config(types=frozenset({"fix", "feat"})).digest()
+        assert a.digest() != Config(types=frozenset({"feat"})).digest()
+
+
+class CheckHeaderTest:
+    config = Config(types=frozenset({"feat"}), scopes=frozenset({"cli"}))
+
+    def test_allowed_header(self):
+        assert [] == check_header(self.config, "feat(cli)!: msg")
+
+    def test_unknown_type(self):
+        (problem,) = check_header(self.config, "docs: msg")
+        assert P.UNKNOWN_TYPE == problem.type
+        assert "docs" == problem.token.value
+
+    def test_unknown_scope(self):
+        (problem,) = check_header(self.config, "feat(parser): msg")
+        assert P.UNKNOWN_SCOPE == problem.type
+        assert (1, 6) == (problem.token.line, problem.token.column)
+
+    def test_leaves_malformed_headers_to_parser(self):
+        assert [] == check_header(self.config, "docs msg")
+        assert [] == check_header(self.config, "")
+
+
+class LoadConfigTest:
+    def test_finds_pyproject_in_parent(self, pyproject, tmp_path):
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        assert str(pyproject) == find_pyproject(nested)
+
+    def test_loads_tool_table(self, pyproject, cache_dir):
+        config = load_config(pyproject, cache_dir=cache_dir)
+        assert frozenset({"feat", "fix"}) == config.types
+        assert config.allows_scope("pkg-cli")
+        assert frozenset({"header-length"}) == config.enable_checks
+        assert 50 == config.max_header_length
+
+    def test_without_tool_table(self, tmp_path, cache_dir):
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[project]\nname = "example"\n')
+        assert Config() == load_config(path, cache_dir=cache_dir)
+
+    def test_does_not_parse_without_tool_table(self, tmp_path, cache_dir, monkeypatch):
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[project]\nname = "pycolint"\n[tool.ruff]\n')
+
+        def fail(path):
+            raise AssertionError("parsed")
+
+        monkeypatch.setattr(config_module, "_read_table", fail)
+        assert Config() == load_config(path, cache_dir=cache_dir)
+        assert not os.path.exists(cache_dir)
+
+    def test_invalid_toml(self, tmp_path, cache_dir):
+        path = tmp_path / "pyproject.toml"
+        path.write_text("[tool.pycolint\n")
+        with pytest.raises(ConfigError):
+            load_config(path, cache_dir=cache_dir)
+
+    def test_missing_file(self, tmp_path, cache_dir):
+        with pytest.raises(ConfigError):
+            load_config(tmp_path / "pyproject.toml", cache_dir=cache_dir)
+
+    def test_reads_disk_cache_without_parsing(self, pyproject, cache_dir, monkeypatch):
+        expected = load_config(pyproject, cache_dir=cache_dir)
+        assert os.listdir(cache_dir)
+        config_module._load.cache_clear()
+
+        def fail(path):
+            raise AssertionError("parsed again")
+
+        monkeypatch.setattr(config_module, "_read_table", fail)
+        assert expected == load_config(pyproject, cache_dir=cache_dir)
+
+    def test_reloads_changed_file(self, pyproject, cache_dir):
+        load_config(pyproject, cache_dir=cache_dir)
+        pyproject.write_text(PYPROJECT.replace('"fix"', '"fix", "docs"'))
+        st = pyproject.stat()
+        os.utime(pyproject, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert "docs" in load_config(pyproject, cache_dir=cache_dir).types
+
+    def test_ignores_cache_of_other_version(self, pyproject, cache_dir, monkeypatch):
+        load_config(pyproject, cache_dir=cache_dir)
+        config_module._load.cache_clear()
+        monkeypatch.setattr(config_module, "_CACHE_VERSION", 0)
+        monkeypatch.setattr(config_module, "_read_table", lambda path: {})
+        assert Config() == load_config(pyproject, cache_dir=cache_dir)
+
+    def test_ignores_corrupt_cache(self, pyproject, cache_dir):
+        load_config(pyproject, cache_dir=cache_dir)
+        for name in os.listdir(cache_dir):
+            with open(os.path.join(cache_dir, name), "wb") as f:
+                f.write(b"\x00garbage")
+        config_module._load.cache_clear()
+        assert "feat" in load_config(pyproject, cache_dir=cache_dir).types
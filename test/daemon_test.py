@@ -0,0 +1,155 @@
+import os
+import shutil
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+from pycolint.client import default_socket_path, main as client_main, request
+from pycolint.daemon import LintServer, _Handler
+import pytest
+
+
+@pytest.fixture
+def socket_path():
+    # tmp_path may exceed the maximum length of a socket path
+    d = tempfile.mkdtemp()
+    yield os.path.join(d, "pycolint.sock")
+    shutil.rmtree(d)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    server = LintServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,))
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class DaemonTest:
+    def test_returns_problems(self, daemon):
+        response = request("feat: msg.", path=daemon)
+        assert [["HDR_ENDS_IN_DOT", 1, 11]] == response["problems"]
+        assert "may not end with a dot" in response["text"]
+
+    def test_summary(self, daemon):
+        response = request("feat: msg.", summary=True, path=daemon)
+        assert response["text"].startswith("1:11: HDR_ENDS_IN_DOT")
+
+    def test_valid_message(self, daemon):
+        assert [] == request("feat: msg", path=daemon)["problems"]
+
+    def test_serves_many_requests(self, daemon):
+        for _ in range(3):
+            assert request("fix : a", path=daemon)["problems"]
+
+    def test_invalid_request(self, daemon):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.connect(daemon)
+            s.sendall(b"not json")
+            s.shutdown(socket.SHUT_WR)
+            assert b"error" in s.recv(1024)
+
+    def test_uses_config_of_working_directory(self, daemon, tmp_path, monkeypatch):
+        (tmp_path / "pyproject.toml").write_text('[tool.pycolint]\ntypes = ["fix"]\n')
+        monkeypatch.chdir(tmp_path)
+        problems = request("feat: msg", path=daemon)["problems"]
+        assert [["UNKNOWN_TYPE", 1, 1]] == problems
+
+    def test_uses_config_of_request(self, daemon, tmp_path):
+        config = tmp_path / "lint.toml"
+        config.write_text('[tool.pycolint]\ntypes = ["fix"]\n')
+        problems = request("feat: msg", path=daemon, config=str(config))["problems"]
+        assert [["UNKNOWN_TYPE", 1, 1]] == problems
+
+    def test_invalid_config_is_an_error(self, daemon, tmp_path, monkeypatch):
+        (tmp_path / "pyproject.toml").write_text('[tool.pycolint]\ntypes = "fix"\n')
+        monkeypatch.chdir(tmp_path)
+        assert request("feat: msg", path=daemon) is None
+
+    def test_socket_is_removed_on_close(self, socket_path):
+        LintServer(socket_path).server_close()
+        assert not Path(socket_path).exists()
+
+    def test_replaces_stale_socket(self, socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.bind(socket_path)
+        LintServer(socket_path).server_close()
+
+    def test_refuses_to_replace_running_daemon(self, daemon):
+        with pytest.raises(RuntimeError):
+            LintServer(daemon)
+        assert [] == request("feat: msg", path=daemon)["problems"]
+
+    def test_ignores_connection_without_request(self, daemon, capsys):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.connect(daemon)
+        assert [] == request("feat: msg", path=daemon)["problems"]
+        assert "Traceback" not in capsys.readouterr().err
+
+    def test_times_out_idle_client(self, daemon, monkeypatch):
+        monkeypatch.setattr(_Handler, "timeout", 0.05)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle:
+            idle.connect(daemon)
+            assert [] == request("feat: msg", path=daemon)["problems"]
+
+    def test_socket_is_private(self, daemon):
+        assert 0o600 == os.stat(daemon).st_mode & 0o777
+
+    def test_refuses_directory_of_other_users(self, socket_path):
+        os.chmod(os.path.dirname(socket_path), 0o777)
+        with pytest.raises(RuntimeError):
+            LintServer(socket_path)
+
+    def test_default_path_without_runtime_dir(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        path = default_socket_path()
+        assert tmp_path / f"pycolint-{os.getuid()}" / "daemon.sock" == Path(path)
+
+
+class ClientTest:
+    def test_no_daemon(self, socket_path):
+        assert request("feat: msg", path=socket_path) is None
+
+    def test_does_not_connect_in_shared_directory(self, daemon):
+        os.chmod(os.path.dirname(daemon), 0o777)
+        assert request("feat: msg", path=daemon) is None
+
+    def test_prints_problems_of_daemon(self, daemon, capsys):
+        with pytest.raises(SystemExit) as e:
+            client_main(["--socket", daemon, "feat:", "msg."])
+        assert 1 == e.value.code
+        assert "may not end with a dot" in capsys.readouterr().err
+
+    def test_falls_back_to_linting_in_process(self, socket_path, capsys):
+        with pytest.raises(SystemExit) as e:
+            client_main(["--socket", socket_path, "--summary", "feat: msg."])
+        assert 1 == e.value.code
+        assert capsys.readouterr().err.startswith("1:11: HDR_ENDS_IN_DOT")
+
+    def test_sends_config_option_to_daemon(self, daemon, tmp_path, capsys):
+        config = tmp_path / "lint.toml"
+        config.write_text('[tool.pycolint]\ntypes = ["fix"]\n')
+        with pytest.raises(SystemExit):
+            client_main(["--socket", daemon, "--config", str(config), "feat: msg"])
+        assert "Unknown type" in capsys.readouterr().err
+
+    def test_passes_config_option_to_fallback(self, socket_path, tmp_path, capsys):
+        config = tmp_path / "lint.toml"
+        config.write_text('[tool.pycolint]\ntypes = ["fix"]\n')
+        args = ["--socket", socket_path, "--config", str(config), "--summary"]
+        with pytest.raises(SystemExit):
+            client_main([*args, "feat: msg"])
+        assert capsys.readouterr().err.startswith("1:1: UNKNOWN_TYPE")
+
+    def test_valid_message_without_daemon(self, socket_path, capsys):
+        client_main(["--socket", socket_path, "feat: msg"])
+        assert "feat: msg\n" == capsys.readouterr().err
+
+    def test_options_in_message_are_words(self, daemon, capsys):
+        client_main(["--socket", daemon, "fix:", "drop", "the", "--all", "flag"])
+        assert "fix: drop the --all flag\n" == capsys.readouterr().err
@@ -0,0 +1,104 @@
+import io
+
+from pycolint.error_msgs import (
+    DEFAULT_PROBLEM_MAP,
+    print_msgs,
+    problem_map,
+    render_msgs,
+    render_summary,
+)
+from pycolint.config import Config
+from pycolint.parser import create_parser
+from pycolint.problem_types import ProblemType as P
+
+
+def problems(msg: str):
+    return create_parser()(msg)
+
+
+class RenderMsgsTest:
+    def test_valid_message_is_printed_unchanged(self):
+        assert "feat: msg\n" == render_msgs(DEFAULT_PROBLEM_MAP, "feat: msg", [])
+
+    def test_lines_without_problems_are_not_annotated(self):
+        msg = "feat: msg\n\nbody."
+        assert msg + "\n" == render_msgs(DEFAULT_PROBLEM_MAP, msg, [])
+
+    def test_points_to_problem(self):
+        msg = "feat: msg."
+        assert (
+            "feat: msg.\n"
+            "           ^ \n"
+            "           +-The commit msg header may not end with a dot\n"
+        ) == render_msgs(DEFAULT_PROBLEM_MAP, msg, problems(msg))
+
+    def test_stacks_problems_of_one_line(self):
+        msg = "feat :  a."
+        lines = render_msgs(DEFAULT_PROBLEM_MAP, msg, problems(msg)).splitlines()
+        assert "     ^  ^  ^ " == lines[1]
+        assert lines[2].startswith("     +--|--|-Invalid type.")
+        assert lines[-1].endswith("+-The commit msg header may not end with a dot")
+
+    def test_multi_line_explanation_of_first_problem(self):
+        msg = "feat:  a"
+        lines = render_msgs(DEFAULT_PROBLEM_MAP, msg, problems(msg)).splitlines()
+        assert lines[2].endswith("The colon after the scope or type needs to")
+        assert lines[3].endswith(" be followed by exactly *one* space character.")
+
+    def test_problem_without_explanation_shows_name(self):
+        msg = "feat(x: a"
+        probs = problems(msg)
+        assert P.UNCLOSED_SCOPE in {p.type for p in probs}
+        assert "UNCLOSED_SCOPE" in render_msgs({}, msg, probs)
+
+    def test_problem_at_end_follows_empty_body(self):
+        msg = "feat: a\n\n"
+        lines = render_msgs(DEFAULT_PROBLEM_MAP, msg, problems(msg)).split("\n")
+        assert ["feat: a", "", "", "  ^ "] == lines[:4]
+        assert lines[4].startswith("  +-If you have a new line after the header")
+
+
+class RenderSummaryTest:
+    def test_one_line_per_problem(self):
+        msg = "feat :  a."
+        summary = render_summary(DEFAULT_PROBLEM_MAP, msg, problems(msg))
+        assert [
+            "1:5: INVALID_TYPE: Invalid type."
+            " Specify type like this '<type>: <summary>'",
+            "1:8: TOO_MUCH_WHITESPACE_AFTER_COLON:"
+            " The colon after the scope or type needs to",
+            "1:11: HDR_ENDS_IN_DOT: The commit msg header may not end with a dot",
+        ] == summary.splitlines()
+
+    def test_problem_at_end_of_message(self):
+        msg = "feat: a\n\n"
+        summary = render_summary({}, msg, problems(msg))
+        assert "3:2: EMPTY_BODY: EMPTY_BODY\n" == summary
+
+
+class PrintMsgsTest:
+    def test_writes_to_file(self):
+        out = io.StringIO()
+        msg = "feat: msg."
+        print_msgs(DEFAULT_PROBLEM_MAP, msg, problems(msg), file=out)
+        assert "may not end with a dot" in out.getvalue()
+
+    def test_summary(self):
+        out = io.StringIO()
+        msg = "feat: msg."
+        print_msgs(DEFAULT_PROBLEM_MAP, msg, problems(msg), file=out, summary=True)
+        assert (
+            "1:11: HDR_ENDS_IN_DOT: The commit msg header may not end with a dot\n"
+            == out.getvalue()
+        )
+
+
+class ProblemMapTest:
+    def test_default_limit(self):
+        assert DEFAULT_PROBLEM_MAP is problem_map()
+        assert "length of 50 characters" in DEFAULT_PROBLEM_MAP[P.TOO_LONG_HDR]
+
+    def test_configured_limit(self):
+        mapping = problem_map(Config(max_header_length=50))
+        assert "length of 50 characters" in mapping[P.TOO_LONG_HDR]
+        assert DEFAULT_PROBLEM_MAP[P.NO_TYPE] == mapping[P.NO_TYPE]
@@ -0,0 +1,119 @@
+import io
+import json
+
+from pycolint.batch import ProblemRecord
+from pycolint.formats import JsonlWriter, SarifWriter, create_writer
+from pycolint.main import main
+from pycolint.problem_types import ProblemType as P
+import pytest
+
+from .batch_test import git, repo  # noqa: F401
+
+
+PROBLEMS = [ProblemRecord(P.INVALID_TYPE, 1, 4), ProblemRecord(P.ERROR, 1, 9)]
+
+
+class JsonlWriterTest:
+    def test_one_record_per_message(self):
+        out = io.StringIO()
+        w = JsonlWriter(out)
+        w.write("abc", "fix : a", PROBLEMS)
+        w.write("def", "fix: a", [])
+        w.close()
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [
+            {
+                "commit": "abc",
+                "problems": [
+                    {"type": "INVALID_TYPE", "line": 1, "column": 4},
+                    {"type": "ERROR", "line": 1, "column": 9},
+                ],
+            },
+            {"commit": "def", "problems": []},
+        ] == records
+
+    def test_writes_each_message_immediately(self):
+        out = io.StringIO()
+        w = JsonlWriter(out)
+        w.write(None, "fix : a", PROBLEMS)
+        assert 1 == len(out.getvalue().splitlines())
+
+    def test_problem_at_end_of_message_is_at_end_of_last_line(self):
+        out = io.StringIO()
+        JsonlWriter(out).write(
+            None, "feat: a\n\n", [ProblemRecord(P.EMPTY_BODY, -1, -1)]
+        )
+        problem = json.loads(out.getvalue())["problems"][0]
+        assert {"type": "EMPTY_BODY", "line": 3, "column": 2} == problem
+
+
+class SarifWriterTest:
+    def sarif(self, *messages) -> dict:
+        out = io.StringIO()
+        w = SarifWriter(out)
+        for commit, problems in messages:
+            w.write(commit, "", problems)
+        w.close()
+        return json.loads(out.getvalue())
+
+    def test_empty_log_is_valid(self):
+        log = self.sarif()
+        assert "2.1.0" == log["version"]
+        assert [] == log["runs"][0]["results"]
+
+    def test_one_result_per_problem(self):
+        results = self.sarif(("abc", PROBLEMS), ("def", PROBLEMS[:1]))["runs"][0][
+            "results"
+        ]
+        assert ["INVALID_TYPE", "ERROR", "INVALID_TYPE"] == [
+            r["ruleId"] for r in results
+        ]
+        assert ["abc", "abc", "def"] == [r["properties"]["commit"] for r in results]
+        assert {"startLine": 1, "startColumn": 4} == results[0]["locations"][0][
+            "physicalLocation"
+        ]["region"]
+
+    def test_rule_index_refers_to_rule(self):
+        log = self.sarif(("abc", PROBLEMS))
+        rules = log["runs"][0]["tool"]["driver"]["rules"]
+        for r in log["runs"][0]["results"]:
+            assert r["ruleId"] == rules[r["ruleIndex"]]["id"]
+
+    def test_problem_at_end_of_message_has_no_region(self):
+        results = self.sarif((None, [ProblemRecord(P.ERROR, -1, -1)]))["runs"][0][
+            "results"
+        ]
+        assert "region" not in results[0]["locations"][0]["physicalLocation"]
+        assert "properties" not in results[0]
+
+
+class CreateWriterTest:
+    def test_rejects_text(self):
+        with pytest.raises(ValueError):
+            create_writer("text", io.StringIO())
+
+
+class MainFormatTest:
+    def test_jsonl_for_message(self, capsys):
+        with pytest.raises(SystemExit):
+            main(["--format", "jsonl", "feat: msg."])
+        out, err = capsys.readouterr()
+        assert "HDR_ENDS_IN_DOT" == json.loads(out)["problems"][0]["type"]
+        assert "" == err
+
+    def test_jsonl_for_history(self, repo, monkeypatch, capsys):  # noqa: F811
+        monkeypatch.chdir(repo)
+        with pytest.raises(SystemExit) as e:
+            main(["--all", "--format", "jsonl"])
+        assert 1 == e.value.code
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert 3 == len(records)
+        assert [1, 0, 0] == sorted((len(r["problems"]) for r in records), reverse=True)
+
+    def test_sarif_for_history(self, repo, monkeypatch, capsys):  # noqa: F811
+        monkeypatch.chdir(repo)
+        sha = git(repo, "rev-parse", "HEAD~1").strip()
+        with pytest.raises(SystemExit):
+            main(["--all", "--format", "sarif"])
+        results = json.loads(capsys.readouterr().out)["runs"][0]["results"]
+        assert [sha] == [r["properties"]["commit"] for r in results]
@@ -0,0 +1,103 @@
+import random
+
+from pycolint.config import Config
+from pycolint.incremental import Session
+from pycolint.parser import create_parser
+from pycolint.problem_types import ProblemType as P
+from pycolint.tokenizer import Tokenizer
+import pytest
+
+
+def types(problems) -> list[P]:
+    return [p.type for p in problems]
+
+
+class SessionTest:
+    def test_lints_initial_text(self):
+        assert [P.INVALID_TYPE] == types(Session("feat : msg").problems)
+
+    def test_edit_returns_problems_of_new_text(self):
+        s = Session("feat : msg")
+        assert [] == s.edit(4, 5, "")
+        assert "feat: msg" == s.text
+
+    def test_replace_lints_from_scratch(self):
+        s = Session("feat: msg")
+        assert [P.EMPTY_HDR] == types(s.replace(""))
+
+    def test_rejects_range_outside_of_text(self):
+        with pytest.raises(ValueError):
+            Session("feat: msg").edit(5, 20, "")
+
+    def test_reports_problems_in_body(self):
+        s = Session("feat: msg\n\nbody")
+        problems = s.edit(15, 15, "\nmore")
+        assert [P.ERROR] == types(problems)
+        assert (3, 6) == (problems[0].token.line, problems[0].token.column)
+
+    def test_apply_lints_burst_of_edits_once(self, monkeypatch):
+        s = Session("feat: msg")
+        starts = []
+        iter_tokens = Tokenizer.iter_tokens
+
+        def record(self, text, start=0, line=1):
+            starts.append(start)
+            return iter_tokens(self, text, start, line)
+
+        monkeypatch.setattr(Tokenizer, "iter_tokens", record)
+        for i, c in enumerate("\n\nbody"):
+            s.apply(9 + i, 9 + i, c)
+        assert [] == starts
+        assert [] == s.problems
+        assert [0] == starts
+
+    def test_edit_at_start_of_empty_line(self):
+        s = Session("a)\tm\n\n\nve")
+        problems = s.edit(6, 6, "x y")
+        assert create_parser(check_body=True)(s.text) == problems
+        assert 3 == problems[-1].token.line
+
+    def test_body_edit_does_not_tokenize_header(self, monkeypatch):
+        s = Session("feat(scope): msg\n\nbody")
+        starts = []
+        iter_tokens = Tokenizer.iter_tokens
+
+        def record(self, text, start=0, line=1):
+            starts.append(start)
+            return iter_tokens(self, text, start, line)
+
+        monkeypatch.setattr(Tokenizer, "iter_tokens", record)
+        s.edit(22, 22, " text")
+        assert [18] == starts
+
+    def test_agrees_with_parser_while_typing(self):
+        parse = create_parser(check_body=True)
+        msg = "feat(scope)!: add x\n\nsome body.\n\nRefs: #1\n"
+        s = Session()
+        for i, c in enumerate(msg):
+            assert parse(s.text + c) == s.edit(i, i, c)
+
+    def test_agrees_with_parser_on_random_edits(self):
+        rnd = random.Random(0)
+        parse = create_parser(check_body=True)
+        parts = ("feat", "a", "(", ")", "!", ": ", " ", "\n", "\n\n", ".", "x y")
+        s = Session("feat(a): b\n\nbody\n")
+        for _ in range(500):
+            start = rnd.randint(0, len(s.text))
+            end = min(len(s.text), start + rnd.randint(0, 3))
+            new_text = "".join(rnd.choices(parts, k=rnd.randint(0, 2)))
+            assert parse(s.text[:start] + new_text + s.text[end:]) == s.edit(
+                start, end, new_text
+            )
+
+    def test_runs_text_checks(self):
+        config = Config(enable_checks=frozenset({"empty-scope"}))
+        s = Session("feat(a): b", config=config)
+        assert [P.EMPTY_SCOPE, P.ERROR] == types(s.edit(5, 6, ""))
+        assert create_parser(check_body=True, config=config)(s.text) == s.problems
+
+    def test_checks_header_against_config(self):
+        config = Config(types=frozenset({"feat"}))
+        s = Session("feat: msg", config=config)
+        assert [P.UNKNOWN_TYPE] == types(s.edit(0, 4, "docs"))
+        assert create_parser(check_body=True, config=config)(s.text) == s.problems
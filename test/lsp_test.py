@@ -0,0 +1,225 @@
+import io
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+from pycolint.lsp import (
+    DEBOUNCE,
+    LanguageServer,
+    config_for,
+    diagnostics,
+    offset,
+    read_message,
+    write_message,
+)
+from pycolint.parser import create_parser
+from pycolint.problem_types import ProblemType as P
+import pytest
+
+# Time from the last change of a burst to its diagnostics, on top of
+# the debounce delay.
+LATENCY_BUDGET = 0.2
+
+URI = "file:///repo/.git/COMMIT_EDITMSG"
+
+
+def position(line: int, character: int) -> dict:
+    return {"line": line, "character": character}
+
+
+def messages(out: io.BytesIO) -> list[dict]:
+    out.seek(0)
+    result = []
+    while (m := read_message(out)) is not None:
+        result.append(m)
+    return result
+
+
+class PositionTest:
+    def test_offset(self):
+        assert 6 == offset("feat: a\nb", position(0, 6))
+        assert 8 == offset("feat: a\nb", position(1, 0))
+        assert 9 == offset("feat: a\r\nb", position(1, 0))
+
+    def test_offset_is_clamped_to_line(self):
+        assert 7 == offset("feat: a\nb", position(0, 20))
+        assert 9 == offset("feat: a\nb", position(5, 0))
+
+    def test_offset_counts_utf16_units(self):
+        assert 2 == offset("\U0001f600a", position(0, 3))
+        assert 2 == offset("\U0001f600ab", position(0, 2), utf16=False)
+
+    def test_diagnostic_of_header(self):
+        (d,) = diagnostics("feat : a", create_parser()("feat : a"))
+        assert "INVALID_TYPE" == d["code"]
+        assert {"start": position(0, 4), "end": position(0, 5)} == d["range"]
+
+    def test_diagnostic_of_body(self):
+        text = "feat: a\n\nbody\nmore"
+        (d,) = diagnostics(text, create_parser(check_body=True)(text))
+        assert {"start": position(2, 4), "end": position(2, 4)} == d["range"]
+
+    def test_diagnostic_at_end_of_text(self):
+        (d,) = diagnostics("feat: a\n\n", create_parser()("feat: a\n\n"))
+        assert "EMPTY_BODY" == d["code"]
+        assert position(2, 0) == d["range"]["start"]
+
+    def test_diagnostic_explained_by_mapping(self):
+        mapping = {P.INVALID_TYPE: "no space before the colon"}
+        (d,) = diagnostics("feat : a", create_parser()("feat : a"), mapping=mapping)
+        assert "no space before the colon" == d["message"]
+
+    def test_config_of_document(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text('[tool.pycolint]\ntypes = ["fix"]\n')
+        uri = (tmp_path / ".git" / "COMMIT_EDITMSG").as_uri()
+        assert frozenset({"fix"}) == config_for(uri).types
+        assert config_for("untitled:Untitled-1").types is None
+
+
+class LanguageServerTest:
+    @pytest.fixture
+    def out(self) -> io.BytesIO:
+        return io.BytesIO()
+
+    @pytest.fixture
+    def server(self, out) -> LanguageServer:
+        server = LanguageServer(out, debounce=0)
+        server.handle({"jsonrpc": "2.0", "id": 1, "method": "initialize"})
+        server.handle(
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didOpen",
+                "params": {"textDocument": {"uri": URI, "version": 1, "text": "a: b"}},
+            }
+        )
+        return server
+
+    def change(self, server, version, changes) -> None:
+        server.handle(
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didChange",
+                "params": {
+                    "textDocument": {"uri": URI, "version": version},
+                    "contentChanges": changes,
+                },
+            }
+        )
+
+    def test_publishes_on_open(self, server, out):
+        initialize, published = messages(out)
+        assert 2 == initialize["result"]["capabilities"]["textDocumentSync"]["change"]
+        assert "textDocument/publishDiagnostics" == published["method"]
+        assert [] == published["params"]["diagnostics"]
+
+    def test_publishes_changes_when_due(self, server, out):
+        at = {"start": position(0, 1), "end": position(0, 1)}
+        self.change(server, 2, [{"range": at, "text": " "}])
+        assert 2 == len(messages(out))
+        server.publish_due(time.monotonic())
+        published = messages(out)[-1]["params"]
+        assert 2 == published["version"]
+        assert ["INVALID_TYPE"] == [d["code"] for d in published["diagnostics"]]
+
+    def test_full_text_change(self, server, out):
+        self.change(server, 2, [{"text": "a: b."}])
+        server.publish_due(time.monotonic())
+        published = messages(out)[-1]["params"]
+        assert ["HDR_ENDS_IN_DOT"] == [d["code"] for d in published["diagnostics"]]
+
+    def test_unknown_request(self, server, out):
+        server.handle({"jsonrpc": "2.0", "id": 7, "method": "textDocument/hover"})
+        assert -32601 == messages(out)[-1]["error"]["code"]
+
+    def test_invalid_params(self, server, out):
+        server.handle({"jsonrpc": "2.0", "id": 7, "method": "initialize", "params": 3})
+        assert -32602 == messages(out)[-1]["error"]["code"]
+
+    def test_exit_after_shutdown(self, server):
+        server.handle({"jsonrpc": "2.0", "id": 2, "method": "shutdown"})
+        server.handle({"jsonrpc": "2.0", "method": "exit"})
+        assert 0 == server.exit_code
+
+
+class ScriptedClient:
+    """Drives `pycolint --lsp` in a subprocess like an editor would."""
+
+    def __init__(self) -> None:
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "pycolint.main", "--lsp"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self._incoming: queue.Queue = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+        self._id = 0
+
+    def _read(self) -> None:
+        while (m := read_message(self._process.stdout)) is not None:
+            self._incoming.put((time.monotonic(), m))
+
+    def send(self, method: str, params: dict | None = None, request=False) -> float:
+        message: dict = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        if request:
+            self._id += 1
+            message["id"] = self._id
+        write_message(self._process.stdin, message)
+        return time.monotonic()
+
+    def receive(self, timeout: float = 5.0) -> tuple[float, dict]:
+        return self._incoming.get(timeout=timeout)
+
+    def pending(self) -> int:
+        return self._incoming.qsize()
+
+    def close(self) -> int:
+        self.send("shutdown", request=True)
+        self.send("exit")
+        return self._process.wait(timeout=5)
+
+
+@pytest.fixture
+def client():
+    client = ScriptedClient()
+    client.send("initialize", {"capabilities": {}}, request=True)
+    client.receive()
+    client.send("initialized", {})
+    yield client
+    if client._process.poll() is None:
+        client._process.kill()
+
+
+class LatencyTest:
+    def test_burst_of_changes_is_published_once_in_time(self, client):
+        client.send(
+            "textDocument/didOpen",
+            {"textDocument": {"uri": URI, "version": 1, "text": ""}},
+        )
+        client.receive()
+        text = "feat : add a parser\n\nwith a body"
+        for i, c in enumerate(text):
+            line = text[:i].count("\n")
+            character = i - (text.rfind("\n", 0, i) + 1)
+            at = {"start": position(line, character), "end": position(line, character)}
+            sent = client.send(
+                "textDocument/didChange",
+                {
+                    "textDocument": {"uri": URI, "version": i + 2},
+                    "contentChanges": [{"range": at, "text": c}],
+                },
+            )
+        received, published = client.receive()
+        assert len(text) + 1 == published["params"]["version"]
+        assert ["INVALID_TYPE"] == [
+            d["code"] for d in published["params"]["diagnostics"]
+        ]
+        assert received - sent < DEBOUNCE + LATENCY_BUDGET
+        time.sleep(DEBOUNCE * 2)
+        assert 0 == client.pending()
+
+    def test_exits_after_shutdown(self, client):
+        assert 0 == client.close()
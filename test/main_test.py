@@ -0,0 +1,87 @@
+from pycolint.main import main
+import pytest
+
+
+class MainTest:
+    def test_exits_with_error_for_problems(self, capsys):
+        with pytest.raises(SystemExit) as e:
+            main(["feat:", "msg."])
+        assert 1 == e.value.code
+        assert "may not end with a dot" in capsys.readouterr().err
+
+    def test_trace_prints_applied_rules(self, capsys):
+        with pytest.raises(SystemExit):
+            main(["--trace", "feat: msg."])
+        err = capsys.readouterr().err
+        assert "rule" in err.splitlines()[0]
+
+    def test_stats_prints_rule_table(self, capsys):
+        with pytest.raises(SystemExit):
+            main(["--stats", "--", "feat: msg."])
+        err = capsys.readouterr().err
+        assert "fired" in err.splitlines()[0]
+
+    def test_stats_as_json(self, capsys):
+        with pytest.raises(SystemExit):
+            main(["--stats=json", "feat: msg."])
+        assert '"steps"' in capsys.readouterr().err
+
+    def test_options_in_message_are_words(self, capsys):
+        main(["fix:", "drop", "the", "--all", "flag"])
+        assert "fix: drop the --all flag\n" == capsys.readouterr().err
+
+    def test_valid_message(self, capsys):
+        main(["feat: msg"])
+        assert "feat: msg\n" == capsys.readouterr().err
+
+    def test_summary(self, capsys):
+        with pytest.raises(SystemExit):
+            main(["--summary", "feat: msg."])
+        assert capsys.readouterr().err.startswith("1:11: HDR_ENDS_IN_DOT")
+
+    def test_config_restricts_types(self, tmp_path, capsys):
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[tool.pycolint]\ntypes = ["fix"]\n')
+        with pytest.raises(SystemExit) as e:
+            main(["--config", str(path), "--summary", "feat: msg"])
+        assert 1 == e.value.code
+        assert "UNKNOWN_TYPE" in capsys.readouterr().err
+
+    def test_explains_configured_header_length(self, tmp_path, capsys):
+        path = tmp_path / "pyproject.toml"
+        path.write_text(
+            "[tool.pycolint]\n"
+            'enable-checks = ["header-length"]\n'
+            "max-header-length = 10\n"
+        )
+        with pytest.raises(SystemExit):
+            main(["--config", str(path), "--summary", "feat: a longer msg"])
+        assert "maximum length of 10 characters" in capsys.readouterr().err
+
+    def test_body_is_only_checked_if_a_check_reads_it(self, tmp_path, capsys):
+        msg = "fix: a\n\nb (c"
+        main([msg])
+        assert msg + "\n" == capsys.readouterr().err
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[tool.pycolint]\nenable-checks = ["body-separator"]\n')
+        with pytest.raises(SystemExit) as e:
+            main(["--config", str(path), "--summary", msg])
+        assert 1 == e.value.code
+        assert capsys.readouterr().err.startswith("3:4: ERROR")
+
+    @pytest.mark.parametrize(
+        "option", [["--jobs", "-1"], ["-j", "x"], ["--chunk-size", "0"]]
+    )
+    def test_rejects_invalid_numbers(self, option, capsys):
+        with pytest.raises(SystemExit) as e:
+            main([*option, "--all"])
+        assert 2 == e.value.code
+        assert "usage:" in capsys.readouterr().err
+
+    def test_invalid_config(self, tmp_path, capsys):
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[tool.pycolint]\ntypes = "fix"\n')
+        with pytest.raises(SystemExit) as e:
+            main(["--config", str(path), "feat: msg"])
+        assert 2 == e.value.code
+        assert capsys.readouterr().err.startswith("pycolint: ")
@@ -0,0 +1,62 @@
+from pycolint.memo import MemoizedParse
+from pycolint.parser import create_parser
+from pycolint.problem_types import ProblemType as P
+import dataclasses
+import pytest
+
+
+class CountingParse:
+    def __init__(self):
+        self.calls = 0
+        self._parse = create_parser()
+
+    def __call__(self, msg):
+        self.calls += 1
+        return self._parse(msg)
+
+
+class MemoizedParseTest:
+    @pytest.fixture
+    def parse(self) -> CountingParse:
+        return CountingParse()
+
+    def test_parses_duplicates_once(self, parse):
+        memo = MemoizedParse(parse)
+        first = memo("feat : msg")
+        assert first == memo("feat : msg")
+        assert 1 == parse.calls
+
+    def test_reports_hit_rate(self, parse):
+        memo = MemoizedParse(parse)
+        for msg in ("a: b", "a: b", "a: b", "c: d"):
+            memo(msg)
+        stats = memo.stats()
+        assert (2, 2, 2) == (stats.hits, stats.misses, stats.entries)
+        assert 0.5 == stats.hit_rate
+
+    def test_returned_list_does_not_change_cache(self, parse):
+        memo = MemoizedParse(parse)
+        memo("feat : msg").clear()
+        assert [P.INVALID_TYPE] == [p.type for p in memo("feat : msg")]
+
+    def test_problems_are_immutable(self, parse):
+        problem = MemoizedParse(parse)("feat : msg")[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            problem.type = P.ERROR
+
+    def test_drops_least_recently_used(self, parse):
+        memo = MemoizedParse(parse, max_entries=2)
+        for msg in ("a: 1", "b: 2", "a: 1", "c: 3", "a: 1", "b: 2"):
+            memo(msg)
+        assert 4 == parse.calls
+
+    def test_respects_size_limit(self, parse):
+        memo = MemoizedParse(parse, max_size=1000)
+        for i in range(100):
+            memo(f"feat: msg {i}")
+        assert memo.stats().size <= 1000
+
+    def test_does_not_store_too_large_messages(self, parse):
+        memo = MemoizedParse(parse, max_size=100)
+        memo("feat: " + "a" * 200)
+        assert 0 == memo.stats().entries
@@ -1,7 +1,16 @@
+import random
+
+from pycolint.checks import body_separator, past_tense
+from pycolint.config import Config
 from pycolint.parser import (
     Stack as _Stack,
     Expression,
     ExpressionType as E,
+    Rule,
+    RuleIndex,
+    TokenQueue,
+    create_grammar,
+    create_matcher,
     create_parser,
 )
 from pycolint.problem_types import ProblemType as P
@@ -61,6 +70,107 @@ class StackTest:
         s.reduce(E.SCOPE, 3, (1,))
         assert Expression(E.SCOPE, [token(T.WORD)]) == _s.top()
 
+    def test_last_expression_follows_push_pop_and_reduce(self):
+        _s = _Stack()
+        s = SimplifiedStack(_s)
+        for t in (E.START, E.TYPE, T.OPAR, T.WORD):
+            s.push(t)
+        assert expression(E.TYPE) == _s.last_expression()
+        s.reduce(E.SCOPE, 3, (1,))
+        assert E.SCOPE == _s.last_expression().type
+        s.pop()
+        assert expression(E.START) == _s.last_expression()
+        assert (expression(E.START),) == _s.get_expressions()
+
+
+class TokenQueueTest:
+    def test_advance_moves_cursor(self):
+        q = TokenQueue([token(T.WORD), token(T.EOF)])
+        q.advance()
+        assert q.before_eof()
+
+    def test_does_not_modify_input(self):
+        tokens = [token(T.WORD), token(T.EOF)]
+        q = TokenQueue(tokens)
+        q.advance()
+        assert 2 == len(tokens)
+
+    def test_pulls_tokens_on_advance(self):
+        tokens = iter([token(T.WORD), token(T.SKIP), token(T.EOF)])
+        q = TokenQueue(tokens)
+        q.advance()
+        assert T.SKIP == q.current().kind
+        assert T.EOF == next(tokens).kind
+
+
+class MatcherTest:
+    def test_kind_matches_token(self):
+        assert create_matcher(T.WORD)(token(T.WORD))
+
+    def test_kind_does_not_match_expression(self):
+        assert not create_matcher(T.WORD)(expression(E.TYPE))
+
+    def test_expression_type_matches_expression(self):
+        assert create_matcher(E.TYPE)(expression(E.TYPE))
+
+    def test_none_matches_everything(self):
+        m = create_matcher(None)
+        assert m(token(T.WORD)) and m(expression(E.HDR))
+
+    def test_rule_builds_matchers_once(self):
+        def noop(p):
+            pass
+
+        r = Rule(E.TYPE, T.WORD, E.HDR, noop)
+        m = r.match_top_of_stack
+        r.match_top_of_stack(expression(E.TYPE))
+        assert m is r.match_top_of_stack
+
+
+class RuleIndexTest:
+    @pytest.fixture
+    def rules(self) -> list[Rule]:
+        def noop(p):
+            pass
+
+        return [
+            Rule(T.WORD, T.SKIP, E.BODY, noop),
+            Rule(None, T.SKIP, E.HDR, noop),
+            Rule(T.WORD, T.SKIP, E.HDR, noop),
+            Rule(None, None, E.MSG, noop),
+        ]
+
+    @pytest.fixture
+    def index(self, rules) -> RuleIndex:
+        i = RuleIndex()
+        for r in rules:
+            i.add(r)
+        return i
+
+    def test_first_registered_rule_wins(self, index, rules):
+        active = {E.MSG: 0, E.HDR: 0}
+        assert rules[1] is index.lookup(token(T.WORD), token(T.SKIP), active)
+
+    def test_skips_rules_for_inactive_lhs(self, index, rules):
+        active = {E.MSG: 0, E.BODY: 0}
+        assert rules[0] is index.lookup(token(T.WORD), token(T.SKIP), active)
+
+    def test_falls_back_to_wildcard(self, index, rules):
+        active = {E.MSG: 0}
+        assert rules[3] is index.lookup(expression(E.HDR), token(T.EOF), active)
+
+    def test_value_patterns_compare_values(self, rules):
+        def noop(p):
+            pass
+
+        i = RuleIndex()
+        specific = Rule(_Token(T.WORD, "feat", 1, 1), None, E.MSG, noop)
+        i.add(specific)
+        i.add(rules[3])
+        active = {E.MSG: 0}
+        assert specific is i.lookup(_Token(T.WORD, "feat", 1, 1), token(T.EOF), active)
+        assert rules[3] is i.lookup(token(T.WORD), token(T.EOF), active)
+
 
 class NewParserCorrectStringsTest:
     @pytest.fixture
@@ -89,6 +199,57 @@ class NewParserCorrectStringsTest:
         assert [] == parse("feat: msg\n\n\n\nmy body")
 
 
+class ReusableParserTest:
+    def test_parse_several_messages_with_same_parser(self):
+        parse = create_parser()
+        assert [P.INVALID_TYPE] == [p.type for p in parse("feat : msg")]
+        assert [] == parse("feat: msg")
+        assert [P.HDR_ENDS_IN_DOT] == [p.type for p in parse("feat: msg.")]
+
+    def test_parsers_share_grammar(self):
+        grammar = create_grammar()
+        first, second = create_parser(grammar), create_parser(grammar)
+        assert first("feat: a") == second("feat: a")
+
+    def test_interning_does_not_change_problems(self):
+        msg = "feat(a b):  msg."
+        assert create_parser()(msg) == create_parser(intern=True)(msg)
+
+    def test_body_is_not_checked_without_check_body(self):
+        parse = create_parser(check_body=False)
+        full = create_parser(check_body=True)
+        assert [P.ERROR] == [p.type for p in full("feat: a\n\nb\nc.")]
+        assert [] == parse("feat: a\n\nb\nc.")
+
+    def test_body_is_only_checked_for_checks_reading_it(self):
+        msg = "feat: a\n\nb\nc."
+        assert [] == create_parser()(msg)
+        assert [] == create_parser(checks=[past_tense])(msg)
+        assert [P.ERROR] == [
+            p.type for p in create_parser(checks=[body_separator])(msg)
+        ]
+
+    def test_fast_path_without_check_body_ignores_the_body(self):
+        rnd = random.Random(0)
+        parts = ("feat: a", "(", ")", "!", ":", " ", "\n", "\n\n", ".", "x y")
+        parts += ("BREAKING CHANGE", "BREAKING-CHANGE", "\t", " \n")
+        fast = create_parser(check_body=False)
+        slow = create_parser(check_body=False, fast_path=False)
+        messages = [
+            "feat: a" + "".join(rnd.choices(parts, k=rnd.randint(0, 12)))
+            for _ in range(3000)
+        ]
+        assert [] == [m for m in messages if fast(m) != slow(m)]
+
+    def test_header_is_checked_without_check_body(self):
+        parse = create_parser(check_body=False)
+        assert [P.INVALID_TYPE] == [p.type for p in parse("feat : a\n\nb\nc.")]
+        assert [P.EMPTY_BODY] == [p.type for p in parse("feat: a\n\n")]
+
+    def test_problems_have_no_instance_dict(self):
+        assert not hasattr(create_parser()("feat: msg.")[0], "__dict__")
+
+
 class NewParserFindProblemsTest:
     @pytest.fixture
     def parse(self) -> None:
@@ -142,3 +303,11 @@ class NewParserFindProblemsTest:
 
     def test_empty_body_with_double_nl(self, find_problems) -> None:
         assert [P.EMPTY_BODY] == find_problems("feats: a\n\n")
+
+    def test_config_restricts_type_and_scope(self) -> None:
+        config = Config(types=frozenset({"feat"}), scopes=frozenset({"cli"}))
+        parse = create_parser(config=config)
+        assert [] == parse("feat(cli): a")
+        assert [P.UNKNOWN_TYPE, P.UNKNOWN_SCOPE, P.HDR_ENDS_IN_DOT] == [
+            p.type for p in parse("fix(api): a.")
+        ]
@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+import pytest
+
+# Import time, in microseconds, that linting a single message may spend
+# importing modules. Includes the standard library modules pulled in by
+# pycolint, measured with compiled bytecode available.
+IMPORT_BUDGET_US = 100_000
+
+# Modules only needed for history, caching, output formats, the daemon,
+# editors, asyncio services and statistics, a commit-msg hook should
+# never import them.
+NOT_FOR_SINGLE_MESSAGE = (
+    "asyncio",
+    "concurrent.futures",
+    "importlib.metadata",
+    "json",
+    "multiprocessing",
+    "socketserver",
+    "sqlite3",
+    "subprocess",
+    "tomli",
+    "tomllib",
+    "pycolint.aio",
+    "pycolint.batch",
+    "pycolint.cache",
+    "pycolint.daemon",
+    "pycolint.formats",
+    "pycolint.incremental",
+    "pycolint.lsp",
+    "pycolint.stats",
+)
+
+
+class Imports(NamedTuple):
+    # cumulative us of the top level imports
+    top_level: list[tuple[int, str]]
+    modules: set[str]
+
+
+def import_times(tmp_path: Path, *args: str) -> Imports:
+    """
+    The imports done from the first pycolint module on, while running
+    the cli with `args`.
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    cmd = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-X",
+        f"pycache_prefix={tmp_path}",
+        "-c",
+        f"from pycolint.main import main; main({list(args)!r})",
+    ]
+    # the first run only compiles the bytecode
+    subprocess.run(cmd, env=env, capture_output=True)
+    stderr = subprocess.run(cmd, env=env, capture_output=True, text=True).stderr
+    imports = Imports([], set())
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        nested = name.startswith("  ")
+        name = name.strip()
+        if not imports.modules and not name.startswith("pycolint"):
+            continue
+        imports.modules.add(name)
+        if not nested:
+            imports.top_level.append((int(cumulative), name))
+    return imports
+
+
+@pytest.fixture(scope="module")
+def single_message(tmp_path_factory) -> Imports:
+    return import_times(tmp_path_factory.mktemp("pycache"), "feat : a.")
+
+
+class StartupTest:
+    def test_single_message_imports_within_budget(self, single_message):
+        total = sum(us for us, _ in single_message.top_level)
+        assert total < IMPORT_BUDGET_US, "\n".join(
+            f"{us:>8} {name}" for us, name in sorted(single_message.top_level)
+        )
+
+    def test_single_message_imports_only_what_it_needs(self, single_message):
+        assert [] == [m for m in NOT_FOR_SINGLE_MESSAGE if m in single_message.modules]
+
+    def test_imports_are_recorded(self, single_message):
+        assert "pycolint.parser" in single_message.modules
@@ -0,0 +1,104 @@
+import json
+
+from pycolint.batch import lint_many
+from pycolint.checks import builtin_checks
+from pycolint.parser import create_grammar, create_parser
+from pycolint.stats import ParseStats
+from pycolint.trace import TraceRecorder
+
+
+class ParseStatsTest:
+    def test_fires_the_rules_applied_by_the_parser(self):
+        grammar = create_grammar()
+        stats = ParseStats()
+        trace = TraceRecorder()
+        create_parser(grammar, trace, stats=stats)("feat: msg.")
+        fired = {r.rule_id: r.fired for r in stats.rules() if r.fired > 0}
+        expected: dict[int, int] = {}
+        for e in trace:
+            expected[e.rule_id] = expected.get(e.rule_id, 0) + 1
+        assert expected == fired
+        assert len(trace) == stats.steps
+
+    def test_fired_rules_were_tried(self):
+        stats = ParseStats()
+        parse = create_parser(stats=stats)
+        for msg in ["feat: msg", "fix(x)!: a.", "feat", "feat: a\n\nb\nc"]:
+            parse(msg)
+        assert all(r.tried >= r.fired for r in stats.rules())
+        assert sum(r.fired for r in stats.rules()) == sum(
+            stats.tries_before_match.values()
+        )
+
+    def test_collects_over_many_messages(self):
+        stats = ParseStats()
+        parse = create_parser(stats=stats)
+        parse("feat: msg")
+        steps = stats.steps
+        parse("feat: msg")
+        assert 2 * steps == stats.steps
+
+    def test_does_not_change_problems(self):
+        msg = "feat(scope: msg."
+        assert create_parser()(msg) == create_parser(stats=ParseStats())(msg)
+
+    def test_records_time(self):
+        stats = ParseStats()
+        create_parser(stats=stats)("feat: msg")
+        assert stats.dispatch_ns > 0
+        assert stats.action_ns > 0
+
+    def test_lists_all_rules_of_grammar(self):
+        grammar = create_grammar()
+        stats = ParseStats()
+        create_parser(grammar, stats=stats)("feat: msg")
+        assert list(range(len(grammar.rules))) == [
+            r.rule_id for r in stats.rules(grammar)
+        ]
+
+    def test_dump_json(self):
+        grammar = create_grammar()
+        stats = ParseStats()
+        create_parser(grammar, stats=stats)("feat: msg")
+        data = json.loads(stats.dump_json(grammar))
+        assert stats.steps == data["steps"]
+        assert len(grammar.rules) == len(data["rules"])
+
+    def test_accounts_for_checks(self):
+        stats = ParseStats()
+        parse = create_parser(checks=builtin_checks(), stats=stats)
+        parse("feat(a b): added x")
+        by_name = {c.name: c for c in stats.checks()}
+        assert 1 == by_name["past-tense"].calls
+        assert 1 == by_name["single-word-scope"].problems
+        assert by_name["header-length"].calls > 1
+        assert "header-length" in stats.dump()
+        assert len(by_name) == len(json.loads(stats.dump_json())["checks"])
+
+    def test_clear(self):
+        stats = ParseStats()
+        create_parser(stats=stats)("feat: msg")
+        stats.clear()
+        assert 0 == stats.steps
+        assert [] == stats.rules()
+
+    def test_clear_keeps_collecting(self):
+        stats = ParseStats()
+        parse = create_parser(stats=stats)
+        parse("fix : a.")
+        steps = stats.steps
+        stats.clear()
+        assert [] == stats.checks()
+        parse("fix : a.")
+        assert steps == stats.steps
+
+    def test_lint_many_counts_repeated_messages(self):
+        once, twice = ParseStats(), ParseStats()
+        list(lint_many(["fix : a."], stats=once))
+        list(lint_many(["fix : a."] * 2, stats=twice))
+        assert 2 * once.steps == twice.steps
+
+    def test_lint_many_collects_stats(self):
+        stats = ParseStats()
+        list(lint_many(["feat: a", "fix: b."], jobs=2, stats=stats))
+        assert stats.steps > 0
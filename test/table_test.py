@@ -0,0 +1,131 @@
+import random
+
+from pycolint.parser import (
+    ExpressionType as E,
+    Grammar,
+    Rule,
+    create_grammar,
+    create_parser,
+)
+from pycolint.problem_types import ProblemType as P
+from pycolint.table import (
+    GrammarError,
+    Op,
+    PrebuiltTable,
+    TransitionTable,
+    default_table,
+    generate_default_table,
+    record_actions,
+    run,
+)
+from pycolint.tokenizer import Kind as T, Token, tokenize
+from pycolint.trace import TraceRecorder
+import pytest
+
+
+def random_messages(n: int) -> list[str]:
+    rnd = random.Random(0)
+    parts = ("feat", "fix", "a", "b.c", "(", ")", "!", ":", ": ", " ", "  ", "\n")
+    parts += ("\n\n", ".", "\t", "x y", "BREAKING CHANGE", "scope", "ü", "x:y")
+    return ["".join(rnd.choices(parts, k=rnd.randint(0, 12))) for _ in range(n)]
+
+
+@pytest.fixture(scope="module")
+def table() -> TransitionTable:
+    return TransitionTable(create_grammar())
+
+
+class RecordActionsTest:
+    def test_records_calls_in_order(self):
+        def fn(p):
+            p.add_problem(P.EMPTY_HDR)
+            p.push_token()
+            p.advance()
+
+        actions = record_actions(Rule(None, None, E.HDR, fn))
+        assert ((Op.PROBLEM, P.EMPTY_HDR), (Op.SHIFT, None), (Op.ADVANCE, None)) == (
+            actions
+        )
+
+    def test_reduce_records_lhs_of_rule(self):
+        def fn(p):
+            p.reduce()
+
+        assert ((Op.REDUCE, E.SCOPE),) == record_actions(Rule(None, None, E.SCOPE, fn))
+
+
+class TransitionTableTest:
+    def test_every_reachable_state_has_a_rule(self, table):
+        assert [] == table.stuck
+
+    def test_no_new_dead_rules(self, table):
+        rules = table.grammar.rules
+        dead = {
+            (rules[i].top_of_stack, rules[i].current_token, rules[i].applicable_lhs)
+            for i in table.dead
+        }
+        assert {
+            (E.HDR, T.EOL, E.BDY_MSG_SEP),
+            (E.START, T.EOL, E.DESCR),
+            (E.START, T.EOL, E.MSG),
+            (E.TYPE, T.DIVIDER, E.HDR),
+            (T.EOL, T.EOF, E.HDR),
+            (T.EOL, T.EOF, E.TYPE),
+        } == dead
+
+    def test_report_lists_dead_rules(self, table):
+        report = table.report()
+        assert f"{len(table.dead)} rules never fire" in report
+
+    def test_rejects_value_patterns(self):
+        def fn(p):
+            pass
+
+        rule = Rule(Token(T.WORD, "feat", 1, 1), None, E.MSG, fn)
+        with pytest.raises(GrammarError):
+            TransitionTable(Grammar([rule]))
+
+    def test_detects_shadowed_rule(self):
+        def fn(p):
+            p.reduce()
+
+        rules = [Rule(E.START, None, E.MSG, fn), Rule(E.START, T.WORD, E.MSG, fn)]
+        table = TransitionTable(Grammar(rules))
+        assert (1,) == table.dead
+
+
+class TableDriverTest:
+    def test_finds_same_problems_as_parser(self):
+        grammar = create_grammar()
+        compiled = create_parser(grammar)
+        interpreted = create_parser(grammar, trace=TraceRecorder(maxlen=1))
+        assert [] == [m for m in random_messages(3000) if compiled(m) != interpreted(m)]
+
+
+class PrebuiltTableTest:
+    def test_is_up_to_date(self, table):
+        # regenerate with `python -m pycolint.table --generate`
+        assert table.transitions == default_table().transitions
+
+    def test_generated_source_round_trips(self, table):
+        namespace: dict = {}
+        exec(generate_default_table(), namespace)
+        assert table.transitions == PrebuiltTable(namespace["TRANSITIONS"]).transitions
+
+    def test_generated_source_is_checked_in(self):
+        from pycolint import _default_table
+
+        with open(_default_table.__file__) as f:
+            assert generate_default_table() == f.read()
+
+    def test_resolves_missing_states(self, table):
+        prebuilt = PrebuiltTable(())
+        tokens = [Token(T.WORD, "feat", 1, 1), Token(T.EOF, "", -1, -1)]
+        assert run(table, tokens) == run(prebuilt, tokens)
+
+
+class LazyRunTest:
+    def test_stops_pulling_tokens_after_an_error(self, table):
+        tokens = iter([*tokenize("feat: a\n b\n\nc"), Token(T.EOF, "", -1, -1)])
+        assert [P.ERROR] == [p.type for p in run(table, tokens)]
+        assert T.WORD == next(tokens).kind
@@ -1,4 +1,4 @@
-from pycolint.tokenizer import tokenize, Kind as T, Token
+from pycolint.tokenizer import tokenize, iter_tokens, Kind as T, Token, Tokenizer
 from pytest import fixture
 from collections.abc import Callable
 
@@ -75,3 +75,48 @@ class CommitSummaryTest:
 
     def test_parse_three_newline_as_three_newline_followed_by_eol(self, t):
         assert [T.NL, T.NL, T.NL, T.EOL] == [x.kind for x in t("\n\n\n")]
+
+
+class IterTokensTest:
+    def test_yields_same_tokens_as_tokenize(self):
+        msg = "feat(graphs)!: my  message.\n\nbody text\n"
+        assert tokenize(msg) == list(iter_tokens(msg))
+
+    def test_is_lazy(self):
+        tokens = iter_tokens("feat: a b c")
+        assert Token(T.WORD, "feat", 1, 1) == next(tokens)
+        assert T.DIVIDER == next(tokens).kind
+
+    def test_subclass_compiles_own_tokens(self):
+        class OnlyWords(Tokenizer):
+            tokens = {T.WORD: r"\w+", T.SKIP: r"\W+", T.EOL: r"$"}
+
+        assert [T.WORD, T.SKIP, T.WORD, T.EOL] == [x.kind for x in OnlyWords()("a: b")]
+
+
+class CompactTokenTest:
+    def test_has_no_instance_dict(self):
+        assert not hasattr(Token(T.WORD, "feat", 1, 1), "__dict__")
+
+    def test_interns_header_words(self):
+        tokenizer = Tokenizer(intern=True)
+        first = tokenizer("".join(["fe", "at(sc", "ope): a"]))
+        second = tokenizer("feat(scope): a")
+        assert first[0].value is second[0].value
+        assert first[2].value is second[2].value
+
+    def test_does_not_intern_body(self):
+        tokenizer = Tokenizer(intern=True)
+        body = tokenizer("feat: a\n\n" + "".join(["bo", "dy"]))[-2]
+        assert "body" == body.value
+        assert body.value is not tokenizer("feat: a\n\nbody")[-2].value
+
+    def test_does_not_intern_description(self):
+        tokenizer = Tokenizer(intern=True)
+        descr = tokenizer("feat: " + "".join(["descri", "ption"]))[2]
+        assert "description" == descr.value
+        assert descr.value is not tokenizer("feat: description")[2].value
+
+    def test_interning_does_not_change_tokens(self):
+        msg = "feat(graphs)!: my  message.\n\nbody text\n"
+        assert tokenize(msg) == Tokenizer(intern=True)(msg)
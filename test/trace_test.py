@@ -0,0 +1,34 @@
+from pycolint.parser import ExpressionType as E, create_grammar, create_parser
+from pycolint.tokenizer import Kind as T
+from pycolint.trace import TraceRecorder
+
+
+class TraceRecorderTest:
+    def test_records_every_applied_rule(self):
+        trace = TraceRecorder()
+        create_parser(trace=trace)("feat: msg")
+        assert list(range(len(trace))) == [e.step for e in trace]
+        assert T.WORD == trace.entries[0].token.kind
+        assert E.START == trace.entries[0].top.type
+
+    def test_records_rule_ids_of_grammar(self):
+        grammar = create_grammar()
+        trace = TraceRecorder()
+        create_parser(grammar, trace)("feat: msg")
+        assert all(0 <= e.rule_id < len(grammar.rules) for e in trace)
+
+    def test_records_lhs_snapshot(self):
+        trace = TraceRecorder()
+        create_parser(trace=trace)("feat: msg")
+        assert {E.MSG: 0, E.HDR: 0, E.TYPE: 0} == trace.entries[0].lhs
+
+    def test_keeps_only_last_entries(self):
+        trace = TraceRecorder(maxlen=3)
+        create_parser(trace=trace)("feat: a b c d")
+        assert 3 == len(trace)
+        assert T.EOF == trace.entries[-1].token.kind
+
+    def test_dump_has_one_line_per_entry(self):
+        trace = TraceRecorder()
+        create_parser(trace=trace)("feat: msg")
+        assert len(trace) == len(trace.dump().splitlines())
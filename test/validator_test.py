@@ -0,0 +1,58 @@
+from itertools import product
+
+from pycolint.parser import create_parser
+from pycolint.validator import is_valid_message
+import pytest
+
+
+def corpus() -> list[str]:
+    types = ("feat", " feat", "a b", "BREAKING-CHANGE", "")
+    scopes = ("", "(parser)", "(a b)", "()", "(s", "s)")
+    excl = ("", "!")
+    dividers = (": ", ":", ":  ", " : ", ":\t")
+    descriptions = ("one ü", "a  b", "a\tb", "end.", "", "x ")
+    rests = ("", "\n", "\n\n", "\n\nbody", "\n\n\n\nmy body", "\nbody", "\n\na\nb")
+    return [
+        "".join(parts)
+        for parts in product(types, scopes, excl, dividers, descriptions, rests)
+    ]
+
+
+class IsValidMessageTest:
+    @pytest.mark.parametrize(
+        "msg",
+        [
+            "feat: descr",
+            "feat(s)!: one two",
+            "fix!: msg\n\nmy body",
+            "feat: msg\n\n\n\nmy body",
+        ],
+    )
+    def test_accepts_well_formed_messages(self, msg):
+        assert is_valid_message(msg)
+
+    @pytest.mark.parametrize(
+        "msg",
+        ["", "feat:  double", "feat: msg.", "feat: a\n", "feat: BREAKING CHANGE"],
+    )
+    def test_rejects_messages_with_problems(self, msg):
+        assert not is_valid_message(msg)
+
+
+@pytest.fixture(scope="module")
+def messages() -> list[str]:
+    return corpus()
+
+
+class FastPathTest:
+    def test_valid_messages_have_no_problems(self, messages):
+        parse = create_parser(fast_path=False)
+        assert [] == [m for m in messages if is_valid_message(m) and parse(m) != []]
+
+    def test_fast_path_finds_same_problems_as_parser(self, messages):
+        fast, slow = create_parser(), create_parser(fast_path=False)
+        assert [] == [m for m in messages if fast(m) != slow(m)]
+
+    def test_corpus_contains_valid_and_invalid_messages(self, messages):
+        valid = sum(1 for m in messages if is_valid_message(m))
+        assert 0 < valid < len(messages)